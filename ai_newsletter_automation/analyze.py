@@ -0,0 +1,180 @@
+"""Single-pass HTML analysis — one parse yields everything verify and scrape need."""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+PAYWALL_PHRASES: Iterable[str] = (
+    "subscribe to read",
+    "log in to continue",
+    "isaccessibleforfree\":false",
+    "paywall",
+    "subscriber-only",
+    "subscription required",
+    "already a subscriber",
+)
+
+SOFT_404_PHRASES: Iterable[str] = (
+    "page not found",
+    "404 not found",
+    "this page doesn't exist",
+    "this page does not exist",
+    "no longer available",
+    "has been removed",
+    "content unavailable",
+    "error 404",
+    "we couldn't find",
+    "we can't find",
+)
+
+MIN_CONTENT_LENGTH = 200  # chars — reject stub / error pages
+
+VERIFY_SAMPLE_CHARS = 100_000  # phrase checks only look at the head of the page
+MAX_TEXT_CHARS = 20_000  # keep scraped text reasonably bounded for LLM cost
+
+_STRIP_TAGS = ["script", "style", "noscript", "header", "footer", "aside"]
+
+_DATE_META_SELECTORS = (
+    # <meta property="article:published_time" content="...">
+    # <meta name="pubdate" content="...">
+    # <meta name="date" content="...">
+    {"property": "article:published_time"},
+    {"name": "pubdate"},
+    {"name": "date"},
+    {"name": "DC.date.issued"},
+    {"name": "sailthru.date"},
+)
+
+_JSONLD_DATE_RE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+
+# Parser backends in order of preference. lxml is C-backed and several times
+# faster than the pure-Python html.parser; the first installed one wins.
+# Set HTML_PARSER to force a specific backend.
+PARSER_BACKENDS: Tuple[str, ...] = ("lxml", "html.parser")
+
+
+def available_parsers() -> Tuple[str, ...]:
+    return tuple(name for name in PARSER_BACKENDS if builder_registry.lookup(name) is not None)
+
+
+def _select_parser() -> str:
+    forced = os.getenv("HTML_PARSER")
+    if forced and builder_registry.lookup(forced) is not None:
+        return forced
+    return available_parsers()[0]
+
+
+PARSER = _select_parser()
+
+
+def make_soup(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse *html* with the preferred backend (or an explicit *parser*)."""
+    return BeautifulSoup(html, parser or PARSER)
+
+
+def is_paywalled(html: str) -> bool:
+    haystack = html.lower()
+    return any(phrase in haystack for phrase in PAYWALL_PHRASES)
+
+
+def is_soft_404(html: str) -> bool:
+    """Detect pages that return HTTP 200 but are actually error / not-found pages."""
+    haystack = html[:20_000].lower()
+    return any(phrase in haystack for phrase in SOFT_404_PHRASES)
+
+
+@dataclass
+class PageAnalysis:
+    html: str
+    text: str  # cleaned article text (scripts, nav chrome stripped), uncapped
+    body_text_length: int  # visible text length before stripping, used for the stub check
+    published_date: Optional[str] = None
+    paywalled: bool = False
+    soft_404: bool = False
+    jsonld_present: bool = False
+    jsonld_not_free: bool = False  # JSON-LD declares isAccessibleForFree: false
+
+    @property
+    def rejection_reason(self) -> Optional[str]:
+        """Why verify_link would drop this page, or ``None`` if it passes."""
+        if self.body_text_length < MIN_CONTENT_LENGTH:
+            return "too_short"
+        if self.soft_404:
+            return "soft_404"
+        if self.paywalled:
+            return "paywall"
+        if self.jsonld_not_free:
+            return "jsonld_paywall"
+        return None
+
+    @property
+    def ok(self) -> bool:
+        return self.rejection_reason is None
+
+    @property
+    def scraped_text(self) -> str:
+        return self.text[:MAX_TEXT_CHARS]
+
+
+def clean_text(soup: BeautifulSoup) -> str:
+    for tag in soup(_STRIP_TAGS):
+        tag.decompose()
+    text = soup.get_text(separator="\n")
+    # Collapse whitespace
+    text = re.sub(r"\s+\n", "\n", text)
+    text = re.sub(r"\n{2,}", "\n\n", text)
+    return text.strip()
+
+
+def _find_date(soup: BeautifulSoup, jsonld_blobs: Iterable[str]) -> Optional[str]:
+    # 1. Try standard meta tags
+    for selector in _DATE_META_SELECTORS:
+        tag = soup.find("meta", attrs=selector)
+        if tag and tag.get("content"):
+            return tag["content"]
+
+    # 2. Try JSON-LD — simplistic regex (safer than json.load on arbitrary web junk)
+    for data in jsonld_blobs:
+        match = _JSONLD_DATE_RE.search(data)
+        if match:
+            return match.group(1)
+
+    # 3. Try <time> tag
+    time_tag = soup.find("time")
+    if time_tag:
+        if time_tag.get("datetime"):
+            return time_tag["datetime"]
+        if time_tag.get("content"):
+            return time_tag["content"]
+    return None
+
+
+def analyze_html(html: str, parser: Optional[str] = None) -> PageAnalysis:
+    """Parse *html* once and derive text, date and paywall / soft-404 verdicts."""
+    sample = html[:VERIFY_SAMPLE_CHARS]
+    soup = make_soup(html, parser)
+
+    jsonld_blobs = [s.string for s in soup.find_all("script", type="application/ld+json") if s.string]
+    jsonld_not_free = any(
+        "isAccessibleForFree" in blob and '"isaccessibleforfree": false' in blob.lower()
+        for blob in jsonld_blobs
+    )
+
+    # Metadata and the stub check must run before scripts and chrome are stripped
+    published_date = _find_date(soup, jsonld_blobs)
+    body_text_length = len(soup.get_text(separator=" ", strip=True))
+
+    return PageAnalysis(
+        html=html,
+        text=clean_text(soup),
+        body_text_length=body_text_length,
+        published_date=published_date,
+        paywalled=is_paywalled(sample),
+        soft_404=is_soft_404(sample),
+        jsonld_present=bool(jsonld_blobs),
+        jsonld_not_free=jsonld_not_free,
+    )
@@ -0,0 +1,291 @@
+"""On-disk caches — hashed JSON entries with TTL, LRU size eviction and HTTP revalidation."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from .analyze import PageAnalysis
+
+log = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.getenv("PAGE_CACHE", "1") != "0"  # also governs the feed cache
+PAGE_CACHE_TTL_SECONDS = int(os.getenv("PAGE_CACHE_TTL_HOURS", "72")) * 3600
+PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+# Feeds: entries younger than this are served without a request; older ones are
+# revalidated with a conditional GET (a 304 costs a few hundred bytes)
+FEED_CACHE_FRESH_SECONDS = int(os.getenv("FEED_CACHE_FRESH_MINUTES", "15")) * 60
+FEED_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Hacker News items: title/url/time are effectively immutable once posted
+HN_ITEM_CACHE_TTL_SECONDS = int(os.getenv("HN_ITEM_CACHE_TTL_HOURS", "168")) * 3600
+HN_ITEM_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+_EVICT_TARGET = 0.9  # evict down to 90% of the size cap so we don't evict on every write
+
+
+def _get_cache_root() -> Path:
+    """Cache directory — tries the project root first, falls back to /tmp (Vercel)."""
+    try:
+        from .config import get_settings
+        p = get_settings().project_root / "cache"
+        p.mkdir(parents=True, exist_ok=True)
+        return p
+    except Exception:
+        p = Path("/tmp") / "cache"
+        p.mkdir(parents=True, exist_ok=True)
+        return p
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL: lowercase scheme/host, no fragment or default port, sorted query."""
+    try:
+        parsed = urlparse(url.strip())
+        host = (parsed.hostname or "").lower()
+        port = parsed.port
+        if port and not ((parsed.scheme == "http" and port == 80) or (parsed.scheme == "https" and port == 443)):
+            host = f"{host}:{port}"
+        query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+        return urlunparse((parsed.scheme.lower(), host, parsed.path or "/", "", query, ""))
+    except ValueError:
+        return url
+
+
+class DiskCache:
+    """Key → JSON value store under one directory.
+
+    Entries are files named by the SHA-256 of their key. Reads bump the
+    file's mtime so eviction (oldest mtime first) approximates LRU.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int, max_bytes: int, directory: Optional[Path] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.directory = directory or (_get_cache_root() / name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def get_entry(self, key: str) -> Optional[dict]:
+        """Return ``{"stored_at", "value"}`` regardless of age, or ``None``."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # LRU bookkeeping
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl_seconds
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value if present and within TTL."""
+        entry = self.get_entry(key)
+        if entry is None or not self.is_fresh(entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["value"]
+
+    def set(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        payload = json.dumps({"stored_at": time.time(), "value": value})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(path)  # atomic — readers never see a half-written entry
+        except OSError:
+            log.warning("Could not write cache entry to %s", path)
+            return
+        self._account(len(payload.encode("utf-8")) - old_size)
+
+    def touch(self, key: str) -> None:
+        """Reset an entry's age without changing its value (after a 304)."""
+        entry = self.get_entry(key)
+        if entry is not None:
+            self.set(key, entry["value"])
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _scan(self):
+        return [p for p in self.directory.glob("*/*.json") if p.is_file()]
+
+    def _account(self, delta: int) -> None:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(p.stat().st_size for p in self._scan())
+            else:
+                self._size += delta
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = []
+        for p in self._scan():
+            try:
+                st = p.stat()
+                files.append((st.st_mtime, st.st_size, p))
+            except OSError:
+                continue
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * _EVICT_TARGET
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                continue
+        self._size = total
+
+
+# ── Page cache (verify_link / scrape) ──
+
+
+@dataclass
+class CachedPage:
+    url: str
+    html: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    analysis: Optional[Dict] = None  # PageAnalysis fields minus html, once analysed
+    fresh: bool = True
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional-GET headers for revalidating a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def page_analysis(self) -> Optional[PageAnalysis]:
+        if self.analysis is None:
+            return None
+        return PageAnalysis(html=self.html, **self.analysis)
+
+
+class PageCache:
+    """Fetched HTML plus its derived analysis, keyed by normalized URL."""
+
+    def __init__(self, store: DiskCache):
+        self.store = store
+
+    def lookup(self, url: str) -> Optional[CachedPage]:
+        entry = self.store.get_entry(normalize_url(url))
+        if entry is None:
+            self.store.misses += 1
+            return None
+        fresh = self.store.is_fresh(entry)
+        if fresh:
+            self.store.hits += 1
+        else:
+            self.store.misses += 1
+        return CachedPage(fresh=fresh, **entry["value"])
+
+    def store_page(
+        self,
+        url: str,
+        html: str,
+        headers=None,
+        analysis: Optional[PageAnalysis] = None,
+    ) -> None:
+        fields = None
+        if analysis is not None:
+            fields = asdict(analysis)
+            del fields["html"]  # stored once, alongside
+        headers = headers or {}
+        self.store.set(normalize_url(url), {
+            "url": url,
+            "html": html,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "analysis": fields,
+        })
+
+    def revalidated(self, url: str) -> None:
+        self.store.touch(normalize_url(url))
+
+
+_PAGE_CACHE: Optional[PageCache] = None
+_PAGE_CACHE_LOCK = threading.Lock()
+_FEED_CACHE: Optional[DiskCache] = None
+_HN_ITEM_CACHE: Optional[DiskCache] = None
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """Process-wide page cache, or ``None`` when disabled via PAGE_CACHE=0."""
+    global _PAGE_CACHE
+    if not CACHE_ENABLED:
+        return None
+    if _PAGE_CACHE is None:
+        with _PAGE_CACHE_LOCK:
+            if _PAGE_CACHE is None:
+                _PAGE_CACHE = PageCache(DiskCache("pages", PAGE_CACHE_TTL_SECONDS, PAGE_CACHE_MAX_BYTES))
+    return _PAGE_CACHE
+
+
+def set_page_cache(cache: Optional[PageCache]) -> None:
+    """Swap the process-wide page cache (tests point it at a temp directory)."""
+    global _PAGE_CACHE
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE = cache
+
+
+def get_feed_cache() -> Optional[DiskCache]:
+    """Process-wide RSS/Atom cache (validators + parsed entries), ``None`` when disabled."""
+    global _FEED_CACHE
+    if not CACHE_ENABLED:
+        return None
+    if _FEED_CACHE is None:
+        with _PAGE_CACHE_LOCK:
+            if _FEED_CACHE is None:
+                _FEED_CACHE = DiskCache("feeds", FEED_CACHE_FRESH_SECONDS, FEED_CACHE_MAX_BYTES)
+    return _FEED_CACHE
+
+
+def set_feed_cache(cache: Optional[DiskCache]) -> None:
+    global _FEED_CACHE
+    with _PAGE_CACHE_LOCK:
+        _FEED_CACHE = cache
+
+
+def get_hn_item_cache() -> Optional[DiskCache]:
+    """Process-wide Hacker News item cache keyed by story id, ``None`` when disabled."""
+    global _HN_ITEM_CACHE
+    if not CACHE_ENABLED:
+        return None
+    if _HN_ITEM_CACHE is None:
+        with _PAGE_CACHE_LOCK:
+            if _HN_ITEM_CACHE is None:
+                _HN_ITEM_CACHE = DiskCache("hn_items", HN_ITEM_CACHE_TTL_SECONDS, HN_ITEM_CACHE_MAX_BYTES)
+    return _HN_ITEM_CACHE
+
+
+def set_hn_item_cache(cache: Optional[DiskCache]) -> None:
+    global _HN_ITEM_CACHE
+    with _PAGE_CACHE_LOCK:
+        _HN_ITEM_CACHE = cache
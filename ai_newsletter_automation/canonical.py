@@ -0,0 +1,164 @@
+"""Pre-fetch canonicalization — collapse URL variants and near-identical titles before verification.
+
+The same story reaches us through Google Alerts redirect wrappers, AMP and
+mobile mirrors and links decorated with tracking parameters. Collapsing
+those before ``process_hits`` means the verification budget is spent on
+distinct stories instead of fetching each copy in full.
+"""
+
+import logging
+import re
+from collections import defaultdict
+from dataclasses import replace
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, parse_qsl, unquote, urlencode, urlparse, urlunparse
+
+from .minhash import TITLE_SHINGLE, bands, shingles, signature
+from .models import ArticleHit
+
+log = logging.getLogger(__name__)
+
+# Query parameters that only track the click, never select the content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "referrer", "cmpid", "ocid", "sr_share", "smid",
+    "guccounter", "guce_referrer", "guce_referrer_sig", "_ga", "_gl", "spm",
+    "amp", "outputtype", "__twitter_impression", "taid", "at_medium", "at_campaign",
+}
+TRACKING_PREFIXES = ("utm_", "mkt_", "pk_", "hsa_")
+
+# Host prefixes that mirror the desktop site (compared after lowercasing)
+MIRROR_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+# Titles this similar after normalization are treated as the same story
+TITLE_SIMILARITY = 0.9
+
+_AMP_CACHE_SUFFIX = ".cdn.ampproject.org"
+# A bare /amp (or /amp.html) segment is only stripped below a parent path:
+# https://site.com/amp must not become the homepage
+_AMP_PATH = re.compile(r"((?<=[^/])/amp/?$|\.amp(?=\.html?$)|\.amp$|(?<=[^/])/amp\.html?$)", re.IGNORECASE)
+_TITLE_SUFFIX = re.compile(r"\s+[|\-–—]\s+[^|\-–—]{2,40}$")
+_NON_WORD = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+
+def _unwrap(url: str) -> str:
+    """Follow Google redirect wrappers and AMP-cache URLs to the publisher URL."""
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    if host.endswith("google.com") and parsed.path == "/url":
+        params = parse_qs(parsed.query)
+        real = params.get("url") or params.get("q")
+        if real:
+            return unquote(real[0])
+    if host.endswith(_AMP_CACHE_SUFFIX):
+        # https://www-example-com.cdn.ampproject.org/c/s/www.example.com/path
+        parts = parsed.path.split("/")
+        if len(parts) > 3 and parts[1] in ("c", "v"):
+            secure = parts[2] == "s"
+            rest = parts[3:] if secure else parts[2:]
+            return ("https://" if secure else "http://") + "/".join(rest)
+    return url
+
+
+def clean_url(url: str) -> str:
+    """The fetchable form of *url*: unwrapped, de-AMPed, without tracking parameters or fragment."""
+    if not url:
+        return url
+    try:
+        parsed = urlparse(_unwrap(url.strip()))
+        if not parsed.scheme or not parsed.netloc:
+            return url
+        path = _AMP_PATH.sub("", parsed.path) or "/"
+        query = [
+            (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+            if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+        ]
+        return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, "", urlencode(query), ""))
+    except ValueError:
+        return url
+
+
+def canonical_key(url: str) -> str:
+    """Identity of a story URL: :func:`clean_url` minus scheme, mirror host prefixes and trailing slash."""
+    parsed = urlparse(clean_url(url))
+    host = parsed.hostname or ""
+    for prefix in MIRROR_HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return f"{host}{parsed.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+
+def title_key(title: str) -> str:
+    """Lowercased title without the trailing " - Publisher" suffix or punctuation."""
+    title = _TITLE_SUFFIX.sub("", (title or "").strip())
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", title.lower())).strip()
+
+
+def _similar(a: str, b: str, threshold: float) -> bool:
+    """``_title_similarity(a, b) >= threshold`` for lowercased keys, cheapest upper bounds first."""
+    # Length bound on SequenceMatcher.ratio() — skips most pairs without matching
+    if 2 * min(len(a), len(b)) / (len(a) + len(b)) < threshold:
+        return False
+    matcher = SequenceMatcher(None, a, b)
+    return matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
+
+
+def _merge(kept: ArticleHit, dupe: ArticleHit) -> ArticleHit:
+    """Fill gaps in the kept hit from its duplicate (a date, a longer snippet)."""
+    updates = {}
+    if not kept.published and dupe.published:
+        updates["published"] = dupe.published
+    if len(dupe.snippet or "") > len(kept.snippet or ""):
+        updates["snippet"] = dupe.snippet
+    return replace(kept, **updates) if updates else kept
+
+
+def canonicalize_hits(hits: List[ArticleHit], title_threshold: float = TITLE_SIMILARITY) -> List[ArticleHit]:
+    """Clean every hit's URL and drop duplicate stories, keeping the first (highest-ranked) copy.
+
+    Two hits are the same story when their :func:`canonical_key` matches or
+    their normalized titles are at least *title_threshold* similar. Titles
+    are only compared when they share a MinHash/LSH band (see ``minhash``), so
+    the pool is scanned in near-linear time.
+    """
+    kept: List[ArticleHit] = []
+    by_url: Dict[str, int] = {}
+    by_title: Dict[str, int] = {}
+    titles: List[str] = []
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)  # LSH band -> kept indices
+
+    for hit in hits:
+        hit = replace(hit, url=clean_url(hit.url))
+        url_key = canonical_key(hit.url) if hit.url else ""
+        t_key = title_key(hit.title)
+        sig = signature(shingles(t_key, TITLE_SHINGLE)) if t_key else None
+        hit_bands = bands(sig) if sig is not None else []
+
+        match: Optional[int] = by_url.get(url_key) if url_key else None
+        if match is None and t_key:
+            match = by_title.get(t_key)
+            if match is None:
+                candidates = sorted({i for key in hit_bands for i in buckets.get(key, ())})
+                match = next((i for i in candidates if _similar(t_key, titles[i], title_threshold)), None)
+
+        if match is not None:
+            kept[match] = _merge(kept[match], hit)
+            continue
+
+        index = len(kept)
+        kept.append(hit)
+        titles.append(t_key)
+        for key in hit_bands:
+            buckets[key].append(index)
+        if url_key:
+            by_url[url_key] = index
+        if t_key:
+            by_title[t_key] = index
+
+    if len(kept) < len(hits):
+        log.info("Canonicalized %d → %d hits before verification", len(hits), len(kept))
+    return kept
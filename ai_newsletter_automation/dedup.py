@@ -1,15 +1,69 @@
-"""Semantic deduplication — removes near-duplicate articles covering the same story."""
+"""Semantic deduplication — removes near-duplicate articles covering the same story.
+
+Three methods share the same greedy clustering: walk articles in order, and
+each article not yet in a cluster pulls in every later unassigned article
+similar to it. They differ in what "similar" means, so their results are
+close but not identical:
+
+* ``pairwise`` compares every pair of titles with SequenceMatcher — the
+  reference, but O(n²) Python calls (~65s for 1,000 articles).
+* ``vectorized`` turns titles into character bigram TF-IDF vectors and gets
+  every pairwise cosine from one matrix product (needs NumPy; memory grows
+  with n², so it is meant for moderate batches). The cosine decides on its
+  own against a threshold calibrated to SequenceMatcher's: on bench_dedup
+  pools it keeps within 2% as many articles as ``pairwise`` (~0.15s for
+  1,000 articles). Cosine ignores word order, so titles that reuse the same
+  words in another order merge more readily than under SequenceMatcher.
+* ``minhash`` compares shingle sets of the title (and of a content prefix, to
+  catch syndicated copies under rewritten headlines). A MinHash/LSH index
+  proposes candidate pairs so the work stays near-linear, and each candidate
+  is confirmed with the exact Dice similarity, against its own calibrated
+  threshold. On titles alone it keeps within 3% of ``pairwise``; the content
+  check then merges syndicated copies the title methods cannot see, so it
+  keeps fewer articles overall (745 vs 834 of 1,000 on bench_dedup).
+"""
 
 import logging
+import re
+from collections import defaultdict
 from difflib import SequenceMatcher
-from typing import List
+from typing import Callable, Dict, List, Optional, Sequence
 
+from .minhash import TITLE_SHINGLE, dice, lsh_candidates, shingles, signature, stable_hash
 from .models import VerifiedArticle
 
+try:
+    import numpy as np
+except ImportError:  # optional — without it "auto" skips the vectorized method
+    np = None
+
 log = logging.getLogger(__name__)
 
 # Articles with title similarity above this threshold are considered duplicates
 _SIMILARITY_THRESHOLD = 0.6
+# Content prefixes this similar mark a syndicated copy even if the headline was rewritten
+_CONTENT_SIMILARITY_THRESHOLD = 0.8
+
+CONTENT_PREFIX_CHARS = 300
+PAIRWISE_MAX_ARTICLES = 100  # "auto" uses SequenceMatcher up to this many articles,
+VECTORIZED_MAX_ARTICLES = 2000  # then the NumPy matrix (if installed) up to this, then MinHash
+
+_CONTENT_SHINGLE = 5  # characters
+_MIN_CONTENT_CHARS = 80  # shorter contents (snippet fallbacks) are not compared
+
+_TFIDF_NGRAM = 2  # characters
+_TFIDF_DIMENSIONS = 1 << 12  # n-grams are hashed into this many columns
+# Title similarities equivalent to _SIMILARITY_THRESHOLD, calibrated on
+# bench_dedup pools (100–1,000 articles): vectorized keeps within 2% and
+# title-only minhash within 3% as many articles as SequenceMatcher. Other
+# thresholds are scaled proportionally
+_TFIDF_COSINE_THRESHOLD = 0.56
+_TITLE_DICE_THRESHOLD = 0.53
+
+# LSH (see minhash) proposes a pair at the Dice 0.53 edge (Jaccard 0.36) ~54%
+# of the time and one at Dice 0.75 ~97%; the exact Dice then confirms it
+
+_SPACES = re.compile(r"\s+")
 
 
 def _title_similarity(a: str, b: str) -> float:
@@ -22,34 +76,147 @@ def _best_article(group: List[VerifiedArticle]) -> VerifiedArticle:
     return max(group, key=lambda a: len(a.content or ""))
 
 
-def deduplicate(
-    articles: List[VerifiedArticle],
-    threshold: float = _SIMILARITY_THRESHOLD,
-) -> List[VerifiedArticle]:
-    """Remove near-duplicate articles, keeping the highest-quality version.
+# ── Clustering ──
 
-    Uses title similarity via SequenceMatcher (no API calls needed).
-    Preserves original ordering of the kept articles.
-    """
-    if len(articles) <= 1:
-        return articles
 
-    # Build clusters of similar articles
+def _cluster(
+    count: int,
+    similar: Callable[[int, int], bool],
+    candidates: Optional[Dict[int, set]] = None,
+) -> List[List[int]]:
+    """Greedy leader clustering in input order; *candidates* restricts which pairs are compared."""
     clusters: List[List[int]] = []  # each cluster is a list of indices
     assigned: set = set()
 
-    for i in range(len(articles)):
+    for i in range(count):
         if i in assigned:
             continue
         cluster = [i]
         assigned.add(i)
-        for j in range(i + 1, len(articles)):
+        others = range(i + 1, count) if candidates is None else sorted(candidates.get(i, ()))
+        for j in others:
             if j in assigned:
                 continue
-            if _title_similarity(articles[i].title, articles[j].title) >= threshold:
+            if similar(i, j):
                 cluster.append(j)
                 assigned.add(j)
         clusters.append(cluster)
+    return clusters
+
+
+def _pairwise_clusters(articles: List[VerifiedArticle], threshold: float) -> List[List[int]]:
+    return _cluster(
+        len(articles),
+        lambda i, j: _title_similarity(articles[i].title, articles[j].title) >= threshold,
+    )
+
+
+def _tfidf_matrix(titles: Sequence[str]) -> "np.ndarray":
+    """L2-normalized character n-gram TF-IDF rows (hashed features), one per title."""
+    counts = np.zeros((len(titles), _TFIDF_DIMENSIONS), dtype=np.float32)
+    for row, title in enumerate(titles):
+        text = f" {_SPACES.sub(' ', (title or '').lower()).strip()} "
+        grams = [
+            stable_hash(text[i:i + _TFIDF_NGRAM]) % _TFIDF_DIMENSIONS
+            for i in range(len(text) - _TFIDF_NGRAM + 1)
+        ]
+        if grams:
+            counts[row] = np.bincount(grams, minlength=_TFIDF_DIMENSIONS)
+    df = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(titles)) / (1 + df)) + 1  # smoothed, as in scikit-learn
+    weights = counts * idf.astype(np.float32)
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return weights / norms
+
+
+def _vectorized_clusters(articles: List[VerifiedArticle], threshold: float) -> List[List[int]]:
+    titles = [a.title for a in articles]
+    vectors = _tfidf_matrix(titles)
+    similarity = vectors @ vectors.T  # all pairwise cosines in one product
+    # SequenceMatcher's ratio is at most 2·min(len)/(len_a + len_b); cosine
+    # alone would match a short title to any longer one containing it
+    lengths = np.array([len(t) for t in titles], dtype=np.float32)
+    length_bound = 2 * np.minimum.outer(lengths, lengths) / np.maximum(np.add.outer(lengths, lengths), 1)
+    cosine = threshold * _TFIDF_COSINE_THRESHOLD / _SIMILARITY_THRESHOLD
+    # Only the upper triangle matters: the clustering looks at later articles
+    rows, cols = np.nonzero(np.triu((similarity >= cosine) & (length_bound >= threshold), k=1))
+    candidates: Dict[int, set] = defaultdict(set)
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        candidates[i].add(j)
+    return _cluster(len(articles), lambda i, j: True, candidates)  # every candidate is a match
+
+
+def _minhash_clusters(
+    articles: List[VerifiedArticle],
+    threshold: float,
+    content_threshold: float,
+) -> List[List[int]]:
+    titles = [shingles(a.title, TITLE_SHINGLE) for a in articles]
+    contents = [
+        shingles(a.content[:CONTENT_PREFIX_CHARS], _CONTENT_SHINGLE)
+        if len(a.content or "") >= _MIN_CONTENT_CHARS else frozenset()
+        for a in articles
+    ]
+
+    title_candidates = lsh_candidates([signature(s) for s in titles])
+    content_candidates = lsh_candidates([signature(s) for s in contents])
+    candidates: Dict[int, set] = defaultdict(set)
+    for source in (title_candidates, content_candidates):
+        for i, later in source.items():
+            candidates[i].update(later)
+
+    title_dice = threshold * _TITLE_DICE_THRESHOLD / _SIMILARITY_THRESHOLD
+
+    def similar(i: int, j: int) -> bool:
+        # Only confirm the similarity whose index proposed the pair
+        if j in title_candidates.get(i, ()) and dice(titles[i], titles[j]) >= title_dice:
+            return True
+        return j in content_candidates.get(i, ()) and dice(contents[i], contents[j]) >= content_threshold
+
+    return _cluster(len(articles), similar, candidates)
+
+
+def deduplicate(
+    articles: List[VerifiedArticle],
+    threshold: float = _SIMILARITY_THRESHOLD,
+    method: str = "auto",
+    content_threshold: float = _CONTENT_SIMILARITY_THRESHOLD,
+) -> List[VerifiedArticle]:
+    """Remove near-duplicate articles, keeping the highest-quality version.
+
+    *method* is ``"pairwise"`` (SequenceMatcher on titles), ``"vectorized"``
+    (TF-IDF cosine of titles, needs NumPy), ``"minhash"`` (shingle
+    similarity of titles or content prefixes via an LSH index) or ``"auto"``,
+    which picks by pool size: pairwise up to PAIRWISE_MAX_ARTICLES,
+    vectorized up to VECTORIZED_MAX_ARTICLES when NumPy is installed, then
+    minhash. *threshold* is a SequenceMatcher ratio; vectorized and minhash
+    scale it to their calibrated cosine / Dice equivalents, so their title
+    clusters approximate pairwise's rather than reproduce them (see the
+    module docstring). *content_threshold* applies to content prefixes
+    (minhash only), which also merges syndicated copies pairwise keeps apart.
+    No API calls needed. Preserves original ordering of the kept articles.
+    """
+    if len(articles) <= 1:
+        return articles
+
+    if method == "auto":
+        if len(articles) <= PAIRWISE_MAX_ARTICLES:
+            method = "pairwise"
+        elif np is not None and len(articles) <= VECTORIZED_MAX_ARTICLES:
+            method = "vectorized"
+        else:
+            method = "minhash"
+    if method == "pairwise":
+        clusters = _pairwise_clusters(articles, threshold)
+    elif method == "vectorized":
+        if np is None:
+            raise RuntimeError("dedup method 'vectorized' requires numpy")
+        clusters = _vectorized_clusters(articles, threshold)
+    elif method == "minhash":
+        clusters = _minhash_clusters(articles, threshold, content_threshold)
+    else:
+        raise ValueError(f"Unknown dedup method: {method}")
 
     # Pick the best article from each cluster, preserving order
     result: List[VerifiedArticle] = []
@@ -61,5 +228,5 @@ def deduplicate(
             dupes = [articles[idx].title for idx in cluster if articles[idx] != best]
             log.info("Dedup: kept '%s', removed %d duplicates: %s", best.title, len(dupes), dupes)
 
-    log.info("Deduplicated %d → %d articles", len(articles), len(result))
+    log.info("Deduplicated %d → %d articles (%s)", len(articles), len(result), method)
     return result
@@ -0,0 +1,115 @@
+"""Source fan-out — run a collector's upstreams concurrently with per-source deadlines.
+
+A collector's latency becomes that of its slowest *on-time* source instead of
+the sum of all of them. Sources that miss their deadline are dropped (their
+thread finishes in the background and the result is discarded) so one slow
+feed can no longer hold up a section.
+"""
+
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FANOUT_WORKERS = int(os.getenv("FANOUT_WORKERS", "32"))
+FEED_WORKERS = int(os.getenv("FEED_WORKERS", "32"))
+SOURCE_TIMEOUT = float(os.getenv("SOURCE_TIMEOUT", "25"))  # seconds per collector source
+FEED_TIMEOUT = float(os.getenv("FEED_TIMEOUT", "12"))  # seconds per individual RSS feed
+
+# Collector sources and the RSS feeds they fan out to get separate pools: a
+# source blocked on its feeds would otherwise hold a worker the feeds queue for
+_POOL_SIZES = {"sources": FANOUT_WORKERS, "feeds": FEED_WORKERS}
+_EXECUTORS: Dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+_EXECUTOR_LOCK = threading.Lock()
+
+_REPORTS: List["SourceReport"] = []
+_REPORTS_LOCK = threading.Lock()
+
+
+@dataclass
+class SourceReport:
+    name: str
+    seconds: float
+    status: str  # "ok", "error" or "timeout"
+
+
+def _get_executor(pool: str = "sources") -> concurrent.futures.ThreadPoolExecutor:
+    # Shared and never shut down: a dropped source must not block its caller
+    # the way leaving a ``with ThreadPoolExecutor`` block would.
+    executor = _EXECUTORS.get(pool)
+    if executor is None:
+        with _EXECUTOR_LOCK:
+            executor = _EXECUTORS.get(pool)
+            if executor is None:
+                executor = _EXECUTORS[pool] = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_POOL_SIZES[pool], thread_name_prefix=f"fanout-{pool}"
+                )
+    return executor
+
+
+def _record(report: SourceReport) -> None:
+    with _REPORTS_LOCK:
+        _REPORTS.append(report)
+    log.info("source %s: %s in %.2fs", report.name, report.status, report.seconds)
+
+
+def fan_out(
+    sources: Dict[str, Callable[[], T]],
+    timeout: float = SOURCE_TIMEOUT,
+    pool: str = "sources",
+) -> Dict[str, T]:
+    """Call every source concurrently and return the on-time results.
+
+    The returned dict preserves the order of *sources*; sources that raised
+    or missed the *timeout* are missing from it. Every source's latency is
+    recorded for :func:`latency_report`. *pool* is ``"sources"`` for
+    collector sources or ``"feeds"`` for the feeds a source fans out to, so
+    nested calls never wait on their own caller's workers.
+    """
+    executor = _get_executor(pool)
+    started: Dict[str, float] = {}
+    finished: Dict[str, float] = {}
+
+    def timed(name: str, fn: Callable[[], T]) -> T:
+        started[name] = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            finished[name] = time.perf_counter()
+
+    start = time.perf_counter()
+    futures = {name: executor.submit(timed, name, fn) for name, fn in sources.items()}
+    concurrent.futures.wait(futures.values(), timeout=timeout)
+
+    results: Dict[str, T] = {}
+    for name, future in futures.items():
+        if not future.done():
+            future.cancel()  # no-op if already running — the result is simply ignored
+            _record(SourceReport(name, time.perf_counter() - start, "timeout"))
+            continue
+        seconds = finished.get(name, time.perf_counter()) - started.get(name, start)
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            log.warning("source %s failed: %s", name, e)
+            _record(SourceReport(name, seconds, "error"))
+            continue
+        _record(SourceReport(name, seconds, "ok"))
+    return results
+
+
+def latency_report() -> List[SourceReport]:
+    with _REPORTS_LOCK:
+        return list(_REPORTS)
+
+
+def reset_latency_report() -> None:
+    with _REPORTS_LOCK:
+        _REPORTS.clear()
@@ -0,0 +1,232 @@
+"""Asyncio fetch engine — one event loop drives every page fetch in the process.
+
+Section threads (CLI) and Vercel handlers stay synchronous: they hand
+coroutines to the engine's background loop and block on the result. All
+of them share one global concurrency limit plus a per-host limit, so four
+sections verifying in parallel can no longer open 40 unbounded sockets.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, Dict, Iterable, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+import httpx
+
+from .http_client import DEFAULT_HEADERS
+
+T = TypeVar("T")
+
+MAX_CONCURRENCY = int(os.getenv("FETCH_MAX_CONCURRENCY", "64"))  # in-flight requests, all sections
+MAX_PER_HOST = int(os.getenv("FETCH_MAX_PER_HOST", "4"))  # in-flight requests per hostname
+MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", "500000"))  # stop reading a body after this many bytes
+# Bodies advertising a larger Content-Length are rejected before any byte is read
+MAX_CONTENT_LENGTH = int(os.getenv("FETCH_MAX_CONTENT_LENGTH", "5000000"))
+
+
+@dataclass
+class FetchResponse:
+    url: str
+    status_code: int
+    headers: httpx.Headers
+    text: str
+    redirects: int = 0
+    truncated: bool = False  # body was cut at the byte budget
+
+
+def _decode(body: bytes, encoding: Optional[str]) -> str:
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:  # bogus charset in the Content-Type header
+        return body.decode("utf-8", errors="replace")
+
+
+class FetchEngine:
+    """Owns a background event loop, a pooled ``httpx.AsyncClient`` and the limits."""
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_per_host: int = MAX_PER_HOST,
+        max_bytes: int = MAX_BYTES,
+        max_content_length: int = MAX_CONTENT_LENGTH,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.max_bytes = max_bytes
+        self.max_content_length = max_content_length
+        self._transport = transport
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._start_lock = threading.Lock()
+        self._stats = self._empty_stats()
+
+    # ── Per-run counters ──
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"responses": 0, "bytes_on_wire": 0, "truncated": 0, "rejected_early": 0}
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        self._stats = self._empty_stats()
+
+    # ── Loop management ──
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="fetch-engine", daemon=True)
+                thread.start()
+                self._thread = thread
+                self._loop = loop
+        return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run *coro* on the engine loop and block the calling thread until it finishes."""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        if self._client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result(timeout=5)
+            except Exception:
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._global_sem = None
+        self._host_sems = {}
+
+    # ── Fetching (must run on the engine loop) ──
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _host_sem(self, url: str) -> asyncio.Semaphore:
+        host = (urlparse(url).hostname or "").lower()
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(self.max_per_host)
+        return sem
+
+    def _reject_before_body(
+        self, resp: httpx.Response, content_types: Optional[Iterable[str]]
+    ) -> bool:
+        if not resp.is_success:
+            return True
+        if content_types:
+            content_type = resp.headers.get("Content-Type", "")
+            if not any(ct in content_type for ct in content_types):
+                return True
+        try:
+            declared = int(resp.headers.get("Content-Length", "0"))
+        except ValueError:
+            declared = 0
+        return declared > self.max_content_length
+
+    async def _read_capped(self, resp: httpx.Response, max_bytes: int) -> Tuple[bytes, bool]:
+        chunks = []
+        size = 0
+        async for chunk in resp.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if max_bytes and size >= max_bytes:
+                # Leaving the stream context drops the rest of the body unread
+                return b"".join(chunks)[:max_bytes], True
+        return b"".join(chunks), False
+
+    async def fetch(
+        self,
+        url: str,
+        timeout: float = 10,
+        content_types: Optional[Iterable[str]] = None,
+        max_bytes: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[FetchResponse]:
+        """Stream GET *url* under the global and per-host limits.
+
+        Error statuses, unexpected content types (when *content_types* is
+        given) and oversized Content-Length headers are answered without
+        reading the body. Otherwise at most *max_bytes* are read and only
+        those are decoded. Extra *headers* (e.g. conditional-GET validators)
+        are sent with the request. Returns ``None`` on transport errors.
+        """
+        if self._global_sem is None:
+            self._global_sem = asyncio.Semaphore(self.max_concurrency)
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        client = self._get_client()
+        async with self._global_sem, self._host_sem(url):
+            try:
+                async with client.stream("GET", url, timeout=timeout, headers=headers) as resp:
+                    body, truncated = b"", False
+                    if self._reject_before_body(resp, content_types):
+                        self._stats["rejected_early"] += 1
+                    else:
+                        body, truncated = await self._read_capped(resp, budget)
+                    self._stats["responses"] += 1
+                    self._stats["bytes_on_wire"] += resp.num_bytes_downloaded
+                    self._stats["truncated"] += int(truncated)
+                    return FetchResponse(
+                        url=str(resp.url),
+                        status_code=resp.status_code,
+                        headers=resp.headers,
+                        text=_decode(body, resp.charset_encoding),
+                        redirects=len(resp.history),
+                        truncated=truncated,
+                    )
+            except (httpx.HTTPError, httpx.InvalidURL):
+                return None
+
+
+_ENGINE: Optional[FetchEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_engine() -> FetchEngine:
+    """Return the process-wide engine, creating it on first use."""
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                _ENGINE = FetchEngine()
+                atexit.register(_ENGINE.close)
+    return _ENGINE
+
+
+def set_engine(engine: Optional[FetchEngine]) -> None:
+    """Swap the process-wide engine (tests inject one backed by a mock transport)."""
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is not None and _ENGINE is not engine:
+            _ENGINE.close()
+        _ENGINE = engine
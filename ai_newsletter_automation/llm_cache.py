@@ -0,0 +1,117 @@
+"""LLM response cache — replays Groq completions for prompts already answered.
+
+Re-running a section, a retry attempt that reaches the same verified set, or
+a frontend retry after a rate limit sends byte-identical prompts; serving the
+stored completion saves the latency and the tokens. Entries are keyed by
+model, a hash of each prompt and the temperature, and live in a DiskCache
+(TTL plus LRU size eviction).
+
+Per-article results (see ``summarize.summarize_section``) share the store
+through :meth:`LLMCache.get_item` / :meth:`LLMCache.put_item` under their
+own keys.
+
+Callers pass ``use_cache=False`` to bypass lookups; the fresh response is
+still stored, so a bypassed run refreshes the cache for later ones.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional
+
+from .cache import CACHE_ENABLED, DiskCache
+
+log = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "1") != "0" and CACHE_ENABLED
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_HOURS", "168")) * 3600
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "50")) * 1024 * 1024
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def llm_cache_key(model: str, system_prompt: str, user_prompt: str, temperature: Optional[float]) -> str:
+    """``model|sha256(system)|sha256(user)|temperature`` — ``default`` when the API default is used."""
+    temp = "default" if temperature is None else repr(float(temperature))
+    return f"{model}|{_digest(system_prompt)}|{_digest(user_prompt)}|{temp}"
+
+
+class LLMCache:
+    """Completions by prompt key; hits and misses are counted by the store, bypasses here."""
+
+    def __init__(self, store: DiskCache):
+        self.store = store
+        self._lock = threading.Lock()
+        self.bypassed = 0
+
+    def get(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> Optional[str]:
+        if not use_cache:
+            with self._lock:
+                self.bypassed += 1
+            return None
+        value = self.store.get(llm_cache_key(model, system_prompt, user_prompt, temperature))
+        if value is None:
+            return None
+        log.debug("LLM cache hit for %s", model)
+        return value["text"]
+
+    def put(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float],
+        text: str,
+    ) -> None:
+        self.store.set(llm_cache_key(model, system_prompt, user_prompt, temperature), {"model": model, "text": text})
+
+    def get_item(self, key: str, use_cache: bool = True) -> Optional[dict]:
+        """A JSON value stored under a caller-built *key*, e.g. one article's summary."""
+        if not use_cache:
+            with self._lock:
+                self.bypassed += 1
+            return None
+        return self.store.get(key)
+
+    def put_item(self, key: str, value: dict) -> None:
+        self.store.set(key, value)
+
+    def stats(self) -> dict:
+        return {"hits": self.store.hits, "misses": self.store.misses, "bypassed": self.bypassed}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.store.hits = self.store.misses = self.bypassed = 0
+
+
+_LLM_CACHE: Optional[LLMCache] = None
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Process-wide LLM response cache, or ``None`` when disabled (LLM_CACHE=0 or PAGE_CACHE=0)."""
+    global _LLM_CACHE
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _LLM_CACHE is None:
+        with _LLM_CACHE_LOCK:
+            if _LLM_CACHE is None:
+                _LLM_CACHE = LLMCache(DiskCache("llm", LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_BYTES))
+    return _LLM_CACHE
+
+
+def set_llm_cache(cache: Optional[LLMCache]) -> None:
+    """Swap the process-wide LLM cache (tests point it at a temp directory)."""
+    global _LLM_CACHE
+    with _LLM_CACHE_LOCK:
+        _LLM_CACHE = cache
@@ -0,0 +1,178 @@
+"""Shared Groq client — one keep-alive connection pool for every LLM call in the process.
+
+Building a ``groq.Groq`` per call (as summarize, rerank and the TL;DR did)
+means a new HTTP pool and a TCP + TLS handshake before each completion.
+:func:`get_groq_client` creates one client per API key on first use and
+hands the same instance to every thread; httpx connection pools are
+thread-safe. Connection setup time is traced per request so runs can
+report how much of the LLM latency went to connecting.
+
+:func:`get_async_groq_client` is the asyncio counterpart used by the async
+summarize/rerank layer. An ``httpx.AsyncClient`` belongs to the event loop
+that opened its connections, so async clients are kept per loop.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Dict, MutableMapping, Optional
+
+import groq
+import httpx
+
+# Per-call ceilings: completions are slow to generate but connecting should be quick
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_POOL_MAXSIZE = int(os.getenv("LLM_POOL_MAXSIZE", "8"))  # concurrent section threads
+# Set LLM_CLIENT_REUSE=0 to build a throwaway client per call (benchmark baseline)
+CLIENT_REUSE_ENABLED = os.getenv("LLM_CLIENT_REUSE", "1") != "0"
+
+_CLIENTS: Dict[str, groq.Groq] = {}
+_ASYNC_CLIENTS: MutableMapping[asyncio.AbstractEventLoop, Dict[str, groq.AsyncGroq]] = weakref.WeakKeyDictionary()
+_CLIENTS_LOCK = threading.Lock()
+
+
+def llm_timeout(read: Optional[float] = None) -> httpx.Timeout:
+    """Timeout for one call: *read* (default LLM_TIMEOUT) overall, LLM_CONNECT_TIMEOUT to connect."""
+    return httpx.Timeout(read if read is not None else LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+
+
+class _ConnectStats:
+    """Requests, new connections and seconds spent in TCP connect + TLS handshake."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+            self.connect_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "connect_seconds": self.connect_seconds,
+            }
+
+    def _trace(self):
+        """httpcore trace callback timing TCP connect and TLS handshake for one request."""
+        started: Dict[str, float] = {}
+
+        def trace(event: str, info: dict) -> None:
+            if not event.startswith(("connection.connect_tcp.", "connection.start_tls.")):
+                return
+            step, _, phase = event.rpartition(".")
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase == "complete" and step in started:
+                elapsed = time.perf_counter() - started.pop(step)
+                with self._lock:
+                    self.connect_seconds += elapsed
+                    if step == "connection.connect_tcp":
+                        self.connections += 1
+
+        return trace
+
+    def on_request(self, request: httpx.Request) -> None:
+        """httpx request hook: attach an httpcore trace that times connection setup."""
+        request.extensions["trace"] = self._trace()
+        with self._lock:
+            self.requests += 1
+
+    async def aon_request(self, request: httpx.Request) -> None:
+        """Async twin of :meth:`on_request` (async httpcore awaits its trace callback)."""
+        trace = self._trace()
+
+        async def atrace(event: str, info: dict) -> None:
+            trace(event, info)
+
+        request.extensions["trace"] = atrace
+        with self._lock:
+            self.requests += 1
+
+
+_STATS = _ConnectStats()
+
+
+def _build_client(api_key: str, base_url: Optional[str] = None) -> groq.Groq:
+    http_client = httpx.Client(
+        timeout=llm_timeout(),
+        limits=httpx.Limits(max_connections=LLM_POOL_MAXSIZE, max_keepalive_connections=LLM_POOL_MAXSIZE),
+        event_hooks={"request": [_STATS.on_request]},
+    )
+    # No SDK retries: rate_limit.chat_completion paces and retries every call
+    return groq.Groq(
+        api_key=api_key, base_url=base_url, timeout=llm_timeout(), max_retries=0, http_client=http_client
+    )
+
+
+def _build_async_client(api_key: str, base_url: Optional[str] = None) -> groq.AsyncGroq:
+    http_client = httpx.AsyncClient(
+        timeout=llm_timeout(),
+        limits=httpx.Limits(max_connections=LLM_POOL_MAXSIZE, max_keepalive_connections=LLM_POOL_MAXSIZE),
+        event_hooks={"request": [_STATS.aon_request]},
+    )
+    return groq.AsyncGroq(
+        api_key=api_key, base_url=base_url, timeout=llm_timeout(), max_retries=0, http_client=http_client
+    )
+
+
+def get_groq_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> groq.Groq:
+    """Process-wide Groq client for *api_key* (default: settings), created on first use."""
+    if api_key is None:
+        from .config import get_settings
+        api_key = get_settings().groq_api_key
+    if not CLIENT_REUSE_ENABLED:
+        return _build_client(api_key, base_url)
+    key = f"{api_key}|{base_url or ''}"
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = _CLIENTS[key] = _build_client(api_key, base_url)
+    return client
+
+
+def get_async_groq_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> groq.AsyncGroq:
+    """Shared ``groq.AsyncGroq`` for *api_key* on the running event loop, created on first use."""
+    if api_key is None:
+        from .config import get_settings
+        api_key = get_settings().groq_api_key
+    if not CLIENT_REUSE_ENABLED:
+        return _build_async_client(api_key, base_url)
+    loop = asyncio.get_running_loop()
+    key = f"{api_key}|{base_url or ''}"
+    with _CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = _build_async_client(api_key, base_url)
+    return client
+
+
+def reset_groq_clients() -> None:
+    """Close and drop every shared client (used by tests and benchmarks).
+
+    Async clients are only dropped: closing them needs their own event loop.
+    """
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+        _ASYNC_CLIENTS.clear()
+
+
+def connect_stats() -> Dict[str, float]:
+    """LLM requests sent, connections opened and seconds spent opening them."""
+    return _STATS.snapshot()
+
+
+def reset_connect_stats() -> None:
+    _STATS.reset()
@@ -0,0 +1,96 @@
+"""Shingling and MinHash/LSH — near-linear candidate search for similar short texts.
+
+Shared by ``dedup`` (clustering verified articles) and ``canonical``
+(collapsing hits before verification). Texts become sets of hashed
+character shingles; a one-permutation MinHash signature per set is cut into
+LSH bands, and two texts become candidates when any band matches. Callers
+confirm candidates with an exact similarity (:func:`dice` or their own).
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+TITLE_SHINGLE = 3  # characters per title shingle
+
+# One-permutation MinHash: NUM_BINS bins per signature, banded into LSH rows of
+# LSH_ROWS. Candidates need one identical band; with 16 bands of 3 a pair at
+# Jaccard 0.6 is proposed ~97% of the time, at Jaccard 0.43 ~73%, and an
+# unrelated pair at Jaccard 0.1 under 2%.
+NUM_BINS = 48
+LSH_ROWS = 3
+
+_SPACES = re.compile(r"\s+")
+
+Shingles = FrozenSet[int]
+
+
+def stable_hash(text: str) -> int:
+    """CRC-32 of *text* — unlike built-in ``hash()``, identical in every process."""
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def shingles(text: str, size: int) -> Shingles:
+    """Hashed character *size*-grams of lowercased, whitespace-collapsed *text*."""
+    text = _SPACES.sub(" ", (text or "").lower()).strip()
+    if not text:
+        return frozenset()
+    if len(text) <= size:
+        return frozenset((stable_hash(text),))
+    return frozenset(stable_hash(text[i:i + size]) for i in range(len(text) - size + 1))
+
+
+def dice(a: Shingles, b: Shingles) -> float:
+    """2|A∩B| / (|A|+|B|) — the set analogue of SequenceMatcher's 2M/T ratio."""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def signature(shingle_set: Shingles) -> Optional[Tuple]:
+    """One-permutation MinHash: the minimum hash per bin, empty bins densified.
+
+    One pass over the shingles instead of one per permutation. An empty bin
+    borrows the next non-empty bin's minimum (with the distance, so borrowed
+    values only collide with equally-borrowed ones).
+    """
+    if not shingle_set:
+        return None
+    bins: List[Optional[int]] = [None] * NUM_BINS
+    for h in shingle_set:
+        b = h % NUM_BINS
+        v = h // NUM_BINS
+        if bins[b] is None or v < bins[b]:
+            bins[b] = v
+    sig = []
+    for i in range(NUM_BINS):
+        for offset in range(NUM_BINS):
+            v = bins[(i + offset) % NUM_BINS]
+            if v is not None:
+                sig.append((v, offset))
+                break
+    return tuple(sig)
+
+
+def bands(sig: Tuple) -> List[Tuple]:
+    """LSH bucket keys of a signature: one per band of LSH_ROWS bins."""
+    return [(band, sig[band:band + LSH_ROWS]) for band in range(0, NUM_BINS, LSH_ROWS)]
+
+
+def lsh_candidates(signatures: Sequence[Optional[Tuple]]) -> Dict[int, set]:
+    """Map each index to the later indices sharing at least one LSH band with it."""
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    for idx, sig in enumerate(signatures):
+        if sig is None:
+            continue
+        for key in bands(sig):
+            buckets[key].append(idx)
+
+    candidates: Dict[int, set] = defaultdict(set)
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for pos, i in enumerate(members):
+            candidates[i].update(members[pos + 1:])
+    return candidates
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -30,6 +30,7 @@ class SummaryItem:
     Date: Optional[str] = None  # ISO string if present (events)
     Relevance: Optional[int] = None  # 1-10 relevance rating from LLM
     Source: Optional[str] = None  # origin badge e.g. "arXiv", "TBS", "OECD"
+    Source_Title: Optional[str] = None  # the article's own title (Headline is the LLM rewrite)
 
 
 @dataclass
@@ -47,3 +48,4 @@ class SectionConfig:
     relevance_threshold: int = 6                   # min LLM relevance score (1-10) to keep
     boost_keywords: Optional[List[str]] = None     # rank articles containing these higher
     reject_keywords: Optional[List[str]] = None    # drop articles matching these words
+    score_weights: Optional[Dict[str, float]] = None  # override scoring.DEFAULT_WEIGHTS per feature
@@ -0,0 +1,270 @@
+"""Negative cache — remembers links verification rejected so later runs skip them.
+
+A Bloom filter answers "never rejected" from memory for the vast majority of
+URLs. Only on a (possible) hit do we read the exact, TTL'd entry from disk,
+which also carries the rejection reason. Per-domain aggregates let domains
+that paywall nearly everything be skipped before any request is made.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import math
+import os
+import struct
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from .cache import CACHE_ENABLED, DiskCache, normalize_url
+
+log = logging.getLogger(__name__)
+
+NEGATIVE_CACHE_ENABLED = os.getenv("NEGATIVE_CACHE", "1") != "0" and CACHE_ENABLED
+BLOOM_CAPACITY = int(os.getenv("NEGATIVE_CACHE_CAPACITY", "100000"))
+BLOOM_ERROR_RATE = 0.01
+
+_DAY = 24 * 3600
+# How long each rejection is believed. Transient failures (timeouts, 5xx, 429)
+# are never recorded; bot walls (401/403) and thin pages get a short memory.
+REASON_TTL_SECONDS: Dict[str, int] = {
+    "http_404": 14 * _DAY,
+    "http_410": 30 * _DAY,
+    "soft_404": 14 * _DAY,
+    "not_html": 30 * _DAY,
+    "paywall": 7 * _DAY,
+    "jsonld_paywall": 7 * _DAY,
+    "redirects": 3 * _DAY,
+    "http_401": 3 * _DAY,
+    "http_403": 3 * _DAY,
+    "too_short": 1 * _DAY,
+}
+_MAX_TTL = max(REASON_TTL_SECONDS.values())
+_PAYWALL_REASONS = {"paywall", "jsonld_paywall"}
+
+# A domain is skipped outright once this many of its pages were checked and
+# at least this share of them were paywalled
+DOMAIN_MIN_SAMPLES = 5
+DOMAIN_PAYWALL_SHARE = 0.9
+_DOMAIN_WINDOW_SECONDS = 30 * _DAY  # counts older than this start over
+
+_STORE_MAX_BYTES = 20 * 1024 * 1024
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter with double hashing over a stable digest (persistable across runs)."""
+
+    _HEADER = struct.Struct(">QQQQd")  # capacity, size, hashes, count, updated_at
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))  # bits
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self.updated_at = 0.0  # time of the newest write the filter holds
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack(">QQ", digest)
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def to_bytes(self) -> bytes:
+        header = self._HEADER.pack(self.capacity, self.size, self.hashes, self.count, self.updated_at)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, capacity: int, error_rate: float = BLOOM_ERROR_RATE) -> Optional["BloomFilter"]:
+        """Restore a saved filter; ``None`` if it holds fewer than *capacity* keys or used other parameters.
+
+        A filter saved with a larger capacity (grown after saturating) is kept.
+        """
+        try:
+            saved_capacity, size, hashes, count, updated_at = cls._HEADER.unpack_from(data)
+        except struct.error:
+            return None
+        if saved_capacity < capacity:
+            return None
+        bloom = cls(saved_capacity, error_rate)
+        if (size, hashes) != (bloom.size, bloom.hashes) or len(data) - cls._HEADER.size != len(bloom.bits):
+            return None
+        bloom.bits[:] = data[cls._HEADER.size:]
+        bloom.count = count
+        bloom.updated_at = updated_at
+        return bloom
+
+
+def _domain(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class NegativeCache:
+    """Rejected URLs (Bloom filter + exact TTL'd store) and per-domain paywall counts."""
+
+    def __init__(self, store: DiskCache, capacity: int = BLOOM_CAPACITY):
+        self.store = store
+        self.capacity = capacity
+        self._bloom_path = store.directory / "bloom.bin"
+        self._domains_path = store.directory / "domains.json"
+        # Written on the first rejection after a flush, removed by the next flush:
+        # if it survives, a run recorded entries its saved filter never saw
+        self._pending_path = store.directory / "pending"
+        self._pending_since: Optional[float] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.skipped = 0
+        self.skipped_by_domain = 0
+        self.bloom = self._load_bloom()
+        self.domains: Dict[str, Dict] = self._load_domains()
+
+    # ── Persistence ──
+
+    def _load_bloom(self) -> BloomFilter:
+        try:
+            self._pending_since = float(self._pending_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._pending_since = None
+        try:
+            bloom = BloomFilter.from_bytes(self._bloom_path.read_bytes(), self.capacity)
+        except OSError:
+            bloom = None
+        if bloom is not None and (self._pending_since is None or self._pending_since <= bloom.updated_at):
+            self.capacity = bloom.capacity
+            return bloom
+        return self._rebuild_bloom()  # missing, resized, or behind the exact store
+
+    def _rebuild_bloom(self) -> BloomFilter:
+        """Fresh filter holding every unexpired exact entry (first run, new parameters or saturation)."""
+        bloom = BloomFilter(self.capacity)
+        now = bloom.updated_at = time.time()
+        for path in self.store._scan():
+            try:
+                value = json.loads(path.read_text(encoding="utf-8"))["value"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if value.get("expires_at", 0) > now:
+                bloom.add(value["key"])
+        self._dirty = True
+        return bloom
+
+    def _load_domains(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self._domains_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def flush(self) -> None:
+        """Write the Bloom filter and domain counts (exact entries are written as they come)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payloads = {
+                self._bloom_path: self.bloom.to_bytes(),
+                self._domains_path: json.dumps(self.domains).encode("utf-8"),
+            }
+            self._dirty = False
+            pending, self._pending_since = self._pending_since, None
+        for path, payload in payloads.items():
+            tmp = path.with_suffix(".tmp")
+            try:
+                tmp.write_bytes(payload)
+                tmp.replace(path)
+            except OSError:
+                log.warning("Could not write negative cache file %s", path)
+                return  # keep the marker: the saved filter is still behind
+        if pending is not None:
+            with self._lock:
+                if self._pending_since is None:  # nothing recorded while writing
+                    self._pending_path.unlink(missing_ok=True)
+
+    # ── Lookups ──
+
+    def _domain_paywalled(self, domain: str) -> bool:
+        stats = self.domains.get(domain)
+        if not stats or stats["checked"] < DOMAIN_MIN_SAMPLES:
+            return False
+        if time.time() - stats["since"] > _DOMAIN_WINDOW_SECONDS:
+            return False  # stale verdict — let a request through so the counts restart
+        return stats["paywalled"] / stats["checked"] >= DOMAIN_PAYWALL_SHARE
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Why *url* is known to fail verification, or ``None`` if it should be fetched."""
+        if self._domain_paywalled(_domain(url)):
+            self.skipped_by_domain += 1
+            return "domain_paywall"
+        key = normalize_url(url)
+        if key not in self.bloom:
+            return None  # definitely never rejected — no disk access
+        value = self.store.get(key)
+        if value is None or value.get("expires_at", 0) <= time.time():
+            return None  # Bloom false positive or expired rejection
+        self.skipped += 1
+        return value["reason"]
+
+    # ── Recording ──
+
+    def record(self, url: str, reason: Optional[str]) -> None:
+        """Record a verification outcome; *reason* is ``None`` for a page that passed."""
+        domain = _domain(url)
+        now = time.time()
+        with self._lock:
+            if domain:
+                stats = self.domains.get(domain)
+                if stats is None or now - stats["since"] > _DOMAIN_WINDOW_SECONDS:
+                    stats = self.domains[domain] = {"checked": 0, "paywalled": 0, "since": now}
+                stats["checked"] += 1
+                stats["paywalled"] += int(reason in _PAYWALL_REASONS)
+            self._dirty = True
+        ttl = REASON_TTL_SECONDS.get(reason or "")
+        if not ttl:
+            return
+        key = normalize_url(url)
+        self.store.set(key, {"key": key, "url": url, "reason": reason, "expires_at": now + ttl})
+        with self._lock:
+            self.bloom.add(key)
+            self.bloom.updated_at = now
+            if self._pending_since is None:
+                self._pending_since = now
+                try:
+                    self._pending_path.write_text(repr(now), encoding="utf-8")
+                except OSError:
+                    pass
+            if self.bloom.count > self.capacity:
+                # Saturated: grow, so the rebuild is not repeated on every insert
+                self.capacity *= 2
+                self.bloom = self._rebuild_bloom()
+
+
+_NEGATIVE_CACHE: Optional[NegativeCache] = None
+_NEGATIVE_CACHE_LOCK = threading.Lock()
+
+
+def get_negative_cache() -> Optional[NegativeCache]:
+    """Process-wide negative cache, or ``None`` when disabled (NEGATIVE_CACHE=0 or PAGE_CACHE=0)."""
+    global _NEGATIVE_CACHE
+    if not NEGATIVE_CACHE_ENABLED:
+        return None
+    if _NEGATIVE_CACHE is None:
+        with _NEGATIVE_CACHE_LOCK:
+            if _NEGATIVE_CACHE is None:
+                _NEGATIVE_CACHE = NegativeCache(DiskCache("negative", _MAX_TTL, _STORE_MAX_BYTES))
+                atexit.register(_NEGATIVE_CACHE.flush)
+    return _NEGATIVE_CACHE
+
+
+def set_negative_cache(cache: Optional[NegativeCache]) -> None:
+    """Swap the process-wide negative cache (tests point it at a temp directory)."""
+    global _NEGATIVE_CACHE
+    with _NEGATIVE_CACHE_LOCK:
+        _NEGATIVE_CACHE = cache
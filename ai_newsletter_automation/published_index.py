@@ -0,0 +1,147 @@
+"""Cross-run published-story index — remembers what previous issues featured.
+
+Written by ``runner.main`` after rendering and consulted before verification,
+so a widened retry window (up to 3× the run's days) no longer fetches,
+reranks and summarizes stories readers already saw. Stories are matched by
+cleaned URL, canonical URL key or title fingerprint, each a set lookup.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .canonical import canonical_key, clean_url, title_key
+from .models import ArticleHit, SummaryItem
+
+log = logging.getLogger(__name__)
+
+INDEX_ENABLED = os.getenv("PUBLISHED_INDEX", "1") != "0"
+RETENTION_SECONDS = int(os.getenv("PUBLISHED_INDEX_DAYS", "90")) * 24 * 3600
+
+
+def _get_index_path() -> Path:
+    """Index file — tries project logs first, falls back to /tmp."""
+    try:
+        from .config import get_settings
+        p = get_settings().project_root / "logs" / "published_index.json"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return p
+    except Exception:
+        p = Path("/tmp") / "logs" / "published_index.json"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return p
+
+
+def title_fingerprint(title: str) -> str:
+    """Short stable hash of the normalized title (see :func:`canonical.title_key`)."""
+    key = title_key(title)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] if key else ""
+
+
+class PublishedIndex:
+    """URLs, canonical keys and title fingerprints of stories from earlier issues.
+
+    Entries recorded for *issue* itself are ignored on lookup, so
+    regenerating the same issue does not exclude its own stories.
+    """
+
+    def __init__(self, entries: Optional[List[Dict]] = None, issue: Optional[str] = None, path: Optional[Path] = None):
+        self.issue = issue or date.today().isoformat()
+        self.path = path
+        cutoff = time.time() - RETENTION_SECONDS
+        self.entries = [e for e in (entries or []) if e.get("recorded_at", 0) > cutoff]
+        self._urls = set()
+        self._keys = set()
+        self._titles = set()
+        for e in self.entries:
+            if e.get("issue") != self.issue:
+                self._remember(e)
+
+    def _remember(self, entry: Dict) -> None:
+        self._urls.add(entry.get("url", ""))
+        self._keys.add(entry.get("key", ""))
+        if entry.get("title_fp"):
+            self._titles.add(entry["title_fp"])
+
+    @classmethod
+    def load(cls, issue: Optional[str] = None, path: Optional[Path] = None) -> "PublishedIndex":
+        path = path or _get_index_path()
+        entries: List[Dict] = []
+        try:
+            if path.exists():
+                entries = json.loads(path.read_text(encoding="utf-8")).get("entries", [])
+        except (OSError, ValueError, AttributeError):
+            log.warning("Could not read published index %s; starting empty", path)
+        return cls(entries, issue=issue, path=path)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def contains(self, url: str, title: str = "") -> bool:
+        """True if a previous issue featured this story."""
+        if url and (clean_url(url) in self._urls or canonical_key(url) in self._keys):
+            return True
+        fp = title_fingerprint(title)
+        return bool(fp) and fp in self._titles
+
+    def filter_new(self, hits: Iterable[ArticleHit]) -> List[ArticleHit]:
+        """Drop hits already featured in an earlier issue."""
+        hits = list(hits)
+        fresh = [h for h in hits if not self.contains(h.url, h.title)]
+        if len(fresh) < len(hits):
+            log.info("Skipped %d previously published hits", len(hits) - len(fresh))
+        return fresh
+
+    def record(self, items: Iterable[SummaryItem]) -> None:
+        """Add this issue's items, replacing anything recorded for it by an earlier regeneration."""
+        now = time.time()
+        self.entries = [e for e in self.entries if e.get("issue") != self.issue]
+        for item in items:
+            if not item.Live_Link:
+                continue
+            self.entries.append({
+                "issue": self.issue,
+                "url": clean_url(item.Live_Link),
+                "key": canonical_key(item.Live_Link),
+                # The source title, which future hits carry — not the LLM's rewritten headline
+                "title_fp": title_fingerprint(item.Source_Title or item.Headline),
+                "recorded_at": now,
+            })
+
+    def save(self) -> None:
+        path = self.path or _get_index_path()
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps({"entries": self.entries}), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            log.warning("Could not write published index to %s", path)
+
+
+_INDEX: Optional[PublishedIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_published_index() -> Optional[PublishedIndex]:
+    """Process-wide index (loaded on first use), or ``None`` when disabled via PUBLISHED_INDEX=0."""
+    global _INDEX
+    if not INDEX_ENABLED:
+        return None
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                _INDEX = PublishedIndex.load()
+    return _INDEX
+
+
+def set_published_index(index: Optional[PublishedIndex]) -> None:
+    """Swap the process-wide index (runner.main loads it for the issue being built; tests isolate it)."""
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = index
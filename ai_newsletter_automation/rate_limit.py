@@ -0,0 +1,275 @@
+"""Groq rate limiting — shared token buckets for requests and tokens per minute.
+
+Section threads used to fire completions independently and sleep a fixed
+back-off after each 429, so parallel runs hit the limit in bursts. Every
+LLM call now goes through :func:`chat_completion` (or :func:`achat_completion`
+for async clients), which waits on a per-model :class:`RateLimiter` before
+sending:
+
+* a requests bucket refills at ``GROQ_RPM`` per minute;
+* a tokens bucket refills at ``GROQ_TPM`` per minute and is charged an
+  estimate of the prompt plus expected completion, then corrected with the
+  real ``usage`` once the response arrives;
+* ``x-ratelimit-*`` response headers pull the buckets down to what the API
+  says is left (and set the token rate to the account's real limit), and
+  ``Retry-After`` on a 429 pauses every caller of that model until then.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import groq
+
+from .llm_client import llm_timeout
+
+log = logging.getLogger(__name__)
+
+# Defaults match Groq's free tier for llama-3.3-70b; response headers refine them
+GROQ_RPM = float(os.getenv("GROQ_RPM", "30"))
+GROQ_TPM = float(os.getenv("GROQ_TPM", "12000"))
+LLM_MAX_ATTEMPTS = 3
+
+_CHARS_PER_TOKEN = 4  # rough estimate for English prompts
+_EXPECTED_COMPLETION_TOKENS = 1024  # charged up front, corrected from usage
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds in a header value like ``"7.66s"``, ``"2m59.5s"``, ``"120ms"`` or ``"12"``."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(messages: List[dict], max_tokens: Optional[int] = None) -> int:
+    """Prompt tokens (~4 characters each) plus the completion we expect back."""
+    prompt = sum(len(m.get("content") or "") for m in messages) // _CHARS_PER_TOKEN
+    completion = min(max_tokens or _EXPECTED_COMPLETION_TOKENS, _EXPECTED_COMPLETION_TOKENS)
+    return prompt + completion
+
+
+class _Bucket:
+    """Token bucket holding up to *per_minute* units, refilled continuously."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.per_minute, self.level + (now - self.updated) * self.per_minute / 60)
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until *amount* is available (amounts above capacity wait for a full bucket)."""
+        missing = min(amount, self.per_minute) - self.level
+        return max(0.0, missing * 60 / self.per_minute)
+
+
+class RateLimiter:
+    """Requests- and tokens-per-minute limits for one model, shared by all threads."""
+
+    def __init__(self, rpm: float = GROQ_RPM, tpm: float = GROQ_TPM):
+        self._cond = threading.Condition()
+        self.requests = _Bucket(rpm)
+        self.tokens = _Bucket(tpm)
+        self.blocked_until = 0.0  # monotonic time set by Retry-After / exhausted quotas
+        self.calls = 0
+        self.waited_seconds = 0.0
+        self.rate_limited = 0
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and *tokens* if they fit now; otherwise the seconds to wait. Holds the lock."""
+        now = time.monotonic()
+        self.requests.refill(now)
+        self.tokens.refill(now)
+        wait = max(self.blocked_until - now, self.requests.wait_for(1), self.tokens.wait_for(tokens))
+        if wait > 0:
+            return wait
+        self.requests.level -= 1
+        self.tokens.level -= min(tokens, self.tokens.per_minute)
+        self.calls += 1
+        return 0.0
+
+    def _waited(self, start: float) -> float:
+        waited = time.monotonic() - start
+        with self._cond:
+            self.waited_seconds += waited
+        if waited > 0.5:
+            log.info("Rate limiter held an LLM call for %.1fs", waited)
+        return waited
+
+    def acquire(self, tokens: int) -> float:
+        """Block until one request and *tokens* fit; returns the seconds waited."""
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                wait = self._reserve(tokens)
+                if wait <= 0:
+                    break
+                self._cond.wait(wait)
+        return self._waited(start)
+
+    async def aacquire(self, tokens: int) -> float:
+        """:meth:`acquire` for coroutines: sleeps on the event loop instead of blocking it."""
+        start = time.monotonic()
+        while True:
+            with self._cond:
+                wait = self._reserve(tokens)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        return self._waited(start)
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """Correct the tokens bucket once the real usage is known."""
+        if actual is None:
+            return
+        with self._cond:
+            self.tokens.level = min(self.tokens.per_minute, self.tokens.level + estimated - actual)
+            self._cond.notify_all()
+
+    def observe(self, headers: Mapping[str, str], rate_limited: bool = False) -> None:
+        """Align the buckets with the API's own accounting from response headers."""
+        now = time.monotonic()
+        with self._cond:
+            limit_tokens = _header_float(headers, "x-ratelimit-limit-tokens")
+            if limit_tokens:
+                self.tokens.per_minute = limit_tokens
+            for bucket, kind in ((self.requests, "requests"), (self.tokens, "tokens")):
+                remaining = _header_float(headers, f"x-ratelimit-remaining-{kind}")
+                if remaining is None:
+                    continue
+                bucket.refill(now)
+                bucket.level = min(bucket.level, remaining)
+                if remaining <= 0:
+                    reset = _parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                    if reset:
+                        self.blocked_until = max(self.blocked_until, now + reset)
+            if rate_limited:
+                self.rate_limited += 1
+                retry_after = _parse_duration(headers.get("retry-after"))
+                self.blocked_until = max(self.blocked_until, now + (retry_after or 1.0))
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            return {"calls": self.calls, "waited_seconds": self.waited_seconds, "rate_limited": self.rate_limited}
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(model: str) -> RateLimiter:
+    """Process-wide limiter for *model* (Groq limits are per model)."""
+    limiter = _LIMITERS.get(model)
+    if limiter is None:
+        with _LIMITERS_LOCK:
+            limiter = _LIMITERS.setdefault(model, RateLimiter())
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def rate_limit_stats() -> Dict[str, float]:
+    """Calls, seconds spent waiting and 429s, summed over every model."""
+    totals = {"calls": 0, "waited_seconds": 0.0, "rate_limited": 0}
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.values())
+    for limiter in limiters:
+        for key, value in limiter.stats().items():
+            totals[key] += value
+    return totals
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """The API's suggested wait for a 429 error, if it gave one."""
+    response = getattr(exc, "response", None)
+    if not isinstance(exc, groq.RateLimitError) or response is None:
+        return None
+    return _parse_duration(response.headers.get("retry-after"))
+
+
+_RETRYABLE = (groq.RateLimitError, groq.APIConnectionError, groq.InternalServerError)
+
+
+def _prepare(model: str, messages: List[dict], max_tokens: Optional[int], kwargs: dict) -> Tuple[RateLimiter, int]:
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    kwargs.setdefault("timeout", llm_timeout())
+    return get_rate_limiter(model), estimate_tokens(messages, max_tokens)
+
+
+def _failed(limiter: RateLimiter, estimate: int, exc: Exception, model: str, attempt: int) -> float:
+    """Account for a failed attempt; re-raises on the last one, else returns the back-off in seconds."""
+    limiter.settle(estimate, 0)  # a rejected request uses no tokens
+    if isinstance(exc, groq.RateLimitError):
+        limiter.observe(exc.response.headers, rate_limited=True)
+    if attempt == LLM_MAX_ATTEMPTS - 1:
+        raise exc
+    if isinstance(exc, groq.RateLimitError):
+        log.warning("Groq rate limit hit for %s; retrying after the advised wait", model)
+        return 0.0  # the limiter itself holds the retry until Retry-After
+    return 2 * (2 ** attempt)
+
+
+def _completed(limiter: RateLimiter, estimate: int, completion, headers: Mapping[str, str]):
+    usage = getattr(completion, "usage", None)
+    limiter.settle(estimate, getattr(usage, "total_tokens", None))
+    limiter.observe(headers)  # after settling, so the API's remaining count wins
+    return completion
+
+
+def chat_completion(client, model: str, messages: List[dict], max_tokens: Optional[int] = None, **kwargs):
+    """``client.chat.completions.create`` paced by the model's limiter.
+
+    429s are retried after the wait the API asks for; connection errors and
+    5xx responses get an exponential back-off. Other errors propagate.
+    """
+    limiter, estimate = _prepare(model, messages, max_tokens, kwargs)
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        limiter.acquire(estimate)
+        try:
+            raw = client.chat.completions.with_raw_response.create(model=model, messages=messages, **kwargs)
+        except _RETRYABLE as e:
+            time.sleep(_failed(limiter, estimate, e, model, attempt))
+            continue
+        return _completed(limiter, estimate, raw.parse(), raw.headers)
+
+
+async def achat_completion(client, model: str, messages: List[dict], max_tokens: Optional[int] = None, **kwargs):
+    """:func:`chat_completion` for a ``groq.AsyncGroq`` client, sharing the same limiter."""
+    limiter, estimate = _prepare(model, messages, max_tokens, kwargs)
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        await limiter.aacquire(estimate)
+        try:
+            raw = await client.chat.completions.with_raw_response.create(model=model, messages=messages, **kwargs)
+        except _RETRYABLE as e:
+            await asyncio.sleep(_failed(limiter, estimate, e, model, attempt))
+            continue
+        return _completed(limiter, estimate, await raw.parse(), raw.headers)
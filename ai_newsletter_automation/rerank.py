@@ -2,14 +2,16 @@
 
 import json
 import logging
-import time
-from typing import List, Optional
-import groq
+from typing import Dict, List, Optional
 
 import requests
 
 from .config import get_settings
+from .llm_cache import get_llm_cache
+from .fetch_engine import get_engine
+from .llm_client import get_async_groq_client
 from .models import VerifiedArticle, SectionConfig
+from .rate_limit import achat_completion
 
 log = logging.getLogger(__name__)
 
@@ -59,51 +61,85 @@ def _parse_scores(raw: str, count: int) -> List[int]:
     return scores
 
 
+async def _ascore_articles(
+    articles: List[VerifiedArticle],
+    section: SectionConfig,
+    model: str,
+    use_cache: bool = True,
+) -> List[int]:
+    """One LLM call scoring *articles* (or a cached response to the same prompt); raises on failure."""
+    settings = get_settings()
+    # Configure Groq
+    if "gemini" in model or "llama-3." in model or "llama3" in model:
+        model = "llama-3.3-70b-versatile"
+
+    prompt = _build_rerank_prompt(section.name, articles)
+    cache = get_llm_cache()
+    if cache is not None:
+        cached = cache.get(model, _RERANK_SYSTEM, prompt, use_cache=use_cache)
+        if cached is not None:
+            return _parse_scores(cached, len(articles))
+
+    client = get_async_groq_client(settings.groq_api_key)
+
+    response = await achat_completion(
+        client,
+        model,
+        [
+            {"role": "system", "content": _RERANK_SYSTEM},
+            {"role": "user", "content": prompt}
+        ],
+        response_format={"type": "json_object"},
+    )
+    raw = response.choices[0].message.content
+
+    scores = _parse_scores(raw, len(articles))
+    if cache is not None:
+        cache.put(model, _RERANK_SYSTEM, prompt, None, raw)  # only responses that parsed
+    return scores
+
+
 def rerank_articles(
     articles: List[VerifiedArticle],
     section: SectionConfig,
     model: str = "llama-3.3-70b-versatile",
+    score_cache: Optional[Dict[str, int]] = None,
+    use_cache: bool = True,
+) -> List[VerifiedArticle]:
+    """Blocking :func:`arerank_articles` (runs on the fetch engine's loop)."""
+    return get_engine().run(
+        arerank_articles(articles, section, model=model, score_cache=score_cache, use_cache=use_cache)
+    )
+
+
+async def arerank_articles(
+    articles: List[VerifiedArticle],
+    section: SectionConfig,
+    model: str = "llama-3.3-70b-versatile",
+    score_cache: Optional[Dict[str, int]] = None,
+    use_cache: bool = True,
 ) -> List[VerifiedArticle]:
     """Score and filter articles by LLM-judged relevance.
 
     Only invoked when len(articles) > section.limit to avoid wasting tokens.
     On any error, returns articles unchanged (graceful fallback).
+    *score_cache* maps URL → score: cached articles are not re-sent to the
+    LLM and new scores are added to it, so a retry only scores new articles.
+    ``use_cache=False`` skips the persistent LLM response cache lookup.
     """
     if len(articles) <= section.limit:
         return articles
 
-    settings = get_settings()
-    # Configure Groq
-    if "gemini" in model or "llama-3." in model or "llama3" in model:
-        model = "llama-3.3-70b-versatile"
-        
-    client = groq.Groq(api_key=settings.groq_api_key)
-    
-    prompt = _build_rerank_prompt(section.name, articles)
-    
-    try:
-        raw = ""
-        for attempt in range(3):
-            try:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": _RERANK_SYSTEM},
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_format={"type": "json_object"}
-                )
-                raw = response.choices[0].message.content
-                break
-            except groq.APIError:
-                if attempt == 2:
-                    raise
-                time.sleep(2 * (2 ** attempt))
-                
-        scores = _parse_scores(raw, len(articles))
-    except Exception as e:
-        log.warning("Reranking failed, returning articles unchanged: %s", e)
-        return articles
+    cache = score_cache if score_cache is not None else {}
+    unscored = [a for a in articles if a.url not in cache]
+    if unscored:
+        try:
+            for a, s in zip(unscored, await _ascore_articles(unscored, section, model, use_cache=use_cache)):
+                cache[a.url] = s
+        except Exception as e:
+            log.warning("Reranking failed, returning articles unchanged: %s", e)
+            return articles
+    scores = [cache[a.url] for a in articles]
 
     # Pair articles with scores, filter below threshold, sort descending
     scored = list(zip(articles, scores))
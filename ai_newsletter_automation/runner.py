@@ -1,12 +1,15 @@
-import concurrent.futures
+import asyncio
 import json
 import os
+import sys
 import threading
 from collections import OrderedDict
-from dataclasses import replace
+from concurrent.futures import Executor, ThreadPoolExecutor
+import time
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Set, Tuple
 
 import click
 import requests
@@ -14,7 +17,7 @@ import requests
 from .assemble import render_newsletter
 from .config import get_settings
 from .models import SummaryItem, VerifiedArticle, ArticleHit, SectionConfig
-from .scrape import scrape, extract_metadata
+from .analyze import PageAnalysis
 from .search import (
     get_streams,
     search_stream,
@@ -25,17 +28,21 @@ from .search import (
     collect_indian,
     collect_global,
     collect_deep_dive,
-    _filter_by_keywords,
-    _boost_by_keywords,
-    _boost_by_source_quality,
-    _sort_by_source_priority,
-    _apply_time_decay,
 )
+from .canonical import canonicalize_hits
 from .dedup import deduplicate
-from .rerank import rerank_articles
-from .source_quality import SourceTracker
-from .summarize import summarize_section, generate_tldr
-from .verify import verify_link
+from .fanout import latency_report, reset_latency_report
+from .fetch_engine import get_engine
+from .llm_cache import get_llm_cache
+from .llm_client import connect_stats, reset_connect_stats
+from .negative_cache import get_negative_cache
+from .published_index import INDEX_ENABLED, PublishedIndex, get_published_index, set_published_index
+from .rate_limit import rate_limit_stats
+from .rerank import arerank_articles
+from .scoring import rank_hits
+from .source_quality import get_source_tracker
+from .summarize import asummarize_section, generate_tldr
+from .verify import VERIFY_TIMEOUT, averify_page
 
 
 SECTION_ORDER = [
@@ -50,6 +57,47 @@ SECTION_ORDER = [
 
 _LOG_LOCK = threading.Lock()
 
+# Retries widen the date window. Each attempt collects its own window (sources
+# cap by count, so one collection for the widest window would let older items
+# crowd out the first attempt's); incremental mode carries verified articles
+# and rerank scores across attempts so only new URLs are fetched and scored.
+# INCREMENTAL_RETRIES=0 restores a full re-run per attempt.
+INCREMENTAL_RETRIES = os.getenv("INCREMENTAL_RETRIES", "1") != "0"
+
+# Collection blocks on search APIs (up to SOURCE_TIMEOUT per source), so it
+# runs on its own threads rather than the engine loop's default executor,
+# which verification needs for cache lookups and parsing
+COLLECT_WORKERS = int(os.getenv("COLLECT_WORKERS", "4"))
+_COLLECT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_COLLECT_EXECUTOR_LOCK = threading.Lock()
+
+
+def _collect_executor() -> ThreadPoolExecutor:
+    """Shared collection pool for sections run on their own (the API's process_section)."""
+    global _COLLECT_EXECUTOR
+    if _COLLECT_EXECUTOR is None:
+        with _COLLECT_EXECUTOR_LOCK:
+            if _COLLECT_EXECUTOR is None:
+                _COLLECT_EXECUTOR = ThreadPoolExecutor(max_workers=COLLECT_WORKERS, thread_name_prefix="collect")
+    return _COLLECT_EXECUTOR
+
+
+@dataclass
+class VerifyReport:
+    section: str
+    verified: int
+    cancelled: int  # verifications still pending when the quota was met
+    seconds: float
+    # Estimate, not a measurement: the largest VERIFY_TIMEOUT budget a
+    # cancelled task had left when the quota was met. VERIFY_TIMEOUT bounds
+    # each httpx phase rather than the whole fetch, and a task still queued for
+    # an engine slot is credited its full budget. Zero when nothing was cancelled
+    saved_seconds: float
+
+
+_VERIFY_REPORTS: List[VerifyReport] = []
+_VERIFY_REPORTS_LOCK = threading.Lock()
+
 
 def _log_skipped(reason: str, url: str, log: Path) -> None:
     """Best-effort logging — silently skip on read-only filesystems (Vercel)."""
@@ -71,17 +119,9 @@ def _log_skipped(reason: str, url: str, log: Path) -> None:
             pass  # Give up silently — logging is non-critical
 
 
-def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArticle]:
-    if not hit.url:
-        _log_skipped("missing_url", "", log_file)
-        return None
-
-    try:
-        html = verify_link(hit.url)
-    except Exception:
-        html = None
-
-    if html is None:
+def _finish_hit(hit: ArticleHit, page: Optional[PageAnalysis], log_file: Path) -> Optional[VerifiedArticle]:
+    """Turn a single-parse page analysis (or a failed fetch) into a VerifiedArticle."""
+    if page is None:
         # Link unreachable — but if we have a good RSS snippet, use it
         if hit.snippet and len(hit.snippet) > 80:
             _log_skipped("verify_failed_using_snippet", hit.url, log_file)
@@ -96,11 +136,7 @@ def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArt
             _log_skipped("verify_failed", hit.url, log_file)
         return None
 
-    try:
-        content = scrape(hit.url, html=html)
-    except Exception:
-        content = None
-        
+    content = page.scraped_text
     if not content:
         # Scrape failed — fall back to RSS snippet
         if hit.snippet and len(hit.snippet) > 40:
@@ -109,13 +145,6 @@ def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArt
         else:
             _log_skipped("scrape_failed", hit.url, log_file)
             return None
-    
-    # Extract metadata (date)
-    try:
-        meta = extract_metadata(html)
-        scraped_date = meta.get("date")
-    except Exception:
-        scraped_date = None
 
     return VerifiedArticle(
         title=hit.title,
@@ -123,45 +152,149 @@ def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArt
         snippet=hit.snippet,
         content=content,
         published=hit.published,
-        scraped_published_date=scraped_date,
+        scraped_published_date=page.published_date,
     )
 
 
-def process_hits(hits: List[ArticleHit], limit: int, log_file: Path) -> List[VerifiedArticle]:
+async def _aprocess_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArticle]:
+    if not hit.url:
+        _log_skipped("missing_url", "", log_file)
+        return None
+
+    # One fetch, one parse: verification verdicts, text and date come together
+    try:
+        page = await averify_page(hit.url)
+    except Exception:
+        page = None
+
+    return _finish_hit(hit, page, log_file)
+
+
+def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArticle]:
+    return get_engine().run(_aprocess_single_hit(hit, log_file))
+
+
+async def _aprocess_hits(
+    hits: List[ArticleHit],
+    limit: int,
+    log_file: Path,
+    attempted: Optional[Set[str]] = None,
+    section: str = "",
+) -> List[VerifiedArticle]:
     verified: List[VerifiedArticle] = []
-    
-    # Parallelize verification to avoid 60s timeout
-    # Max 10 threads is a good balance for Vercel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit candidate tasks (fetch a bit more than limit to ensure we fill it)
-        candidates = hits[:limit * 3]
-        future_to_hit = {
-            executor.submit(_process_single_hit, hit, log_file): hit 
-            for hit in candidates
-        }
-        
-        for future in concurrent.futures.as_completed(future_to_hit):
+    if limit <= 0:
+        return verified
+
+    start = time.perf_counter()
+    # Submit candidate tasks (fetch a bit more than limit to ensure we fill it).
+    # Concurrency is bounded globally by the fetch engine, not per section.
+    candidates = hits[:limit * 3]
+    started: Dict[int, float] = {}
+
+    async def timed(i: int, hit: ArticleHit) -> Optional[VerifiedArticle]:
+        started[i] = time.perf_counter()
+        return await _aprocess_single_hit(hit, log_file)
+
+    tasks = [asyncio.ensure_future(timed(i, hit)) for i, hit in enumerate(candidates)]
+    order = {task: i for i, task in enumerate(tasks)}
+
+    pending = set(tasks)
+    while pending and len(verified) < limit:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in sorted(done, key=order.get):
+            if attempted is not None:
+                attempted.add(candidates[order[task]].url)
             try:
-                result = future.result()
-                if result:
-                    verified.append(result)
-                    
-                    # If we reached the limit, we can stop
-                    if len(verified) >= limit:
-                        break
+                result = task.result()
             except Exception as e:
                 # Log exception but don't crash
                 _log_skipped(f"exception_{type(e).__name__}", "", log_file)
-                
+                continue
+            if result:
+                verified.append(result)
+
+    # Quota met: abort the rest. Cancelling a task closes its HTTP stream and
+    # releases its engine slots; queued ones never start.
+    cancelled_at = time.perf_counter()
+    saved = max(
+        (max(0.0, VERIFY_TIMEOUT - (cancelled_at - started.get(order[task], cancelled_at))) for task in pending),
+        default=0.0,
+    )
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+        _log_skipped(f"cancelled_after_quota={len(pending)} est_saved={saved:.1f}s", "", log_file)
+
+    report = VerifyReport(
+        section=section,
+        verified=len(verified),
+        cancelled=len(pending),
+        seconds=time.perf_counter() - start,
+        saved_seconds=saved,
+    )
+    with _VERIFY_REPORTS_LOCK:
+        _VERIFY_REPORTS.append(report)
+    return verified
+
+
+def process_hits(
+    hits: List[ArticleHit],
+    limit: int,
+    log_file: Path,
+    attempted: Optional[Set[str]] = None,
+    section: str = "",
+) -> List[VerifiedArticle]:
+    """Verify hits until *limit* articles pass, then cancel the remaining fetches.
+
+    URLs whose verification finished (pass or fail) are added to *attempted*
+    when given, so a later retry can skip them. Cancelled ones are not.
+    """
+    verified = get_engine().run(_aprocess_hits(hits, limit, log_file, attempted, section))
     return verified[:limit]
 
 
-def process_section(key: str, days: int, max_per_stream: Optional[int] = None, lang: str = "en") -> List[SummaryItem]:
+def verify_report() -> List[VerifyReport]:
+    with _VERIFY_REPORTS_LOCK:
+        return list(_VERIFY_REPORTS)
+
+
+def reset_verify_report() -> None:
+    with _VERIFY_REPORTS_LOCK:
+        _VERIFY_REPORTS.clear()
+
+
+def process_section(
+    key: str,
+    days: int,
+    max_per_stream: Optional[int] = None,
+    lang: str = "en",
+    use_llm_cache: bool = True,
+) -> List[SummaryItem]:
     """Generate summaries for a single newsletter section.
 
-    This is the core function used by both the CLI and the Vercel API.
+    Blocking entry point used by the Vercel API; see :func:`aprocess_section`.
     Returns a list of SummaryItem dataclasses.
     """
+    return get_engine().run(aprocess_section(key, days, max_per_stream, lang, use_llm_cache))
+
+
+async def aprocess_section(
+    key: str,
+    days: int,
+    max_per_stream: Optional[int] = None,
+    lang: str = "en",
+    use_llm_cache: bool = True,
+    collect_executor: Optional[Executor] = None,
+) -> List[SummaryItem]:
+    """Generate summaries for a single newsletter section on the engine loop.
+
+    Collection (blocking search APIs) runs on *collect_executor*, whose
+    size bounds how many sections collect at once (a shared pool of
+    COLLECT_WORKERS by default); verification, rerank and summarization are
+    awaited, so every section's LLM calls can be in flight together under
+    the shared rate limiter.
+    """
     settings = get_settings()
     streams = get_streams(custom_limits=max_per_stream)
 
@@ -187,11 +320,42 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
     # Vercel Optimization: Originally limited to 1 attempt to avoid 60s timeout.
     # We are restoring it to 3 to ensure sections populate when standard search yields 0 hits.
     max_attempts = 3
-    
+    base_days = cfg.days or days
+
+    def collect(run_cfg: SectionConfig, window: int) -> List[ArticleHit]:
+        # 1. Collection
+        if key in collectors:
+            hits = collectors[key](run_cfg)
+        else:
+            hits = search_stream(run_cfg, window)
+
+        # 2. Section curation in one pass: reject keywords, then rank by
+        # freshness, source priority, source quality and boost keywords
+        hits = rank_hits(hits, run_cfg, window)
+
+        # 2c. Collapse URL variants and near-identical titles so verification
+        # only fetches distinct stories (the highest-priority copy is kept)
+        hits = canonicalize_hits(hits)
+
+        # 2d. Skip stories an earlier issue already featured
+        index = get_published_index()
+        if index is not None:
+            hits = index.filter_new(hits)
+        return hits
+
+    async def acollect(run_cfg: SectionConfig, window: int) -> List[ArticleHit]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(collect_executor or _collect_executor(), collect, run_cfg, window)
+
+    # Incremental retries: verification/rerank results carried between attempts
+    attempted: Set[str] = set()
+    verified_pool: List[VerifiedArticle] = []
+    rerank_scores: Dict[str, int] = {}
+
     for attempt in range(max_attempts):
         # Calculate dynamic settings for this attempt
         multiplier = 1 + attempt  # 1, 2, 3
-        current_days = (cfg.days or days) * multiplier
+        current_days = base_days * multiplier
         
         # Relax threshold on final attempt
         current_threshold = cfg.relevance_threshold
@@ -201,40 +365,36 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
         # Create temporary config for this run
         run_cfg = replace(cfg, days=current_days, relevance_threshold=current_threshold)
 
-        # 1. Collection
-        if key in collectors:
-            hits = collectors[key](run_cfg)
-        else:
-            hits = search_stream(run_cfg, current_days)
-
-        # Apply section-level curation pipeline:
-        hits = _filter_by_keywords(hits, run_cfg.reject_keywords)
-        hits = _boost_by_keywords(hits, run_cfg.boost_keywords)
-        
-        # 2b. Boost by historical source quality (SourceTracker)
-        hits = _boost_by_source_quality(hits)
-
-        # 2. Source priority (curated feeds first)
-        hits = _sort_by_source_priority(hits)
-        # 3. Time-decay (fresher articles rank higher within window)
-        hits = _apply_time_decay(hits, current_days)
+        hits = await acollect(run_cfg, current_days)
 
         _log_skipped(f"section_{key}_attempt_{attempt}_hits={len(hits)}", "", log_file)
 
-        verified = process_hits(hits, run_cfg.limit * 2, log_file)
+        if INCREMENTAL_RETRIES:
+            # Only candidates not verified by an earlier attempt cost fetches
+            new_hits = [h for h in hits if h.url not in attempted]
+            needed = run_cfg.limit * 2 - len(verified_pool)
+            verified_pool += (await _aprocess_hits(new_hits, needed, log_file, attempted, section=key))[:needed]
+            verified = list(verified_pool)
+        else:
+            limit = run_cfg.limit * 2
+            verified = (await _aprocess_hits(hits, limit, log_file, section=key))[:limit]
         verified = deduplicate(verified)
         verified = _filter_verified_articles_by_date(verified, current_days)
 
         # Rerank with potentially relaxed threshold
-        verified = rerank_articles(verified, run_cfg)
+        verified = await arerank_articles(
+            verified, run_cfg, score_cache=rerank_scores if INCREMENTAL_RETRIES else None,
+            use_cache=use_llm_cache,
+        )
         verified = verified[:run_cfg.limit]
 
-        items = summarize_section(
+        items = await asummarize_section(
             run_cfg.name, verified,
             require_date=run_cfg.require_date,
             section_key=key,
             lang=lang,
             relevance_threshold=run_cfg.relevance_threshold,
+            use_cache=use_llm_cache,
         )
 
         # Filter by date window (LLM hallucination check)
@@ -248,10 +408,11 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
                 print(f"  [OK] {key} populated on retry #{attempt} (days={current_days}, thresh={current_threshold})")
             
             # Record source quality
-            tracker = SourceTracker()
-            for item in final_items:
-                if item.Live_Link and item.Relevance:
-                    tracker.record(item.Live_Link, item.Relevance)
+            tracker = get_source_tracker()
+            tracker.record_many(
+                (item.Live_Link, item.Relevance) for item in final_items if item.Live_Link and item.Relevance
+            )
+            tracker.flush()
             
             return final_items
             
@@ -260,6 +421,36 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
     return [] # Failed all attempts
 
 
+async def agenerate_sections(
+    keys: List[str],
+    days: int,
+    max_per_stream: Optional[int] = None,
+    lang: str = "en",
+    use_llm_cache: bool = True,
+    workers: int = 4,
+) -> Tuple[Dict[str, List[SummaryItem]], Dict[str, float]]:
+    """Run every section concurrently; returns items and seconds per section key.
+
+    A failing section is reported and yields no items, as before.
+    """
+    async def run(key: str):
+        start = time.perf_counter()
+        try:
+            items = await aprocess_section(key, days, max_per_stream, lang, use_llm_cache, collect_pool)
+        except Exception as exc:
+            click.echo(f"  [ERROR] {key} generated an exception: {exc}")
+            items = []
+        else:
+            status = "SKIPPED" if not items else "OK"
+            detail = "returned 0 items" if not items else f"done ({len(items)} items)"
+            click.echo(f"  [{status}] {key} {detail} in {time.perf_counter() - start:.1f}s")
+        return key, items, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="collect") as collect_pool:
+        done = await asyncio.gather(*(run(key) for key in keys))
+    return {key: items for key, items, _ in done}, {key: seconds for key, _, seconds in done}
+
+
 def _filter_verified_articles_by_date(articles: List[VerifiedArticle], days: int) -> List[VerifiedArticle]:
     """Remove articles where the scraped date is definitely older than the search window."""
     cutoff = datetime.utcnow() - timedelta(days=days)
@@ -326,43 +517,124 @@ def _filter_items_by_date(items: List[SummaryItem], days: int) -> List[SummaryIt
     return filtered
 
 
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process, or ``None`` where unsupported (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _report_fetch_stats() -> None:
+    stats = get_engine().stats()
+    peak = _peak_rss_mb()
+    click.echo(
+        f"Fetched {stats['responses']} pages: {stats['bytes_on_wire'] / 1_000_000:.1f} MB on the wire, "
+        f"{stats['truncated']} truncated at the byte budget, {stats['rejected_early']} rejected before the body"
+        + (f"; peak RSS {peak:.0f} MB" if peak is not None else "")
+    )
+    negative = get_negative_cache()
+    if negative is not None and (negative.skipped or negative.skipped_by_domain):
+        click.echo(
+            f"Skipped {negative.skipped} links rejected by earlier runs and "
+            f"{negative.skipped_by_domain} on always-paywalled domains"
+        )
+
+
+def _report_source_latency() -> None:
+    """Per-source collection latency, slowest first; late sources are flagged."""
+    reports = sorted(latency_report(), key=lambda r: r.seconds, reverse=True)
+    if not reports:
+        return
+    click.echo("Source latency (slowest first):")
+    for r in reports:
+        flag = "" if r.status == "ok" else f"  [{r.status.upper()}]"
+        click.echo(f"  {r.name:<40} {r.seconds:6.2f}s{flag}")
+
+
+def _report_verification() -> None:
+    """Per-section verification time and the fetches cancelled once quotas were met."""
+    totals: Dict[str, List[float]] = OrderedDict()
+    for r in verify_report():
+        t = totals.setdefault(r.section, [0, 0, 0.0, 0.0])
+        t[0] += r.verified
+        t[1] += r.cancelled
+        t[2] += r.seconds
+        t[3] += r.saved_seconds
+    if not totals:
+        return
+    click.echo("Verification (per section):")
+    for section, (verified, cancelled, seconds, saved) in totals.items():
+        click.echo(
+            f"  {section:<16} {int(verified):3d} verified in {seconds:6.2f}s, "
+            f"{int(cancelled)} cancelled (~{saved:.1f}s saved, estimated from timeout budgets)"
+        )
+
+
+def _report_llm() -> None:
+    """LLM cache effectiveness, connections the shared Groq client opened and rate-limit waits."""
+    llm_cache = get_llm_cache()
+    if llm_cache is not None:
+        stats = llm_cache.stats()
+        click.echo(
+            f"LLM cache: {stats['hits']} hits, {stats['misses']} misses"
+            + (f", {stats['bypassed']} bypassed" if stats["bypassed"] else "")
+        )
+    conn = connect_stats()
+    if conn["requests"]:
+        click.echo(
+            f"LLM calls: {conn['requests']} requests over {conn['connections']} connections, "
+            f"{conn['connect_seconds']:.2f}s connecting"
+        )
+    limits = rate_limit_stats()
+    if limits["calls"]:
+        click.echo(
+            f"LLM rate limiter: {limits['waited_seconds']:.1f}s waiting over {limits['calls']} calls, "
+            f"{limits['rate_limited']} rate-limited"
+        )
+
+
 @click.command()
 @click.option("--since-days", default=None, type=int, help="How many days back to search.")
 @click.option("--date", "run_date", default=None, help="Override date string YYYY-MM-DD.")
 @click.option("--max-per-stream", default=None, type=int, help="Override max items per stream.")
 @click.option("--dry-run", is_flag=True, default=False, help="Write HTML only, skip Outlook.")
 @click.option("--lang", default="en", type=click.Choice(["en", "fr"]), help="Output language.")
-@click.option("--workers", default=4, type=int, help="Number of parallel workers.")
-def main(since_days, run_date, max_per_stream, dry_run, lang, workers):
+@click.option("--workers", default=4, type=int, help="Sections collecting search results at once.")
+@click.option("--no-llm-cache", is_flag=True, default=False,
+              help="Call the LLM even for prompts answered before (fresh responses are still cached).")
+def main(since_days, run_date, max_per_stream, dry_run, lang, workers, no_llm_cache):
     settings = get_settings()
     days = since_days or settings.run_days
+    issue = run_date or date.today().isoformat()
 
     sections: Dict[str, List[SummaryItem]] = OrderedDict()
+    published = PublishedIndex.load(issue=issue) if INDEX_ENABLED else None
+    set_published_index(published)
     
-    click.echo(f"Starting generation with {workers} workers...")
-
-    # Use ThreadPoolExecutor for parallel section processing
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-        # Submit all tasks
-        future_to_section = {
-            executor.submit(process_section, key, days, max_per_stream, lang): key
-            for key in SECTION_ORDER
-        }
-        
-        # Collect results as they complete
-        results = {}
-        for future in concurrent.futures.as_completed(future_to_section):
-            key = future_to_section[future]
-            try:
-                data = future.result()
-                results[key] = data
-                if len(data) == 0:
-                    click.echo(f"  [SKIPPED] {key} returned 0 items")
-                else:
-                    click.echo(f"  [OK] {key} done ({len(data)} items)")
-            except Exception as exc:
-                click.echo(f"  [ERROR] {key} generated an exception: {exc}")
-                results[key] = []
+    click.echo(f"Starting generation with {workers} collection workers...")
+    get_engine().reset_stats()
+    reset_latency_report()
+    reset_verify_report()
+    llm_cache = get_llm_cache()
+    if llm_cache is not None:
+        llm_cache.reset_stats()
+    reset_connect_stats()
+
+    # Every section runs as a task on the engine loop: collections share
+    # *workers* threads, LLM calls share the rate limiter
+    started = time.perf_counter()
+    results, section_seconds = get_engine().run(
+        agenerate_sections(SECTION_ORDER, days, max_per_stream, lang, not no_llm_cache, workers)
+    )
+    wall = time.perf_counter() - started
+    click.echo(
+        f"Sections: {len(SECTION_ORDER)} in {wall:.1f}s wall time "
+        f"({sum(section_seconds.values()):.1f}s summed across sections)"
+    )
 
     # Reassemble in correct order
     for key in SECTION_ORDER:
@@ -372,9 +644,9 @@ def main(since_days, run_date, max_per_stream, dry_run, lang, workers):
     click.echo("  -> generating TL;DR...")
     all_items = [item for items in sections.values() for item in items]
     all_items.sort(key=lambda x: x.Relevance or 0, reverse=True)
-    tldr = generate_tldr(all_items[:6], lang=lang)
+    tldr = generate_tldr(all_items[:6], lang=lang, use_cache=not no_llm_cache)
 
-    html = render_newsletter(sections, run_date=run_date or date.today().isoformat(), tldr=tldr, lang=lang)
+    html = render_newsletter(sections, run_date=issue, tldr=tldr, lang=lang)
 
     suffix = f"-{lang}" if lang != "en" else ""
     output_path = settings.project_root / "output" / f"newsletter{suffix}.html"
@@ -383,6 +655,18 @@ def main(since_days, run_date, max_per_stream, dry_run, lang, workers):
 
     click.echo(f"Generated newsletter ({lang}) -> {output_path}")
 
+    if published is not None:
+        published.record(all_items)
+        published.save()
+        click.echo(f"Published index: {len(all_items)} stories recorded for {issue}")
+    negative = get_negative_cache()
+    if negative is not None:
+        negative.flush()  # the atexit hook never runs if the process is killed
+    _report_fetch_stats()
+    _report_source_latency()
+    _report_verification()
+    _report_llm()
+
 
 if __name__ == "__main__":
     main()
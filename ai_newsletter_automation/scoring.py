@@ -0,0 +1,122 @@
+"""Single-pass hit scoring — ranks collected hits with one sort.
+
+Replaces the chain of stable sorts (boost keywords → source quality →
+source priority → time decay), where each pass recomputed lowercase text or
+parsed dates and later sorts mostly overrode earlier ones. Every feature is
+computed once per hit, normalized to 0-1, and combined as a weighted sum:
+
+* ``keywords``  — share of the section's boost keywords in title + snippet
+* ``quality``   — SourceTracker boost for the domain
+* ``priority``  — curated sources (Google Alerts, RSS, arXiv) over web search
+* ``freshness`` — 1.0 published now, 0.0 at the edge of the window, 0.5 undated
+
+Sections override weights through ``SectionConfig.score_weights``.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .models import ArticleHit, SectionConfig
+from .search import _DEFAULT_SOURCE_PRIORITY, _SOURCE_PRIORITY, _parse_date_str
+from .source_quality import get_source_tracker
+
+log = logging.getLogger(__name__)
+
+# Freshness leads, as the time-decay sort used to run last; curated sources
+# next; quality and keywords break the remaining ties
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "freshness": 3.0,
+    "priority": 2.0,
+    "quality": 1.0,
+    "keywords": 1.0,
+}
+
+_UNDATED_FRESHNESS = 0.5  # neutral — don't penalize or reward undated articles
+
+
+@dataclass
+class ScoredHit:
+    hit: ArticleHit
+    score: float
+    features: Dict[str, float]  # per-feature values before weighting, for debugging
+
+
+def _weights(cfg: Optional[SectionConfig]) -> Dict[str, float]:
+    weights = dict(DEFAULT_WEIGHTS)
+    if cfg is not None and cfg.score_weights:
+        unknown = set(cfg.score_weights) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown score weights for {cfg.name}: {sorted(unknown)}")
+        weights.update(cfg.score_weights)
+    return weights
+
+
+def score_hits(
+    hits: List[ArticleHit],
+    cfg: Optional[SectionConfig] = None,
+    days: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[ScoredHit]:
+    """Drop hits matching the section's reject keywords and score the rest, best first.
+
+    *days* is the search window freshness is measured against; without it
+    every hit gets the neutral freshness. The sort is stable, so equal
+    scores keep collection order.
+    """
+    weights = _weights(cfg)
+    reject = [k.lower() for k in (cfg.reject_keywords or [])] if cfg else []
+    boost = [k.lower() for k in (cfg.boost_keywords or [])] if cfg else []
+    tracker = get_source_tracker() if weights["quality"] else None
+    now = now or datetime.utcnow()
+    quality_by_host: Dict[str, float] = {}  # pools repeat domains; one lookup (and URL parse) each
+
+    scored: List[ScoredHit] = []
+    for h in hits:
+        text = f"{h.title} {h.snippet}".lower()
+        if reject and any(k in text for k in reject):
+            continue
+
+        if days and days > 0:
+            pub = _parse_date_str(h.published)
+            if pub is None:
+                freshness = _UNDATED_FRESHNESS
+            else:
+                age_days = (now - pub).total_seconds() / 86400
+                freshness = max(0.0, 1.0 - age_days / days)
+        else:
+            freshness = _UNDATED_FRESHNESS
+
+        quality = 0.0
+        if tracker is not None:
+            host = h.url.split("/", 3)[2] if h.url.count("/") >= 2 else h.url
+            quality = quality_by_host.get(host)
+            if quality is None:
+                quality = quality_by_host[host] = tracker.get_boost(h.url)
+
+        priority = _SOURCE_PRIORITY.get(h.source or "", _DEFAULT_SOURCE_PRIORITY)
+        features = {
+            "freshness": min(1.0, freshness),
+            "priority": 1.0 - priority / _DEFAULT_SOURCE_PRIORITY,
+            "quality": quality,
+            "keywords": sum(1 for k in boost if k in text) / len(boost) if boost else 0.0,
+        }
+        score = sum(weights[name] * value for name, value in features.items())
+        scored.append(ScoredHit(hit=h, score=score, features=features))
+
+    scored.sort(key=lambda s: s.score, reverse=True)
+    if scored and log.isEnabledFor(logging.DEBUG):
+        for s in scored[:5]:
+            log.debug("score %.2f %s %s", s.score, s.features, s.hit.url)
+    return scored
+
+
+def rank_hits(
+    hits: List[ArticleHit],
+    cfg: Optional[SectionConfig] = None,
+    days: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[ArticleHit]:
+    """The hits of :func:`score_hits`, best first, without their scores."""
+    return [s.hit for s in score_hits(hits, cfg, days, now)]
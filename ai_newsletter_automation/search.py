@@ -1,15 +1,22 @@
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Iterable
+from typing import Callable, Dict, List, Optional, Iterable
 
 import requests
 import feedparser
 from urllib.parse import urlparse, urlunparse, parse_qs, unquote
 from duckduckgo_search import DDGS
 
+from .cache import get_feed_cache, get_hn_item_cache
 from .config import get_settings
+from .fanout import FEED_TIMEOUT, SOURCE_TIMEOUT, fan_out
+from .http_client import get_session
 from .models import ArticleHit, SectionConfig
-from .source_quality import SourceTracker
+from .source_quality import get_source_tracker
 
 
 # ── Domain blocklist — evergreen / non-news pages that pollute results ──
@@ -139,10 +146,25 @@ def _dedupe(hits: List[ArticleHit]) -> List[ArticleHit]:
     return unique
 
 
+# Fractional seconds sit between the time and the UTC offset; dropping them
+# keeps the offset (slicing to 25 characters would cut it off instead).
+_ISO_FRACTION = re.compile(r"(?<=\d{2}:\d{2}:\d{2})[.,]\d+")
+
+
 def _parse_date_str(date_str: Optional[str]) -> Optional[datetime]:
     """Best-effort parse of a date string into a datetime object."""
     if not date_str:
         return None
+    text = date_str.strip()
+    if text[:4].isdigit():
+        # ISO 8601 (most feeds and APIs) — fromisoformat is far cheaper than strptime
+        try:
+            dt = datetime.fromisoformat(_ISO_FRACTION.sub("", text, count=1).replace("Z", "+00:00"))
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+            return dt
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%a, %d %b %Y %H:%M:%S %z",
                 "%a, %d %b %Y %H:%M:%S", "%Y-%m-%dT%H:%M:%S%z",
                 "%Y-%m-%dT%H:%M:%SZ"):
@@ -225,15 +247,12 @@ def _boost_by_source_quality(hits: List[ArticleHit]) -> List[ArticleHit]:
     
     Uses SourceTracker to get a quality boost (0.0-1.0) for each domain.
     """
-    tracker = SourceTracker()
-    
-    # Cache boosts to avoid repeated disk reads if SourceTracker wasn't cached
-    # (SourceTracker implementation reads JSON on every record/get_boost call in current form,
-    # but for a batch sort we can just call it. Optimization: SourceTracker could cache data)
-    
+    tracker = get_source_tracker()
+
+    # Served from the tracker's in-memory snapshot — no disk access per hit
     def score(h: ArticleHit) -> float:
         return tracker.get_boost(h.url)
-        
+
     # Stable sort: high boost first
     return sorted(hits, key=score, reverse=True)
 
@@ -282,6 +301,86 @@ def _apply_time_decay(hits: List[ArticleHit], days: int) -> List[ArticleHit]:
     return sorted(hits, key=freshness, reverse=True)
 
 
+# ── Feed polling (conditional GET + cached entries) ──
+
+
+# Entry fields the collectors read — everything else is dropped before caching
+_FEED_ENTRY_FIELDS = ("title", "link", "summary", "published", "published_parsed", "updated_parsed")
+
+
+def _serialize_entry(entry) -> dict:
+    out = {}
+    present = entry.keys()  # avoids feedparser's deprecated updated→published key aliasing
+    for field in _FEED_ENTRY_FIELDS:
+        value = entry[field] if field in present else None
+        if value is None:
+            continue
+        # time.struct_time → list so it survives JSON; collectors only slice [:6]
+        out[field] = list(value) if field.endswith("_parsed") else value
+    return out
+
+
+def _parse_feed(url: str, timeout: int = 15) -> List[dict]:
+    """Return the entries of an RSS/Atom feed, polling it with a conditional GET.
+
+    The last ETag / Last-Modified and the parsed entries are cached per feed
+    URL. A 304 answer reuses the cached entries without re-parsing, and a
+    feed polled within the freshness window is not requested at all.
+    """
+    cache = get_feed_cache()
+    cached = cache.get_entry(url) if cache is not None else None
+    if cached is not None and cache.is_fresh(cached):
+        cache.hits += 1
+        return cached["value"]["entries"]
+
+    headers = {}
+    if cached is not None:
+        if cached["value"].get("etag"):
+            headers["If-None-Match"] = cached["value"]["etag"]
+        if cached["value"].get("modified"):
+            headers["If-Modified-Since"] = cached["value"]["modified"]
+
+    try:
+        resp = get_session().get(url, headers=headers, timeout=timeout)
+    except requests.RequestException:
+        # Network hiccup — stale entries beat an empty section
+        return cached["value"]["entries"] if cached is not None else []
+
+    if resp.status_code == 304 and cached is not None:
+        cache.hits += 1
+        cache.touch(url)
+        return cached["value"]["entries"]
+    if resp.status_code != 200:
+        return cached["value"]["entries"] if cached is not None else []
+
+    if cache is not None:
+        cache.misses += 1
+    feed = feedparser.parse(
+        resp.content,
+        response_headers={
+            "content-location": resp.url,
+            "content-type": resp.headers.get("Content-Type", ""),
+        },
+    )
+    entries = [_serialize_entry(e) for e in feed.entries]
+    if cache is not None:
+        cache.set(url, {
+            "etag": resp.headers.get("ETag"),
+            "modified": resp.headers.get("Last-Modified"),
+            "entries": entries,
+        })
+    return entries
+
+
+def _fetch_feeds(urls: List[str]) -> List[List[dict]]:
+    """Poll several feeds concurrently; returns entry lists in *urls* order.
+
+    Feeds that fail or miss FEED_TIMEOUT contribute an empty list.
+    """
+    results = fan_out({url: (lambda u=url: _parse_feed(u)) for url in urls}, timeout=FEED_TIMEOUT, pool="feeds")
+    return [results.get(url, []) for url in urls]
+
+
 # ── Tavily search ──
 
 
@@ -301,7 +400,7 @@ def search_stream(section: SectionConfig, days: int) -> List[ArticleHit]:
     hits: List[ArticleHit] = []
 
     try:
-        resp = requests.post("https://api.tavily.com/search", json=payload, timeout=20)
+        resp = get_session().post("https://api.tavily.com/search", json=payload, timeout=20)
         resp.raise_for_status()
         data = resp.json()
         
@@ -358,38 +457,73 @@ HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 AI_KEYWORDS = ("ai", "artificial", "llm", "model", "gpt", "transformer", "openai", "anthropic", "gemini")
 
 
+HN_FETCH_WORKERS = int(os.getenv("HN_FETCH_WORKERS", "16"))  # concurrent /item requests (also the batch size)
+_HN_ITEM_FIELDS = ("id", "type", "title", "url", "time")
+_HN_SETTLED_SECONDS = 24 * 3600  # only cache items old enough that edits have stopped
+
+
+def _fetch_hn_item(story_id: int) -> Optional[dict]:
+    """One HN item (trimmed to the fields we use), from the item cache when possible."""
+    cache = get_hn_item_cache()
+    key = str(story_id)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    try:
+        item = get_session().get(f"{HN_API_BASE}/item/{story_id}.json", timeout=5).json()
+    except Exception:
+        return None
+    if not isinstance(item, dict):
+        return None
+    item = {k: item[k] for k in _HN_ITEM_FIELDS if k in item}
+    if cache is not None and time.time() - item.get("time", 0) > _HN_SETTLED_SECONDS:
+        cache.set(key, item)
+    return item
+
+
+def _hn_hit(story_id: int, item: Optional[dict], cutoff_ts: float) -> Optional[ArticleHit]:
+    if not item:
+        return None
+    title = item.get("title", "")
+    if not title or not any(k in title.lower() for k in AI_KEYWORDS):
+        return None
+    # Date filter: reject items older than the search window
+    item_time = item.get("time", 0)
+    if item_time < cutoff_ts:
+        return None
+    url = item.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
+    if _is_blocked_url(url):
+        return None
+    pub_dt = datetime.utcfromtimestamp(item_time)
+    return ArticleHit(
+        title=title, url=url, snippet="Hacker News trending",
+        published=pub_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+    )
+
+
 def fetch_hn_trending(limit: int = 30, days: int = 7) -> List[ArticleHit]:
     cutoff_ts = (datetime.utcnow() - timedelta(days=days)).timestamp()
     try:
-        top_ids = requests.get(f"{HN_API_BASE}/topstories.json", timeout=10).json()[: limit * 2]
-        best_ids = requests.get(f"{HN_API_BASE}/beststories.json", timeout=10).json()[: limit]
+        top_ids = get_session().get(f"{HN_API_BASE}/topstories.json", timeout=10).json()[: limit * 2]
+        best_ids = get_session().get(f"{HN_API_BASE}/beststories.json", timeout=10).json()[: limit]
         ids = list(dict.fromkeys(top_ids + best_ids))
     except Exception:
         return []
 
+    # Items are fetched in ranked batches of HN_FETCH_WORKERS so hits keep the
+    # original order and we stop requesting as soon as `limit` are found.
     hits: List[ArticleHit] = []
-    for story_id in ids:
-        try:
-            item = requests.get(f"{HN_API_BASE}/item/{story_id}.json", timeout=5).json()
-            title = item.get("title", "")
-            if not title or not any(k in title.lower() for k in AI_KEYWORDS):
-                continue
-            # Date filter: reject items older than the search window
-            item_time = item.get("time", 0)
-            if item_time < cutoff_ts:
-                continue
-            url = item.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
-            if _is_blocked_url(url):
-                continue
-            pub_dt = datetime.utcfromtimestamp(item_time)
-            hits.append(ArticleHit(
-                title=title, url=url, snippet="Hacker News trending",
-                published=pub_dt.strftime("%Y-%m-%dT%H:%M:%S"),
-            ))
-            if len(hits) >= limit:
-                break
-        except Exception:
-            continue
+    with ThreadPoolExecutor(max_workers=HN_FETCH_WORKERS, thread_name_prefix="hn") as pool:
+        for start in range(0, len(ids), HN_FETCH_WORKERS):
+            batch = ids[start:start + HN_FETCH_WORKERS]
+            for story_id, item in zip(batch, pool.map(_fetch_hn_item, batch)):
+                hit = _hn_hit(story_id, item, cutoff_ts)
+                if hit is None:
+                    continue
+                hits.append(hit)
+                if len(hits) >= limit:
+                    return hits
     return hits
 
 
@@ -397,11 +531,11 @@ def fetch_producthunt_trending(limit: int = 10, days: int = 7) -> List[ArticleHi
     rss_url = "https://www.producthunt.com/feeds/topic/artificial-intelligence"
     cutoff = datetime.utcnow() - timedelta(days=days)
     try:
-        feed = feedparser.parse(rss_url)
+        entries = _parse_feed(rss_url)
     except Exception:
         return []
     hits: List[ArticleHit] = []
-    for entry in feed.entries[:limit * 2]:
+    for entry in entries[:limit * 2]:
         # Date filter
         published = entry.get("published_parsed") or entry.get("updated_parsed")
         if published:
@@ -467,12 +601,9 @@ GOOGLE_ALERT_FEEDS: Dict[str, List[str]] = {
 def fetch_curated_feeds(limit: int = 10, days: int = 7) -> List[ArticleHit]:
     hits: List[ArticleHit] = []
     cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in CURATED_FEEDS:
-        try:
-            feed = feedparser.parse(url)
-        except Exception:
-            continue
-        for entry in feed.entries:
+    # Feeds are polled concurrently, then consumed in CURATED_FEEDS order
+    for entries in _fetch_feeds(CURATED_FEEDS):
+        for entry in entries:
             published = entry.get("published_parsed") or entry.get("updated_parsed")
             if published:
                 pub_dt = datetime(*published[:6])
@@ -522,12 +653,8 @@ def fetch_google_alerts(section_key: str, limit: int = 15, days: int = 7) -> Lis
         return []
     hits: List[ArticleHit] = []
     cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in urls:
-        try:
-            feed = feedparser.parse(url)
-        except Exception:
-            continue
-        for entry in feed.entries:
+    for entries in _fetch_feeds(urls):
+        for entry in entries:
             published = entry.get("published_parsed") or entry.get("updated_parsed")
             if published:
                 pub_dt = datetime(*published[:6])
@@ -553,15 +680,25 @@ def fetch_google_alerts(section_key: str, limit: int = 15, days: int = 7) -> Lis
     return _dedupe(hits)
 
 
-def collect_trending(days: int) -> List[ArticleHit]:
+def _collect(sources: Dict[str, Callable[[], List[ArticleHit]]]) -> List[ArticleHit]:
+    """Run a collector's sources concurrently; hits keep the *sources* priority order."""
+    results = fan_out(sources, timeout=SOURCE_TIMEOUT)
     hits: List[ArticleHit] = []
-    hits.extend(fetch_google_alerts("trending", limit=10, days=days))
-    hits.extend(fetch_hn_trending(limit=20, days=days))
-    hits.extend(fetch_producthunt_trending(limit=10, days=days))
-    hits.extend(fetch_curated_feeds(limit=15, days=days))
+    for name in sources:
+        hits.extend(results.get(name, []))
+    return hits
+
+
+def collect_trending(days: int) -> List[ArticleHit]:
     # Tavily fallback
     trending_cfg = SectionConfig(name="Trending AI", query='"AI" AND ("top news" OR trending) AND week', limit=8)
-    hits.extend(search_stream(trending_cfg, days))
+    hits = _collect({
+        "google_alerts:trending": lambda: fetch_google_alerts("trending", limit=10, days=days),
+        "hacker_news": lambda: fetch_hn_trending(limit=20, days=days),
+        "product_hunt": lambda: fetch_producthunt_trending(limit=10, days=days),
+        "curated_feeds": lambda: fetch_curated_feeds(limit=15, days=days),
+        "tavily:trending": lambda: search_stream(trending_cfg, days),
+    })
     return _dedupe(hits)
 
 
@@ -578,8 +715,8 @@ def collect_research(days: int) -> List[ArticleHit]:
     cutoff = datetime.utcnow() - timedelta(days=days)
     hits: List[ArticleHit] = []
     try:
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
+        entries = _parse_feed(url)
+        for entry in entries:
             published = entry.get("published_parsed")
             if published:
                 pub_dt = datetime(*published[:6])
@@ -611,11 +748,11 @@ def _fetch_pwc_trending(limit: int = 10, days: int = 30) -> List[ArticleHit]:
     rss_url = "https://paperswithcode.com/trending?format=rss"
     cutoff = datetime.utcnow() - timedelta(days=days)
     try:
-        feed = feedparser.parse(rss_url)
+        entries = _parse_feed(rss_url)
     except Exception:
         return []
     hits: List[ArticleHit] = []
-    for entry in feed.entries[:limit * 2]:
+    for entry in entries[:limit * 2]:
         # Date filter
         published = entry.get("published_parsed") or entry.get("updated_parsed")
         if published:
@@ -643,10 +780,11 @@ def _fetch_pwc_trending(limit: int = 10, days: int = 30) -> List[ArticleHit]:
 
 
 def collect_ai_progress(days: int) -> List[ArticleHit]:
-    hits: List[ArticleHit] = []
-    hits.extend(_fetch_pwc_trending(limit=15, days=days))
-    # Tavily fallback — PapersWithCode RSS is often empty for short windows
-    hits.extend(search_stream(DEFAULT_STREAMS["ai_progress"], days))
+    hits = _collect({
+        "paperswithcode": lambda: _fetch_pwc_trending(limit=15, days=days),
+        # Tavily fallback — PapersWithCode RSS is often empty for short windows
+        "tavily:ai_progress": lambda: search_stream(DEFAULT_STREAMS["ai_progress"], days),
+    })
     return _dedupe(hits)
 
 
@@ -655,9 +793,10 @@ def collect_ai_progress(days: int) -> List[ArticleHit]:
 
 def collect_indian(days: int) -> List[ArticleHit]:
     """Prioritise Google Alert RSS for Indian AI news, Tavily as fallback."""
-    hits: List[ArticleHit] = []
-    hits.extend(fetch_google_alerts("indian", limit=10, days=days))
-    hits.extend(search_stream(DEFAULT_STREAMS["indian"], days))
+    hits = _collect({
+        "google_alerts:indian": lambda: fetch_google_alerts("indian", limit=10, days=days),
+        "tavily:indian": lambda: search_stream(DEFAULT_STREAMS["indian"], days),
+    })
     return _dedupe(hits)
 
 
@@ -667,9 +806,10 @@ def collect_indian(days: int) -> List[ArticleHit]:
 
 def collect_global(days: int) -> List[ArticleHit]:
     """Prioritise Google Alert RSS for global AI policy news, Tavily as fallback."""
-    hits: List[ArticleHit] = []
-    hits.extend(fetch_google_alerts("global", limit=10, days=days))
-    hits.extend(search_stream(DEFAULT_STREAMS["global"], days))
+    hits = _collect({
+        "google_alerts:global": lambda: fetch_google_alerts("global", limit=10, days=days),
+        "tavily:global": lambda: search_stream(DEFAULT_STREAMS["global"], days),
+    })
     return _dedupe(hits)
 
 
@@ -692,10 +832,9 @@ def _fetch_event_feeds(days: int) -> List[ArticleHit]:
     """Fetch AI event announcements from RSS feeds."""
     hits: List[ArticleHit] = []
     cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in EVENT_FEEDS:
+    for entries in _fetch_feeds(EVENT_FEEDS):
         try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:10]:
+            for entry in entries[:10]:
                 title = entry.get("title", "").lower()
                 # only keep entries that look event-related
                 if not any(k in title for k in ("conference", "summit", "event", "webinar", "workshop", "meetup", "hackathon", "ai", "ml")):
@@ -726,20 +865,11 @@ def _fetch_event_feeds(days: int) -> List[ArticleHit]:
 
 def collect_events(days: int) -> List[ArticleHit]:
     """Search for upcoming AI events — multiple sources for resilience."""
-    hits: List[ArticleHit] = []
-
-    # RSS feeds first
-    try:
-        hits.extend(_fetch_event_feeds(days))
-    except Exception:
-        pass
-
-    # Multiple Tavily queries as fallback
-    for query_cfg in EVENT_QUERIES:
-        try:
-            hits.extend(search_stream(query_cfg, days))
-        except Exception:
-            continue
+    # RSS feeds first, then multiple Tavily queries as fallback — all in flight together
+    sources: Dict[str, Callable[[], List[ArticleHit]]] = {"event_feeds": lambda: _fetch_event_feeds(days)}
+    for i, query_cfg in enumerate(EVENT_QUERIES):
+        sources[f"tavily:events_{i}"] = lambda c=query_cfg: search_stream(c, days)
+    hits = _collect(sources)
 
     # Original default query as final fallback
     if not hits:
@@ -759,17 +889,13 @@ REPORT_FEEDS = [
 ]
 
 
-def collect_deep_dive(days: int) -> List[ArticleHit]:
-    """Search for in-depth AI reports from OECD, Anthropic, MIT, METR, NIST, etc."""
+def _fetch_report_feeds(days: int) -> List[ArticleHit]:
+    """RSS feeds from report-publishing orgs."""
     hits: List[ArticleHit] = []
-    # Tavily search
-    hits.extend(search_stream(DEFAULT_STREAMS["deep_dive"], days))
-    # RSS feeds from report-publishing orgs
     cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in REPORT_FEEDS:
+    for entries in _fetch_feeds(REPORT_FEEDS):
         try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:8]:
+            for entry in entries[:8]:
                 published = entry.get("published_parsed") or entry.get("updated_parsed")
                 if published:
                     pub_dt = datetime(*published[:6])
@@ -791,6 +917,15 @@ def collect_deep_dive(days: int) -> List[ArticleHit]:
                 )
         except Exception:
             continue
+    return hits
+
+
+def collect_deep_dive(days: int) -> List[ArticleHit]:
+    """Search for in-depth AI reports from OECD, Anthropic, MIT, METR, NIST, etc."""
+    hits = _collect({
+        "tavily:deep_dive": lambda: search_stream(DEFAULT_STREAMS["deep_dive"], days),
+        "report_feeds": lambda: _fetch_report_feeds(days),
+    })
     return _dedupe(hits)
 
 
@@ -1,43 +1,71 @@
-"""Source quality tracking — records domain-level relevance and feedback for auto-boosting."""
-
+"""Source quality tracking — records domain-level relevance and feedback for auto-boosting.
+
+History lives in a SQLite database (WAL journal, so section threads and the
+feedback API can write while others read). No raw scores are kept: each
+domain has one ``domain_quality`` row with an exponentially time-decayed
+score sum and weight (half-life ``HALF_LIFE_SECONDS``), so recording a score
+is O(1) and memory per domain is constant. The boost comes from their ratio,
+a decay-weighted average relevance, and a domain is forgotten once its
+weight decays below ``_MIN_WEIGHT``.
+
+A tracker reads those aggregates (and recent feedback flags) into memory
+once, so :meth:`SourceTracker.get_boost` never touches the disk. Scores
+passed to :meth:`SourceTracker.record_many` update the snapshot at once
+and reach the database in one transaction per :meth:`SourceTracker.flush`.
+The runner shares one tracker per process via :func:`get_source_tracker`.
+"""
+
+import atexit
 import json
 import logging
+import math
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 log = logging.getLogger(__name__)
 
-# Rolling window for quality data (seconds)
-_WINDOW_SECONDS = 90 * 24 * 3600  # 90 days
+# A score's weight halves every HALF_LIFE_SECONDS; a single score is
+# forgotten after three half-lives (weight 1/8), the old 90-day window
+HALF_LIFE_SECONDS = 30 * 24 * 3600
+_MIN_WEIGHT = 0.125
 _FEEDBACK_PENALTY_SECONDS = 7 * 24 * 3600  # 7-day penalty for flagged domains
 
-
-def _get_quality_path() -> Path:
-    """Quality data file — tries project logs first, falls back to /tmp."""
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domain_quality (
+    domain TEXT PRIMARY KEY,
+    score_sum REAL NOT NULL,
+    weight REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feedback (
+    domain TEXT NOT NULL,
+    url TEXT NOT NULL,
+    rating TEXT NOT NULL,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS feedback_by_domain ON feedback (domain, rating, timestamp);
+"""
+
+
+def _get_logs_path(filename: str) -> Path:
+    """File under the project logs — tries project logs first, falls back to /tmp."""
     try:
         from .config import get_settings
-        p = get_settings().project_root / "logs" / "source_quality.json"
+        p = get_settings().project_root / "logs" / filename
         p.parent.mkdir(parents=True, exist_ok=True)
         return p
     except Exception:
-        p = Path("/tmp") / "logs" / "source_quality.json"
+        p = Path("/tmp") / "logs" / filename
         p.parent.mkdir(parents=True, exist_ok=True)
         return p
 
 
-def _get_feedback_path() -> Path:
-    """Feedback data file — tries project logs first, falls back to /tmp."""
-    try:
-        from .config import get_settings
-        p = get_settings().project_root / "logs" / "feedback.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        return p
-    except Exception:
-        p = Path("/tmp") / "logs" / "feedback.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        return p
+def _get_db_path() -> Path:
+    return _get_logs_path("source_quality.db")
 
 
 def _extract_domain(url: str) -> str:
@@ -58,37 +86,171 @@ def _load_json(path: Path) -> List[dict]:
     return []
 
 
-def _save_json(path: Path, data: List[dict]) -> None:
-    try:
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    except OSError:
-        log.warning("Could not write source quality data to %s", path)
+def _decay(seconds: float) -> float:
+    """Weight left after *seconds* (1.0 for zero or negative ages)."""
+    return math.pow(0.5, max(0.0, seconds) / HALF_LIFE_SECONDS)
 
 
-class SourceTracker:
-    """Tracks domain-level quality scores from past newsletter runs."""
+def _fold(stats: Optional[List[float]], score_sum: float, weight: float, at: float) -> List[float]:
+    """Combine two decayed aggregates ``[score_sum, weight, updated_at]``, both decayed to the later time."""
+    if stats is None:
+        return [score_sum, weight, at]
+    ref = max(stats[2], at)
+    old, new = _decay(ref - stats[2]), _decay(ref - at)
+    return [stats[0] * old + score_sum * new, stats[1] * old + weight * new, ref]
+
+
+def _boost_from(avg: float, weight: float, flags: int) -> float:
+    """Boost for a decay-weighted average score whose current weight is *weight*."""
+    if weight < _MIN_WEIGHT:
+        return 0.0
+    # Normalize to 0-1 range (scores are 1-10, so (avg-5)/5 gives -0.8 to 1.0)
+    boost = max(0.0, (avg - 5.0) / 5.0)
+    # Each flag in the last 7 days adds 0.2 penalty, capped at 1.0
+    penalty = min(1.0, flags * 0.2)
+    return max(0.0, boost - penalty)
 
-    def __init__(self):
-        self._quality_path = _get_quality_path()
-        self._feedback_path = _get_feedback_path()
+
+class SourceTracker:
+    """Tracks domain-level quality scores from past newsletter runs.
+
+    Each tracker holds one connection and an in-memory snapshot, both
+    guarded by a lock; trackers in other processes coordinate through
+    SQLite's own locking, waiting up to 30 s for a writer to finish.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else _get_db_path()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.create_function("decay", 1, _decay, deterministic=True)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            log.warning("SQLite WAL mode unavailable for %s; using the default journal", self.path)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._migrate_json()
+        self._prune()
+        self._pending: List[dict] = []
+        self._stats: Dict[str, List[float]] = {}  # domain -> [score_sum, weight, updated_at]
+        self._flags: Dict[str, int] = {}  # domain -> "down" ratings in the penalty window
+        self._load_snapshot()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def _load_snapshot(self) -> None:
+        with self._lock:
+            self._stats = {
+                domain: [score_sum, weight, updated_at]
+                for domain, score_sum, weight, updated_at in self._conn.execute(
+                    "SELECT domain, score_sum, weight, updated_at FROM domain_quality"
+                )
+            }
+            self._flags = dict(self._conn.execute(
+                "SELECT domain, COUNT(*) FROM feedback WHERE rating = 'down' AND timestamp > ? GROUP BY domain",
+                (time.time() - _FEEDBACK_PENALTY_SECONDS,),
+            ))
+
+    # ── Maintenance ──
+
+    def _migrate_json(self) -> None:
+        """One-time import of the JSON files earlier versions wrote."""
+        legacy = [
+            (self.path.with_name("source_quality.json"), self._insert_scores, "domain", "score"),
+            (self.path.with_name("feedback.json"), self._insert_feedback, "domain", "rating"),
+        ]
+        for json_path, insert, *required in legacy:
+            if not json_path.exists():
+                continue
+            rows = [r for r in _load_json(json_path) if isinstance(r, dict) and all(k in r for k in required)]
+            with self._lock, self._conn:
+                insert(rows)
+            try:
+                json_path.rename(json_path.with_suffix(".json.migrated"))
+            except OSError:
+                log.warning("Could not rename migrated %s; it will be imported again", json_path)
+            log.info("Migrated %d rows from %s into %s", len(rows), json_path.name, self.path.name)
+
+    def _insert_scores(self, rows: List[dict]) -> None:
+        """Fold score rows into domain_quality (caller holds the transaction)."""
+        totals: Dict[str, List[float]] = {}
+        for r in rows:
+            totals[r["domain"]] = _fold(totals.get(r["domain"]), r["score"], 1.0, r.get("timestamp", time.time()))
+        # The same fold as _fold(), against whatever another process may have written since
+        self._conn.executemany(
+            "INSERT INTO domain_quality (domain, score_sum, weight, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(domain) DO UPDATE SET "
+            "score_sum = score_sum * decay(MAX(updated_at, excluded.updated_at) - updated_at)"
+            " + excluded.score_sum * decay(MAX(updated_at, excluded.updated_at) - excluded.updated_at), "
+            "weight = weight * decay(MAX(updated_at, excluded.updated_at) - updated_at)"
+            " + excluded.weight * decay(MAX(updated_at, excluded.updated_at) - excluded.updated_at), "
+            "updated_at = MAX(updated_at, excluded.updated_at)",
+            [(d, s, w, t) for d, (s, w, t) in totals.items()],
+        )
+
+    def _insert_feedback(self, rows: List[dict]) -> None:
+        self._conn.executemany(
+            "INSERT INTO feedback (domain, url, rating, timestamp) VALUES (?, ?, ?, ?)",
+            [(r["domain"], r.get("url", ""), r["rating"], r.get("timestamp", time.time())) for r in rows],
+        )
+
+    def _prune(self) -> None:
+        """Forget domains whose weight has decayed below _MIN_WEIGHT."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM domain_quality WHERE weight * decay(? - updated_at) < ?",
+                (time.time(), _MIN_WEIGHT),
+            )
+
+    # ── Recording ──
 
     def record(self, url: str, relevance_score: int) -> None:
-        """Record a relevance score for an article's domain."""
+        """Record a relevance score for an article's domain and write it immediately."""
+        self.record_many([(url, relevance_score)])
+        self.flush()
+
+    def record_many(self, scores: Iterable[Tuple[str, int]]) -> None:
+        """Queue (url, relevance score) pairs; the snapshot sees them now, the database on :meth:`flush`."""
+        now = time.time()
+        with self._lock:
+            for url, score in scores:
+                domain = _extract_domain(url)
+                if not domain:
+                    continue
+                self._pending.append({"domain": domain, "score": score, "timestamp": now})
+                self._stats[domain] = _fold(self._stats.get(domain), score, 1.0, now)
+
+    def flush(self) -> None:
+        """Write every queued score in one transaction (all or nothing)."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+            try:
+                with self._conn:
+                    self._insert_scores(rows)
+            except sqlite3.Error as e:
+                log.warning("Could not write source quality data to %s: %s", self.path, e)
+
+    def record_feedback(self, url: str, rating: str) -> None:
+        """Record user feedback (thumbs up/down) for an article's domain."""
         domain = _extract_domain(url)
         if not domain:
             return
+        try:
+            with self._lock, self._conn:
+                self._insert_feedback([{"domain": domain, "url": url, "rating": rating, "timestamp": time.time()}])
+                if rating == "down":
+                    self._flags[domain] = self._flags.get(domain, 0) + 1
+        except sqlite3.Error as e:
+            log.warning("Could not write feedback to %s: %s", self.path, e)
 
-        data = _load_json(self._quality_path)
-        data.append({
-            "domain": domain,
-            "score": relevance_score,
-            "timestamp": time.time(),
-        })
-
-        # Prune old entries
-        cutoff = time.time() - _WINDOW_SECONDS
-        data = [d for d in data if d.get("timestamp", 0) > cutoff]
-        _save_json(self._quality_path, data)
+    # ── Lookups ──
 
     def get_boost(self, url: str) -> float:
         """Get a quality boost (0.0-1.0) for a domain based on historical performance.
@@ -99,73 +261,57 @@ class SourceTracker:
         domain = _extract_domain(url)
         if not domain:
             return 0.0
-
-        # Check for recent negative feedback
-        penalty = self._get_penalty(domain)
-
-        # Calculate average score from history
-        data = _load_json(self._quality_path)
-        cutoff = time.time() - _WINDOW_SECONDS
-        scores = [
-            d["score"] for d in data
-            if d.get("domain") == domain and d.get("timestamp", 0) > cutoff
-        ]
-
-        if not scores:
-            return 0.0
-
-        avg = sum(scores) / len(scores)
-        # Normalize to 0-1 range (scores are 1-10, so (avg-5)/5 gives -0.8 to 1.0)
-        boost = max(0.0, (avg - 5.0) / 5.0)
-        return max(0.0, boost - penalty)
+        with self._lock:
+            stats = self._stats.get(domain)
+            if stats is None:
+                return 0.0
+            score_sum, weight, updated_at = stats
+            return _boost_from(score_sum / weight, weight * _decay(time.time() - updated_at), self._flags.get(domain, 0))
 
     def _get_penalty(self, domain: str) -> float:
-        """Check feedback log for recent negative flags on this domain."""
-        data = _load_json(self._feedback_path)
-        cutoff = time.time() - _FEEDBACK_PENALTY_SECONDS
-        recent_flags = [
-            d for d in data
-            if d.get("domain") == domain
-            and d.get("rating") == "down"
-            and d.get("timestamp", 0) > cutoff
-        ]
-        # Each flag in the last 7 days adds 0.2 penalty, capped at 1.0
-        return min(1.0, len(recent_flags) * 0.2)
-
-    def record_feedback(self, url: str, rating: str) -> None:
-        """Record user feedback (thumbs up/down) for an article's domain."""
-        domain = _extract_domain(url)
-        if not domain:
-            return
-
-        data = _load_json(self._feedback_path)
-        data.append({
-            "domain": domain,
-            "url": url,
-            "rating": rating,
-            "timestamp": time.time(),
-        })
-        _save_json(self._feedback_path, data)
+        """Penalty from recent negative flags on this domain."""
+        with self._lock:
+            return min(1.0, self._flags.get(domain, 0) * 0.2)
 
     def get_domain_stats(self) -> Dict[str, dict]:
-        """Get summary stats for all tracked domains (for debugging/dashboard)."""
-        data = _load_json(self._quality_path)
-        cutoff = time.time() - _WINDOW_SECONDS
+        """Get summary stats for all tracked domains (for debugging/dashboard).
 
-        stats: Dict[str, dict] = {}
-        for d in data:
-            if d.get("timestamp", 0) <= cutoff:
-                continue
-            domain = d.get("domain", "")
-            if domain not in stats:
-                stats[domain] = {"scores": [], "count": 0}
-            stats[domain]["scores"].append(d["score"])
-            stats[domain]["count"] += 1
-
-        # Compute averages
-        for domain, info in stats.items():
-            info["avg_score"] = sum(info["scores"]) / len(info["scores"])
-            info["boost"] = self.get_boost(f"https://{domain}/")
-            del info["scores"]  # Don't expose raw scores
-
-        return stats
+        ``weight`` is the decayed number of scores: 1.0 per score recorded
+        now, halving every HALF_LIFE_SECONDS.
+        """
+        now = time.time()
+        with self._lock:
+            stats = {}
+            for domain, (score_sum, weight, updated_at) in self._stats.items():
+                current = weight * _decay(now - updated_at)
+                if current < _MIN_WEIGHT:
+                    continue
+                avg = score_sum / weight
+                stats[domain] = {
+                    "weight": current,
+                    "avg_score": avg,
+                    "boost": _boost_from(avg, current, self._flags.get(domain, 0)),
+                }
+            return stats
+
+
+_TRACKER: Optional[SourceTracker] = None
+_TRACKER_LOCK = threading.Lock()
+
+
+def get_source_tracker() -> SourceTracker:
+    """Process-wide tracker; opened on first use and flushed at exit."""
+    global _TRACKER
+    if _TRACKER is None:
+        with _TRACKER_LOCK:
+            if _TRACKER is None:
+                _TRACKER = SourceTracker()
+                atexit.register(_TRACKER.flush)
+    return _TRACKER
+
+
+def set_source_tracker(tracker: Optional[SourceTracker]) -> None:
+    """Swap the process-wide tracker (tests point it at a temp database)."""
+    global _TRACKER
+    with _TRACKER_LOCK:
+        _TRACKER = tracker
@@ -1,12 +1,19 @@
+import hashlib
 import json
+import logging
 import time
-from typing import List
+from dataclasses import asdict, replace
+from typing import Dict, List, Optional
 
 import requests
 
+from .canonical import canonical_key, title_key
 from .config import get_settings
+from .llm_cache import get_llm_cache
 from .models import SummaryItem, VerifiedArticle
 
+log = logging.getLogger(__name__)
+
 
 SYSTEM_PROMPT_BASE = """You are the senior editorial analyst for "AI Weekly Digest,"
 a trusted weekly AI briefing read by Indian professionals and public servants.
@@ -101,54 +108,57 @@ def _parse_json(raw: str, relevance_threshold: int = 6) -> List[SummaryItem]:
     return items
 
 
-import groq
+from .fetch_engine import get_engine
+from .llm_client import get_async_groq_client
+from .rate_limit import achat_completion
+
 
 def _configure_groq():
-    settings = get_settings()
-    return groq.Groq(api_key=settings.groq_api_key)
+    """The shared async Groq client for the running loop (one connection pool)."""
+    return get_async_groq_client(get_settings().groq_api_key)
 
-def _groq_request(
+async def _agroq_request(
     system_prompt: str,
     user_prompt: str,
     model_name: str = "llama-3.3-70b-versatile",
     temperature: float = 0.1,
+    use_cache: bool = True,
 ) -> str:
+    cache = get_llm_cache()
+    if cache is not None:
+        cached = cache.get(model_name, system_prompt, user_prompt, temperature, use_cache=use_cache)
+        if cached is not None:
+            return cached
+    prompt_key = (model_name, system_prompt, user_prompt, temperature)
+
     client = _configure_groq()
-    
-    max_retries = 2
-    base_delay = 2
 
     # Instruct model to wrap the output in a JSON object property to use response_format check
     system_prompt = system_prompt + "\n\nCRITICAL: You must return the array as a JSON object with a single key 'items' containing the array. Do not return just a raw array."
 
-    for attempt in range(max_retries):
-        try:
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature,
-                max_tokens=4096,
-                response_format={"type": "json_object"},
-            )
-            raw = response.choices[0].message.content
-            # Unwrap the "items" key we forced it to use
-            try:
-                data = json.loads(raw)
-                if isinstance(data, dict) and "items" in data:
-                    return json.dumps(data.get("items", data))
-                return raw
-            except:
-                return raw
-        except groq.APIError as e:
-            if attempt == max_retries - 1:
-                raise
-            time.sleep(base_delay * (2 ** attempt)) # Exponential backoff
-        except Exception as e:
-            raise e
-    return "[]"
+    # Paced by the shared rate limiter, which also retries 429s and transient errors
+    response = await achat_completion(
+        client,
+        model_name,
+        [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        max_tokens=4096,
+        temperature=temperature,
+        response_format={"type": "json_object"},
+    )
+    raw = response.choices[0].message.content
+    # Unwrap the "items" key we forced it to use
+    try:
+        data = json.loads(raw)
+    except (TypeError, ValueError):
+        return raw  # not cached — a re-run may get valid JSON
+    if isinstance(data, dict) and "items" in data:
+        raw = json.dumps(data.get("items", data))
+    if cache is not None:
+        cache.put(*prompt_key, raw)
+    return raw
 
 def summarize_section(
     section_name: str,
@@ -158,6 +168,24 @@ def summarize_section(
     section_key: str = "",
     lang: str = "en",
     relevance_threshold: int = 6,
+    use_cache: bool = True,
+) -> List[SummaryItem]:
+    """Blocking :func:`asummarize_section` for the API handlers (runs on the fetch engine's loop)."""
+    return get_engine().run(asummarize_section(
+        section_name, articles, require_date=require_date, model=model, section_key=section_key,
+        lang=lang, relevance_threshold=relevance_threshold, use_cache=use_cache,
+    ))
+
+
+async def asummarize_section(
+    section_name: str,
+    articles: List[VerifiedArticle],
+    require_date: bool = False,
+    model: str = "llama-3.3-70b-versatile",
+    section_key: str = "",
+    lang: str = "en",
+    relevance_threshold: int = 6,
+    use_cache: bool = True,
 ) -> List[SummaryItem]:
     if not articles:
         return []
@@ -229,13 +257,68 @@ def summarize_section(
         system_prompt += "\n- Write ALL output in fluent, professional Japanese."
 
 
-    user_prompt = f"Section: {section_name}\nToday's date: {time.strftime('%Y-%m-%d')}\nSummarize the following verified articles:\n{_build_prompt(articles)}"
-
     if "gemini" in model or "llama-3." in model or "llama3" in model:
         model = "llama-3.3-70b-versatile"
 
-    raw = _groq_request(system_prompt, user_prompt, model_name=model)
-    return _parse_json(raw, relevance_threshold=relevance_threshold)
+    # Per-article memoization: only articles without a cached summary are sent
+    cache = get_llm_cache()
+    keys = [_article_cache_key(a, section_key, lang, model, system_prompt) for a in articles]
+    results: Dict[int, Optional[SummaryItem]] = {}  # article index -> item (None = skipped by the LLM)
+    if cache is not None:
+        for i, key in enumerate(keys):
+            value = cache.get_item(key, use_cache=use_cache)
+            if value is not None:
+                results[i] = SummaryItem(**value["item"]) if value.get("item") else None
+    pending = [i for i in range(len(articles)) if i not in results]
+
+    unmatched: List[SummaryItem] = []
+    if pending:
+        batch = [articles[i] for i in pending]
+        user_prompt = f"Section: {section_name}\nToday's date: {time.strftime('%Y-%m-%d')}\nSummarize the following verified articles:\n{_build_prompt(batch)}"
+        raw = await _agroq_request(system_prompt, user_prompt, model_name=model, use_cache=use_cache)
+        fresh = _parse_json(raw, relevance_threshold=0)  # threshold applied below, after merging
+
+        by_url = {canonical_key(articles[i].url): i for i in pending}
+        by_title = {title_key(articles[i].title): i for i in pending}
+        for item in fresh:
+            i = by_url.pop(canonical_key(item.Live_Link), None) if item.Live_Link else None
+            if i is None:
+                # Link rewritten by the LLM — fall back to an unchanged headline
+                i = by_title.get(title_key(item.Headline))
+                if i is None or canonical_key(articles[i].url) not in by_url:
+                    unmatched.append(item)  # not traceable to an article — returned, not cached
+                    continue
+                del by_url[canonical_key(articles[i].url)]
+            results[i] = item
+            if cache is not None:
+                cache.put_item(keys[i], {"item": asdict(item)})
+        if fresh and not unmatched and cache is not None:
+            # The LLM answered every article it kept and left these out (quality
+            # gates) — remember the verdict. With unmatched items, one of them may
+            # be a summary of these articles, so nothing is recorded as skipped.
+            for i in by_url.values():
+                results[i] = None
+                cache.put_item(keys[i], {"item": None})
+        log.info("Summarized %s: %d cached, %d sent to the LLM", section_key or section_name,
+                 len(articles) - len(pending), len(pending))
+
+    items = [
+        replace(results[i], Source_Title=articles[i].title)
+        for i in range(len(articles)) if results.get(i) is not None
+    ] + unmatched
+    return [it for it in items if (it.Relevance or 0) >= relevance_threshold]
+
+
+def _article_cache_key(article: VerifiedArticle, section_key: str, lang: str, model: str, system_prompt: str) -> str:
+    """Identity of one article's summary: canonical URL, content hash, section and language.
+
+    Model and a hash of the system prompt are included so a prompt edit
+    does not replay summaries written under the old rules.
+    """
+    content = "\n".join((article.title, article.published or "", article.snippet, article.content[:4000]))
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    prompt_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:12]
+    return f"summary|{canonical_key(article.url)}|{content_hash}|{section_key}|{lang}|{model}|{prompt_hash}"
 
 
 # ── TL;DR Executive Summary ──
@@ -257,6 +340,17 @@ def generate_tldr(
     top_items: List[SummaryItem],
     model: str = "llama-3.3-70b-versatile",
     lang: str = "en",
+    use_cache: bool = True,
+) -> List[str]:
+    """Blocking :func:`agenerate_tldr` for the CLI and API handlers."""
+    return get_engine().run(agenerate_tldr(top_items, model=model, lang=lang, use_cache=use_cache))
+
+
+async def agenerate_tldr(
+    top_items: List[SummaryItem],
+    model: str = "llama-3.3-70b-versatile",
+    lang: str = "en",
+    use_cache: bool = True,
 ) -> List[str]:
     """Generate 3-bullet TL;DR from the highest-relevance newsletter items."""
     if not top_items:
@@ -286,7 +380,7 @@ def generate_tldr(
         model = "llama-3.3-70b-versatile"
 
     try:
-        raw = _groq_request(sys_prompt, user_prompt, model_name=model)
+        raw = await _agroq_request(sys_prompt, user_prompt, model_name=model, use_cache=use_cache)
         bullets = json.loads(raw)
         if isinstance(bullets, list):
             return [str(b).strip() for b in bullets[:3]]
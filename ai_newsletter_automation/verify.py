@@ -1,99 +1,122 @@
-import re
-from typing import Iterable, Optional
-
-import requests
-from bs4 import BeautifulSoup
-
-PAYWALL_PHRASES: Iterable[str] = (
-    "subscribe to read",
-    "log in to continue",
-    "isaccessibleforfree\":false",
-    "paywall",
-    "subscriber-only",
-    "subscription required",
-    "already a subscriber",
+import asyncio
+from typing import Optional, Tuple
+
+from .analyze import (  # noqa: F401 — phrase lists and checks re-exported for older imports
+    MIN_CONTENT_LENGTH,
+    PAYWALL_PHRASES,
+    SOFT_404_PHRASES,
+    PageAnalysis,
+    analyze_html,
+    is_paywalled,
+    is_soft_404,
 )
+from .cache import CachedPage, get_page_cache
+from .fetch_engine import FetchResponse, get_engine
+from .negative_cache import get_negative_cache
+from .http_client import DEFAULT_HEADERS  # noqa: F401 — re-exported for older imports
 
-SOFT_404_PHRASES: Iterable[str] = (
-    "page not found",
-    "404 not found",
-    "this page doesn't exist",
-    "this page does not exist",
-    "no longer available",
-    "has been removed",
-    "content unavailable",
-    "error 404",
-    "we couldn't find",
-    "we can't find",
-)
-
-DEFAULT_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; AI-Newsletter/1.0; +https://example.com)",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-}
-
-MIN_CONTENT_LENGTH = 200  # chars — reject stub / error pages
-
-
-def is_paywalled(html: str) -> bool:
-    haystack = html.lower()
-    return any(phrase in haystack for phrase in PAYWALL_PHRASES)
-
+VERIFY_TIMEOUT = 4  # seconds per network phase of a verification fetch
 
-def is_soft_404(html: str) -> bool:
-    """Detect pages that return HTTP 200 but are actually error / not-found pages."""
-    haystack = html[:20_000].lower()
-    return any(phrase in haystack for phrase in SOFT_404_PHRASES)
 
+def _response_rejection(resp: Optional[FetchResponse]) -> Optional[str]:
+    """Status, redirect and content-type checks — everything that needs no parsing.
 
-def verify_link(url: str, timeout: int = 4) -> Optional[str]:
-    """Fetch *url* and return the HTML if the page is reachable, is HTML,
-    has enough content, and is not behind a paywall or soft-404.
-    Returns ``None`` on any failure so that the caller can skip the article."""
-    try:
-        resp = requests.get(
-            url,
-            headers=DEFAULT_HEADERS,
-            timeout=timeout,
-            allow_redirects=True,
-        )
-    except requests.RequestException:
-        return None
+    Returns why the response is unusable, or ``None`` if it can be analysed.
+    """
+    if resp is None:
+        return "fetch_failed"
 
     if resp.status_code != 200:
-        return None
+        return f"http_{resp.status_code}"
 
     # Too many redirects is suspicious (login walls, etc.)
-    if len(resp.history) > 5:
-        return None
+    if resp.redirects > 5:
+        return "redirects"
 
     content_type = resp.headers.get("Content-Type", "")
     if "text/html" not in content_type:
-        return None
-
-    text = resp.text
-    sample = text[:100_000]
-
-    # Minimum content check — reject stubs and error pages
-    soup = BeautifulSoup(sample, "html.parser")
-    body_text = soup.get_text(separator=" ", strip=True)
-    if len(body_text) < MIN_CONTENT_LENGTH:
-        return None
-
-    # Soft-404 detection
-    if is_soft_404(sample):
-        return None
-
-    # Paywall detection
-    if is_paywalled(sample):
-        return None
-
-    # Additional JSON-LD paywall flag
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            if "isAccessibleForFree" in script.text and '"isaccessibleforfree": false' in script.text.lower():
-                return None
-        except Exception:
-            continue
-
-    return text
+        return "not_html"
+    return None
+
+
+def _resolve_page(
+    url: str, resp: Optional[FetchResponse], cached: Optional[CachedPage]
+) -> Optional[PageAnalysis]:
+    """Analyse a fresh response, or reuse a fresh / revalidated (304) cache entry."""
+    cache = get_page_cache()
+    if cached is not None and (cached.fresh or (resp is not None and resp.status_code == 304)):
+        analysis = cached.page_analysis()
+        if analysis is None:
+            # Cached by scrape() without verdicts — analyse once and keep the result
+            analysis = analyze_html(cached.html)
+            cache.store_page(
+                url, cached.html,
+                headers={"ETag": cached.etag, "Last-Modified": cached.last_modified},
+                analysis=analysis,
+            )
+        elif not cached.fresh:
+            cache.revalidated(url)
+    else:
+        rejection = _response_rejection(resp)
+        if rejection is not None:
+            _remember_outcome(url, rejection)
+            return None
+        analysis = analyze_html(resp.text)
+        if cache is not None:
+            cache.store_page(url, resp.text, headers=resp.headers, analysis=analysis)
+        _remember_outcome(url, analysis.rejection_reason)
+    # Reject stubs, soft-404s and paywalls (phrase or JSON-LD flag)
+    return analysis if analysis.ok else None
+
+
+def _remember_outcome(url: str, reason: Optional[str]) -> None:
+    negative = get_negative_cache()
+    if negative is not None:
+        negative.record(url, reason)
+
+
+def _known_bad_or_cached(url: str) -> Tuple[Optional[str], Optional[CachedPage]]:
+    """Negative-cache verdict, else the page-cache entry — one worker-thread hop for both."""
+    negative = get_negative_cache()
+    reason = negative.lookup(url) if negative is not None else None
+    if reason is not None:
+        return reason, None
+    cache = get_page_cache()
+    return None, cache.lookup(url) if cache is not None else None
+
+
+async def averify_page(url: str, timeout: int = VERIFY_TIMEOUT) -> Optional[PageAnalysis]:
+    """Fetch and analyse *url* on the fetch engine loop, reading through the page cache.
+
+    Returns the single-parse :class:`PageAnalysis` of a page that passed every
+    check, or ``None``. Links rejected by earlier runs are answered from the
+    negative cache; fresh cache entries skip the network entirely; stale
+    ones are revalidated with ETag / Last-Modified. Disk access and parsing run
+    in worker threads so they never stall other in-flight fetches.
+    """
+    known_bad, cached = await asyncio.to_thread(_known_bad_or_cached, url)
+    if known_bad is not None:
+        return None  # rejected by an earlier run (or its domain always paywalls)
+    if cached is not None and cached.fresh:
+        return await asyncio.to_thread(_resolve_page, url, None, cached)
+
+    resp = await get_engine().fetch(
+        url,
+        timeout=timeout,
+        content_types=("text/html",),
+        headers=cached.validators() if cached is not None else None,
+    )
+    return await asyncio.to_thread(_resolve_page, url, resp, cached)
+
+
+async def averify_link(url: str, timeout: int = VERIFY_TIMEOUT) -> Optional[str]:
+    """Async :func:`verify_link` — must be awaited on the fetch engine loop."""
+    analysis = await averify_page(url, timeout=timeout)
+    return analysis.html if analysis else None
+
+
+def verify_link(url: str, timeout: int = VERIFY_TIMEOUT) -> Optional[str]:
+    """Fetch *url* and return the HTML if the page is reachable, is HTML,
+    has enough content, and is not behind a paywall or soft-404.
+    Returns ``None`` on any failure so that the caller can skip the article."""
+    return get_engine().run(averify_link(url, timeout=timeout))
@@ -9,7 +9,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from ai_newsletter_automation.source_quality import SourceTracker
+from ai_newsletter_automation.source_quality import get_source_tracker
 
 
 class handler(BaseHTTPRequestHandler):
@@ -31,8 +31,8 @@ class handler(BaseHTTPRequestHandler):
                 self.wfile.write(json.dumps({"error": "Missing 'url' parameter"}).encode())
                 return
 
-            tracker = SourceTracker()
-            tracker.record_feedback(url, rating)
+            # The shared tracker: one connection, and its snapshot sees the new flag
+            get_source_tracker().record_feedback(url, rating)
 
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
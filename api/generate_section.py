@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from ai_newsletter_automation.runner import process_section, SECTION_ORDER
 from ai_newsletter_automation.models import SummaryItem
+from ai_newsletter_automation.negative_cache import get_negative_cache
 from ai_newsletter_automation.search import get_streams
 
 
@@ -23,6 +24,8 @@ class handler(BaseHTTPRequestHandler):
         # Optional per-request curation overrides
         limit_override = params.get("limit", [None])[0]
         relevance_override = params.get("relevance_threshold", [None])[0]
+        # no_cache=1 skips cached LLM responses (e.g. to regenerate after a prompt change)
+        use_llm_cache = params.get("no_cache", ["0"])[0] not in ("1", "true")
 
         if not key:
             self.send_response(400)
@@ -67,7 +70,11 @@ class handler(BaseHTTPRequestHandler):
         try:
             # Apply per-request overrides if provided
             max_per_stream = int(limit_override) if limit_override else None
-            items = process_section(key, days, max_per_stream=max_per_stream, lang=lang)
+            items = process_section(key, days, max_per_stream=max_per_stream, lang=lang, use_llm_cache=use_llm_cache)
+            # Serverless containers may never exit cleanly, so don't rely on atexit
+            negative = get_negative_cache()
+            if negative is not None:
+                negative.flush()
             result = {
                 "section_key": key,
                 "items": [
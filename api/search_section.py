@@ -18,13 +18,9 @@ from ai_newsletter_automation.search import (
     collect_research, collect_ai_progress, collect_indian,
     collect_global, collect_deep_dive,
     search_stream,
-    _filter_by_keywords,
-    _boost_by_keywords,
-    _boost_by_source_quality,
-    _sort_by_source_priority,
-    _apply_time_decay,
 )
 from ai_newsletter_automation.runner import SECTION_ORDER
+from ai_newsletter_automation.scoring import rank_hits
 
 
 class handler(BaseHTTPRequestHandler):
@@ -78,11 +74,7 @@ class handler(BaseHTTPRequestHandler):
                 hits = search_stream(cfg, cfg.days or days)
 
             # Lightweight curation (no scraping, no verification)
-            hits = _filter_by_keywords(hits, cfg.reject_keywords)
-            hits = _boost_by_keywords(hits, cfg.boost_keywords)
-            hits = _boost_by_source_quality(hits)
-            hits = _sort_by_source_priority(hits)
-            hits = _apply_time_decay(hits, cfg.days or days)
+            hits = rank_hits(hits, cfg, cfg.days or days)
 
             # Simple dedup by URL
             seen_urls = set()
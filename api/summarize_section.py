@@ -12,6 +12,7 @@ from http.server import BaseHTTPRequestHandler
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from ai_newsletter_automation.models import VerifiedArticle
+from ai_newsletter_automation.rate_limit import retry_after_seconds
 from ai_newsletter_automation.summarize import summarize_section
 from ai_newsletter_automation.runner import _filter_items_by_date
 
@@ -45,6 +46,7 @@ class handler(BaseHTTPRequestHandler):
             lang = body.get("lang", "en")
             days = body.get("days", 7)
             relevance_threshold = body.get("relevance_threshold", 6)
+            use_cache = not body.get("no_cache", False)
             articles_data = body.get("articles", [])
 
             # Reconstruct VerifiedArticle objects
@@ -75,6 +77,7 @@ class handler(BaseHTTPRequestHandler):
                 section_key=key,
                 lang=lang,
                 relevance_threshold=relevance_threshold,
+                use_cache=use_cache,
             )
 
             # Fallback: if LLM returned empty Live_Link, try matching back
@@ -134,4 +137,5 @@ class handler(BaseHTTPRequestHandler):
                 "section_key": key if 'key' in dir() else "",
                 "items": [],
                 "error": str(exc),
+                "retry_after": retry_after_seconds(exc),
             }).encode())
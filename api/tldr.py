@@ -38,7 +38,7 @@ class handler(BaseHTTPRequestHandler):
         ]
 
         lang = data.get("lang", "en")
-        tldr = generate_tldr(items, lang=lang)
+        tldr = generate_tldr(items, lang=lang, use_cache=not data.get("no_cache", False))
 
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
@@ -0,0 +1,95 @@
+"""Deduplication time for the pairwise, vectorized and MinHash/LSH methods.
+
+Usage:
+    python benchmarks/bench_dedup.py [--sizes 100,1000,10000] [--pairwise-max 2000]
+
+Builds a synthetic pool in which ~20% of articles are rewordings of an
+earlier headline, then times deduplicate() with each method and reports how
+many articles survive. Pairwise is skipped above --pairwise-max because it
+is quadratic (10k articles take many minutes).
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ai_newsletter_automation import dedup  # noqa: E402
+from ai_newsletter_automation.dedup import deduplicate  # noqa: E402
+from ai_newsletter_automation.models import VerifiedArticle  # noqa: E402
+
+_REWORDS = [("releases", "launches"), ("new", "next-gen"), ("model", "system"), (" in ", " across ")]
+
+
+def _vocabulary(rng: random.Random, size: int = 5000):
+    """Random-letter words with Zipf-like weights, so common words recur as in real headlines."""
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9)))
+             for _ in range(size)]
+    return words, list(itertools.accumulate(1 / (rank + 1) for rank in range(size)))
+
+
+_VOCAB = _vocabulary(random.Random(7))
+
+
+def _word(rng: random.Random) -> str:
+    return rng.choices(_VOCAB[0], cum_weights=_VOCAB[1])[0]
+
+
+def _headline(rng: random.Random) -> str:
+    words = [_word(rng) for _ in range(rng.randint(5, 10))]
+    words.insert(rng.randrange(len(words)), rng.choice(["releases", "new", "model", "in"]))
+    return " ".join(words).capitalize()
+
+
+def _pool(size: int, rng: random.Random):
+    """Distinct headlines plus ~20% reworded or syndicated copies of earlier ones."""
+    articles = []
+    for i in range(size):
+        if articles and rng.random() < 0.2:
+            base = rng.choice(articles)
+            if rng.random() < 0.5:
+                title = base.title
+                for old, new in _REWORDS:
+                    title = title.replace(old, new, 1)
+                title += " " + _word(rng)
+            else:
+                title = _headline(rng)  # syndicated copy under a new headline
+            content = base.content
+        else:
+            title = _headline(rng)
+            content = f"{title}. " + " ".join(_word(rng) for _ in range(80))
+        articles.append(VerifiedArticle(title=title, url=f"https://news{i}.example.com/a", snippet="",
+                                        content=content))
+    return articles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated pool sizes.")
+    parser.add_argument("--pairwise-max", type=int, default=2000, help="Largest pool timed with pairwise.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rng = random.Random(42)
+    for size in (int(s) for s in args.sizes.split(",")):
+        articles = _pool(size, rng)
+        for method in ("pairwise", "vectorized", "minhash"):
+            if method == "pairwise" and size > args.pairwise_max:
+                print(f"{size:>6}  {method:<10} skipped (> --pairwise-max)")
+                continue
+            if method == "vectorized" and dedup.np is None:
+                print(f"{size:>6}  {method:<10} skipped (numpy not installed)")
+                continue
+            start = time.perf_counter()
+            kept = deduplicate(articles, method=method)
+            elapsed = time.perf_counter() - start
+            print(f"{size:>6}  {method:<10} {elapsed:8.3f}s  kept {len(kept)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Handshake cost with and without the shared HTTP session.
+
+Usage:
+    python benchmarks/bench_http_pool.py              # feed + HN fetch mix, no API keys needed
+    python benchmarks/bench_http_pool.py --full-run   # full runner.main --dry-run (needs .env keys)
+
+Reports wall time, connections opened and total time spent in connect()
+(TCP + TLS handshake) for the unpooled baseline and the pooled session.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import urllib3.connection  # noqa: E402
+
+from ai_newsletter_automation import http_client  # noqa: E402
+
+_CONNECT = {"count": 0, "seconds": 0.0}
+_CONNECT_LOCK = threading.Lock()
+_original_connect = urllib3.connection.HTTPConnection.connect
+
+
+def _timed_connect(self):
+    start = time.perf_counter()
+    try:
+        return _original_connect(self)
+    finally:
+        with _CONNECT_LOCK:
+            _CONNECT["count"] += 1
+            _CONNECT["seconds"] += time.perf_counter() - start
+
+
+urllib3.connection.HTTPConnection.connect = _timed_connect
+
+
+def _fetch_mix() -> None:
+    from ai_newsletter_automation.search import CURATED_FEEDS, HN_API_BASE
+
+    urls = [f"{HN_API_BASE}/topstories.json"]
+    urls += [f"{HN_API_BASE}/item/{story_id}.json" for story_id in range(40_000_000, 40_000_030)]
+    urls += CURATED_FEEDS
+    for url in urls:
+        try:
+            http_client.get_session().get(url, timeout=10)
+        except Exception:
+            continue
+
+
+def _full_run() -> None:
+    from ai_newsletter_automation import runner
+
+    runner.main.main(args=["--dry-run"], standalone_mode=False)
+
+
+def _measure(label: str, pooled: bool, work) -> None:
+    http_client.reset_session()
+    http_client.POOLING_ENABLED = pooled
+    _CONNECT["count"], _CONNECT["seconds"] = 0, 0.0
+    start = time.perf_counter()
+    work()
+    wall = time.perf_counter() - start
+    print(
+        f"{label:<10} wall={wall:7.2f}s  connects={_CONNECT['count']:4d}  "
+        f"handshake={_CONNECT['seconds']:6.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full-run", action="store_true", help="Benchmark a full runner.main --dry-run.")
+    args = parser.parse_args()
+
+    work = _full_run if args.full_run else _fetch_mix
+    _measure("unpooled", False, work)
+    _measure("pooled", True, work)
+
+
+if __name__ == "__main__":
+    main()
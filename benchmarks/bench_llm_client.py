@@ -0,0 +1,88 @@
+"""Per-call connect time with a Groq client per call vs the shared client.
+
+Usage:
+    python benchmarks/bench_llm_client.py                  # local stub server, no API key needed
+    python benchmarks/bench_llm_client.py --groq --calls 5 # real Groq API (needs GROQ_API_KEY)
+
+Sends the same small completion --calls times, first building a client per
+call (the old behaviour, LLM_CLIENT_REUSE=0) and then through the shared
+client, and reports wall time, connections opened and time spent in TCP
+connect + TLS handshake per call. The stub server speaks plain HTTP, so it
+only shows the connection count and TCP cost; use --groq to include TLS.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ai_newsletter_automation import llm_client  # noqa: E402
+
+_COMPLETION = json.dumps({
+    "id": "bench", "object": "chat.completion", "created": 0, "model": "stub",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+}).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_COMPLETION)))
+        self.end_headers()
+        self.wfile.write(_COMPLETION)
+
+    def log_message(self, *args):
+        pass
+
+
+def _measure(label: str, reuse: bool, calls: int, api_key: str, base_url, model: str) -> None:
+    llm_client.reset_groq_clients()
+    llm_client.reset_connect_stats()
+    llm_client.CLIENT_REUSE_ENABLED = reuse
+    start = time.perf_counter()
+    for _ in range(calls):
+        client = llm_client.get_groq_client(api_key, base_url=base_url)
+        client.chat.completions.create(model=model, messages=[{"role": "user", "content": "Reply with ok."}],
+                                       max_tokens=2, timeout=llm_client.llm_timeout())
+    wall = time.perf_counter() - start
+    stats = llm_client.connect_stats()
+    print(
+        f"{label:<10} wall/call={wall / calls * 1000:7.1f} ms  connects={stats['connections']:3d}  "
+        f"connect/call={stats['connect_seconds'] / calls * 1000:6.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50, help="Completions per mode.")
+    parser.add_argument("--groq", action="store_true", help="Call the real Groq API instead of a local stub.")
+    parser.add_argument("--model", default="llama-3.1-8b-instant", help="Model for --groq.")
+    args = parser.parse_args()
+
+    server = None
+    if args.groq:
+        api_key, base_url, model = os.environ["GROQ_API_KEY"], None, args.model
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        api_key, base_url, model = "stub", f"http://127.0.0.1:{server.server_address[1]}", "stub"
+    try:
+        _measure("per-call", False, args.calls, api_key, base_url, model)
+        _measure("shared", True, args.calls, api_key, base_url, model)
+    finally:
+        llm_client.reset_groq_clients()
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Pages per second for each installed HTML parser backend.
+
+Usage:
+    python benchmarks/bench_parsers.py [--pages 200]
+
+Runs analyze_html() over synthetic article pages of roughly 20 KB, 100 KB
+(the old verify sample size) and 500 KB, once per available backend.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ai_newsletter_automation.analyze import analyze_html, available_parsers  # noqa: E402
+
+_PARAGRAPH = (
+    "<p>Regulators in several countries published draft rules for frontier "
+    "AI models this week, with <a href='/x'>new audit requirements</a> and "
+    "<em>disclosure obligations</em> for public-sector deployments.</p>\n"
+)
+
+_HEAD = """<html><head>
+<meta property="article:published_time" content="2026-02-10T08:00:00Z" />
+<script type="application/ld+json">{"@type": "NewsArticle", "datePublished": "2026-02-10"}</script>
+<script>window.dataLayer = [];</script><style>.x { color: red; }</style>
+</head><body><header><nav><a href="/">Home</a></nav></header><article>
+"""
+
+_TAIL = "</article><aside>Related</aside><footer>Footer</footer></body></html>"
+
+
+def _page(target_bytes: int) -> str:
+    repeats = max(1, (target_bytes - len(_HEAD) - len(_TAIL)) // len(_PARAGRAPH))
+    return _HEAD + _PARAGRAPH * repeats + _TAIL
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="Pages parsed per size and backend.")
+    args = parser.parse_args()
+
+    sizes = {"20KB": 20_000, "100KB": 100_000, "500KB": 500_000}
+    for label, size in sizes.items():
+        html = _page(size)
+        # Larger pages get proportionally fewer iterations to keep runs short
+        pages = max(5, args.pages * 20_000 // size)
+        for backend in available_parsers():
+            start = time.perf_counter()
+            for _ in range(pages):
+                analyze_html(html, parser=backend)
+            elapsed = time.perf_counter() - start
+            print(f"{label:>6}  {backend:<12} {pages / elapsed:8.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Hit ranking time: the chain of stable sorts vs the single-pass scoring engine.
+
+Usage:
+    python benchmarks/bench_scoring.py [--hits 5000] [--repeat 5]
+
+Builds a synthetic pool of hits across sources, dates and domains (with a
+seeded source-quality history in a temporary database), then times the old
+curation chain — reject/boost keywords, source quality, source priority,
+time decay — against scoring.rank_hits() on the same input.
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ai_newsletter_automation.models import ArticleHit, SectionConfig  # noqa: E402
+from ai_newsletter_automation.scoring import rank_hits  # noqa: E402
+from ai_newsletter_automation.search import (  # noqa: E402
+    _apply_time_decay,
+    _boost_by_keywords,
+    _boost_by_source_quality,
+    _filter_by_keywords,
+    _sort_by_source_priority,
+)
+from ai_newsletter_automation.source_quality import SourceTracker, set_source_tracker  # noqa: E402
+
+_SOURCES = ["Google Alert", "RSS", "arXiv", "Tavily", "DuckDuckGo", "Hacker News"]
+_WORDS = ("model agent policy federal Treasury launch benchmark chip startup regulation "
+          "open-source safety dataset funding research").split()
+_DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%a, %d %b %Y %H:%M:%S +0000", "%Y-%m-%d")
+
+
+def _pool(size: int, rng: random.Random):
+    now = datetime.utcnow()
+    hits = []
+    for i in range(size):
+        published = None
+        if rng.random() < 0.85:
+            when = now - timedelta(hours=rng.uniform(0, 24 * 21))
+            published = when.strftime(rng.choice(_DATE_FORMATS))
+        hits.append(ArticleHit(
+            title=" ".join(rng.choice(_WORDS) for _ in range(8)).capitalize(),
+            url=f"https://site{rng.randrange(300)}.example.com/{i}",
+            snippet=" ".join(rng.choice(_WORDS) for _ in range(40)) + (" crypto" if rng.random() < 0.05 else ""),
+            source=rng.choice(_SOURCES),
+            published=published,
+        ))
+    return hits
+
+
+def _chain(hits, cfg, days):
+    hits = _filter_by_keywords(hits, cfg.reject_keywords)
+    hits = _boost_by_keywords(hits, cfg.boost_keywords)
+    hits = _boost_by_source_quality(hits)
+    hits = _sort_by_source_priority(hits)
+    return _apply_time_decay(hits, days)
+
+
+def _best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hits", type=int, default=5000, help="Hits in the pool.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per method (best is reported).")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rng = random.Random(42)
+    hits = _pool(args.hits, rng)
+    cfg = SectionConfig(name="Bench", query="q", limit=10, days=14,
+                        boost_keywords=["Treasury", "federal", "policy"], reject_keywords=["crypto"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = SourceTracker(Path(tmp) / "source_quality.db")
+        tracker.record_many((f"https://site{d}.example.com/", rng.randint(1, 10)) for d in range(300))
+        tracker.flush()
+        set_source_tracker(tracker)
+        try:
+            chain = _best_of(args.repeat, lambda: _chain(hits, cfg, cfg.days))
+            single = _best_of(args.repeat, lambda: rank_hits(hits, cfg, cfg.days))
+        finally:
+            set_source_tracker(None)
+            tracker.close()
+
+    print(f"{args.hits} hits, best of {args.repeat}")
+    print(f"  sort chain   {chain * 1000:8.1f} ms")
+    print(f"  single pass  {single * 1000:8.1f} ms  ({chain / single:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -234,17 +234,16 @@ async function generateNewsletter() {
     const allSections = {};
     let completed = 0;
     let hasErrors = false;
-    let _sectionStart = Date.now();
 
-    // Rate-limit delay helper (Gemini free tier: ~15 RPM)
+    // Fallback wait when a 429 reaches us without the API's Retry-After hint.
+    // The server paces Groq calls itself, so sections no longer cool down in between.
     const RATE_LIMIT_DELAY_MS = 15000;
+    // Sections in flight at once; each is its own search + summarize call
+    const SECTION_CONCURRENCY = 3;
     const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+    const inFlight = new Set();
 
-    for (let si = 0; si < SECTIONS.length; si++) {
-        const section = SECTIONS[si];
-        setChipState(section.key, "active");
-        updateProgress(completed, section.label);
-
+    const runSection = async (section) => {
         // Build query params with tuning overrides
         const overrides = getTuningOverrides(section.key);
         const sectionDays = overrides.days || globalDays;
@@ -269,12 +268,7 @@ async function generateNewsletter() {
             if (!searchData.articles || searchData.articles.length === 0) {
                 allSections[section.key] = [];
                 setChipState(section.key, "done");
-                completed++;
-                _sectionTimes.push(Date.now() - _sectionStart);
-                _sectionStart = Date.now();
-                _updateTimer();
-                updateProgress(completed, completed < SECTIONS.length ? SECTIONS[completed]?.label : null);
-                continue;
+                return;
             }
 
             // ── Step 2: Summarize with LLM ──
@@ -302,11 +296,12 @@ async function generateNewsletter() {
 
             let data = await summarizeOnce();
 
-            // If rate-limited (error contains "429"), wait and retry once
+            // If still rate-limited after the server's own retries, wait as advised and retry once
             if (data.error && data.error.includes("429")) {
-                console.warn(`Section ${section.key} rate-limited. Waiting ${RATE_LIMIT_DELAY_MS / 1000}s and retrying...`);
-                $("progress-text").textContent = `Rate limited — cooling down (${RATE_LIMIT_DELAY_MS / 1000}s)…`;
-                await sleep(RATE_LIMIT_DELAY_MS);
+                const delayMs = data.retry_after ? Math.ceil(data.retry_after * 1000) : RATE_LIMIT_DELAY_MS;
+                console.warn(`Section ${section.key} rate-limited. Waiting ${delayMs / 1000}s and retrying...`);
+                $("progress-text").textContent = `Rate limited — cooling down (${Math.ceil(delayMs / 1000)}s)…`;
+                await sleep(delayMs);
                 data = await summarizeOnce();
             }
 
@@ -333,23 +328,27 @@ async function generateNewsletter() {
             allSections[section.key] = [];
             hasErrors = true;
         }
+    };
 
-        completed++;
-        _sectionTimes.push(Date.now() - _sectionStart);
-        _updateTimer();
-        updateProgress(completed, completed < SECTIONS.length ? SECTIONS[completed]?.label : null);
-
-        // ── Rate-limit cooldown between sections (skip after last) ──
-        if (si < SECTIONS.length - 1) {
-            const nextLabel = SECTIONS[si + 1]?.label || "next section";
-            for (let countdown = Math.ceil(RATE_LIMIT_DELAY_MS / 1000); countdown > 0; countdown--) {
-                $("progress-text").textContent = `Cooling down before ${nextLabel}… ${countdown}s`;
-                await sleep(1000);
-            }
+    let nextSection = 0;
+    const worker = async () => {
+        while (nextSection < SECTIONS.length) {
+            const section = SECTIONS[nextSection++];
+            const sectionStart = Date.now();
+            inFlight.add(section.label);
+            setChipState(section.key, "active");
+            updateProgress(completed, [...inFlight].join(", "));
+
+            await runSection(section);
+
+            inFlight.delete(section.label);
+            completed++;
+            _sectionTimes.push(Date.now() - sectionStart);
+            _updateTimer();
+            updateProgress(completed, inFlight.size ? [...inFlight].join(", ") : null);
         }
-        // Reset section start AFTER cooldown so next section timing is clean
-        _sectionStart = Date.now();
-    }
+    };
+    await Promise.all(Array.from({ length: SECTION_CONCURRENCY }, worker));
 
     // Render the full newsletter
     $("progress-text").textContent = "Rendering newsletter…";
@@ -0,0 +1,34 @@
+import pytest
+
+from ai_newsletter_automation import cache, source_quality
+from ai_newsletter_automation.cache import DiskCache, PageCache
+from ai_newsletter_automation.llm_cache import LLMCache, set_llm_cache
+from ai_newsletter_automation.negative_cache import NegativeCache, set_negative_cache
+from ai_newsletter_automation.published_index import PublishedIndex, set_published_index
+from ai_newsletter_automation.rate_limit import reset_rate_limiters
+from ai_newsletter_automation.source_quality import SourceTracker, set_source_tracker
+
+
+@pytest.fixture(autouse=True)
+def isolated_page_cache(tmp_path, monkeypatch):
+    """Keep every test's on-disk caches, published index and source history in their own temp directory."""
+    monkeypatch.setattr(source_quality, "_get_db_path", lambda: tmp_path / "source_quality.db")
+    store = DiskCache("pages", cache.PAGE_CACHE_TTL_SECONDS, cache.PAGE_CACHE_MAX_BYTES, directory=tmp_path / "pages")
+    cache.set_page_cache(PageCache(store))
+    cache.set_feed_cache(DiskCache("feeds", cache.FEED_CACHE_FRESH_SECONDS, cache.FEED_CACHE_MAX_BYTES, directory=tmp_path / "feeds"))
+    cache.set_hn_item_cache(DiskCache("hn_items", cache.HN_ITEM_CACHE_TTL_SECONDS, cache.HN_ITEM_CACHE_MAX_BYTES, directory=tmp_path / "hn_items"))
+    set_negative_cache(NegativeCache(DiskCache("negative", 30 * 86400, 10 * 1024 * 1024, directory=tmp_path / "negative")))
+    set_published_index(PublishedIndex(path=tmp_path / "published_index.json"))
+    set_llm_cache(LLMCache(DiskCache("llm", 3600, 10 * 1024 * 1024, directory=tmp_path / "llm")))
+    tracker = SourceTracker(tmp_path / "source_quality.db")
+    set_source_tracker(tracker)
+    yield
+    set_source_tracker(None)
+    tracker.close()
+    set_published_index(None)
+    set_llm_cache(None)
+    reset_rate_limiters()
+    set_negative_cache(None)
+    cache.set_page_cache(None)
+    cache.set_feed_cache(None)
+    cache.set_hn_item_cache(None)
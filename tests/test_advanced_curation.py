@@ -1,8 +1,13 @@
 """Tests for advanced curation features: dedup, time-decay, UTM tracking, source quality."""
 
+import importlib.util
+import json
+import threading
 import time
 from datetime import datetime, timedelta
 
+import pytest
+
 from ai_newsletter_automation.models import ArticleHit, VerifiedArticle, SummaryItem
 from ai_newsletter_automation.dedup import deduplicate, _title_similarity
 from ai_newsletter_automation.search import _apply_time_decay
@@ -32,26 +37,36 @@ def test_title_similarity_partial():
     assert score >= 0.7
 
 
-def test_deduplicate_removes_near_duplicates():
+_METHODS = [
+    "pairwise",
+    "minhash",
+    pytest.param("vectorized", marks=pytest.mark.skipif(
+        importlib.util.find_spec("numpy") is None, reason="numpy not installed")),
+]
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_deduplicate_removes_near_duplicates(method):
     articles = [
         _make_verified("OpenAI launches GPT-5", "https://a.com/1", content="Full article text here with details"),
         _make_verified("OpenAI launches GPT-5 model today", "https://b.com/2", content="Short"),
         _make_verified("Totally different article about farming", "https://c.com/3", content="Farming content"),
     ]
-    result = deduplicate(articles)
+    result = deduplicate(articles, method=method)
     assert len(result) == 2
     # Should keep the one with more content
     assert result[0].url == "https://a.com/1"
     assert result[1].url == "https://c.com/3"
 
 
-def test_deduplicate_keeps_unique():
+@pytest.mark.parametrize("method", _METHODS)
+def test_deduplicate_keeps_unique(method):
     articles = [
         _make_verified("Google unveils quantum computing breakthrough", "https://a.com/1"),
         _make_verified("New recipe book wins culinary award", "https://b.com/2"),
         _make_verified("FIFA World Cup 2030 venues announced", "https://c.com/3"),
     ]
-    result = deduplicate(articles)
+    result = deduplicate(articles, method=method)
     assert len(result) == 3
 
 
@@ -64,6 +79,104 @@ def test_deduplicate_single():
     assert deduplicate(articles) == articles
 
 
+def test_minhash_matches_pairwise_on_near_duplicate_titles():
+    articles = [
+        _make_verified("OpenAI launches GPT-5", "https://a.com/1", content="Full article text here with details"),
+        _make_verified("OpenAI launches GPT-5 model today", "https://b.com/2", content="Short"),
+        _make_verified("Totally different article about farming", "https://c.com/3", content="Farming content"),
+    ]
+    assert deduplicate(articles, method="minhash") == deduplicate(articles, method="pairwise")
+
+
+def test_minhash_catches_syndicated_copy_under_new_headline():
+    body = "Regulators in Brussels published a draft code of practice for general-purpose AI models, " * 3
+    articles = [
+        _make_verified("EU publishes draft AI code of practice", "https://a.com/1", content=body),
+        _make_verified("Brussels moves on model rules", "https://b.com/2", content=body + " More."),
+        _make_verified("New recipe book wins culinary award", "https://c.com/3", content="Cooking " * 20),
+    ]
+    result = deduplicate(articles, method="minhash")
+    assert [a.url for a in result] == ["https://b.com/2", "https://c.com/3"]
+
+
+def _headline_pool(size, seed=11):
+    """Random-word headlines (Zipf-weighted, as in bench_dedup) with ~20% reworded copies."""
+    import itertools
+    import random
+
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9))) for _ in range(2000)]
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+    articles = []
+    for i in range(size):
+        if articles and rng.random() < 0.2:
+            title = rng.choice(articles).title.replace(" new ", " next-gen ", 1) + " " + rng.choice(vocab)
+        else:
+            words = rng.choices(vocab, cum_weights=weights, k=rng.randint(5, 10))
+            words.insert(rng.randrange(len(words)), rng.choice(["releases", "new", "model", "in"]))
+            title = " ".join(words).capitalize()
+        articles.append(_make_verified(title, f"https://news{i}.example.com/a", content="x" * rng.randint(50, 500)))
+    return articles
+
+
+def test_vectorized_stays_close_to_pairwise():
+    pytest.importorskip("numpy")
+    for seed in (11, 13):
+        articles = _headline_pool(150, seed)
+        pairwise = deduplicate(articles, method="pairwise")
+        vectorized = deduplicate(articles, method="vectorized")
+        # Calibrated cosine, not SequenceMatcher: close kept counts, not identical
+        # clusters (within 2% on bench pools of 300+, a little noisier this small)
+        assert abs(len(vectorized) - len(pairwise)) <= 0.04 * len(pairwise)
+
+
+def test_minhash_titles_stay_close_to_pairwise():
+    from dataclasses import replace
+
+    for seed in (11, 13):
+        articles = [replace(a, content="") for a in _headline_pool(150, seed)]  # titles only
+        pairwise = deduplicate(articles, method="pairwise")
+        minhash = deduplicate(articles, method="minhash")
+        # Dice against its own calibrated threshold, not the SequenceMatcher one
+        assert abs(len(minhash) - len(pairwise)) <= 0.02 * len(pairwise)
+
+
+def test_dedup_hashes_are_stable_across_processes():
+    from ai_newsletter_automation.minhash import shingles
+
+    # CRC-32, not the per-process salted hash(): same shingles in every run
+    assert shingles("abcd", 3) == frozenset({891568578, 2954713977})
+
+
+def test_deduplicate_auto_switches_to_minhash_for_large_pools(monkeypatch):
+    from ai_newsletter_automation import dedup
+
+    calls = []
+    monkeypatch.setattr(dedup, "PAIRWISE_MAX_ARTICLES", 2)
+    monkeypatch.setattr(dedup, "VECTORIZED_MAX_ARTICLES", 2)
+    monkeypatch.setattr(dedup, "_minhash_clusters", lambda a, t, c: calls.append(len(a)) or [[i] for i in range(len(a))])
+    articles = [_make_verified(f"Story {i}", f"https://a.com/{i}") for i in range(3)]
+    assert deduplicate(articles) == articles
+    assert calls == [3]
+
+
+def test_deduplicate_auto_uses_vectorized_for_moderate_pools(monkeypatch):
+    from ai_newsletter_automation import dedup
+
+    pytest.importorskip("numpy")
+    calls = []
+    monkeypatch.setattr(dedup, "PAIRWISE_MAX_ARTICLES", 2)
+    monkeypatch.setattr(dedup, "_vectorized_clusters", lambda a, t: calls.append(len(a)) or [[i] for i in range(len(a))])
+    articles = [_make_verified(f"Story {i}", f"https://a.com/{i}") for i in range(3)]
+    assert deduplicate(articles) == articles
+    assert calls == [3]
+
+
+def test_deduplicate_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        deduplicate([_make_verified("a"), _make_verified("b")], method="fuzzy")
+
+
 # ── Time-decay tests ──
 
 def _make_hit(title="Test", published=None, url="https://example.com"):
@@ -140,3 +253,101 @@ def test_source_tracker_get_boost_unknown():
     """Unknown domains should return 0.0 boost."""
     tracker = SourceTracker()
     assert tracker.get_boost("https://never-seen-before-domain-xyz.com/") == 0.0
+
+
+def test_source_tracker_boost_from_aggregates_and_feedback(tmp_path):
+    tracker = SourceTracker(tmp_path / "sq.db")
+    for score in (9, 9, 10):
+        tracker.record("https://www.good.example.com/a", score)
+    tracker.record("https://bad.example.com/a", 3)
+    assert tracker.get_boost("https://good.example.com/b") == pytest.approx((28 / 3 - 5) / 5)
+    assert tracker.get_boost("https://bad.example.com/b") == 0.0
+
+    tracker.record_feedback("https://good.example.com/a", "down")
+    assert tracker.get_boost("https://good.example.com/b") == pytest.approx((28 / 3 - 5) / 5 - 0.2)
+    stats = tracker.get_domain_stats()
+    assert stats["good.example.com"]["weight"] == pytest.approx(3)
+    assert stats["good.example.com"]["avg_score"] == pytest.approx(28 / 3)
+
+
+def test_source_tracker_decays_old_scores(tmp_path):
+    path = tmp_path / "sq.db"
+    tracker = SourceTracker(path)
+    now = time.time()
+    with tracker._conn:
+        tracker._insert_scores([
+            {"domain": "example.com", "score": 10, "timestamp": now - 60 * 86400},  # two half-lives: weight 1/4
+            {"domain": "example.com", "score": 6, "timestamp": now},
+            {"domain": "stale.example.com", "score": 10, "timestamp": now - 100 * 86400},
+        ])
+    tracker.close()
+
+    reopened = SourceTracker(path)
+    stats = reopened.get_domain_stats()
+    assert set(stats) == {"example.com"}  # decayed below the minimum weight and forgotten
+    assert stats["example.com"]["weight"] == pytest.approx(1.25)
+    assert stats["example.com"]["avg_score"] == pytest.approx((10 * 0.25 + 6) / 1.25)
+    assert reopened.get_boost("https://example.com/") == pytest.approx(((10 * 0.25 + 6) / 1.25 - 5) / 5)
+
+
+def test_source_tracker_migrates_legacy_json(tmp_path):
+    now = time.time()
+    (tmp_path / "source_quality.json").write_text(json.dumps([
+        {"domain": "example.com", "score": 10, "timestamp": now},
+        {"domain": "example.com", "score": 8, "timestamp": now},
+    ]))
+    (tmp_path / "feedback.json").write_text(json.dumps([
+        {"domain": "example.com", "url": "https://example.com/x", "rating": "down", "timestamp": now},
+    ]))
+    tracker = SourceTracker(tmp_path / "source_quality.db")
+    assert tracker.get_boost("https://example.com/") == pytest.approx(0.8 - 0.2)
+    assert not (tmp_path / "source_quality.json").exists()
+    assert (tmp_path / "feedback.json.migrated").exists()
+
+
+def test_source_tracker_concurrent_writers(tmp_path):
+    path = tmp_path / "sq.db"
+    SourceTracker(path).close()  # create the schema once
+
+    def write(n):
+        tracker = SourceTracker(path)
+        for _ in range(25):
+            tracker.record(f"https://site{n}.example.com/a", 7)
+        tracker.close()
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = SourceTracker(path).get_domain_stats()
+    assert {d: round(s["weight"]) for d, s in stats.items()} == {f"site{n}.example.com": 25 for n in range(4)}
+
+
+def test_source_tracker_record_many_is_buffered_until_flush(tmp_path):
+    path = tmp_path / "sq.db"
+    tracker = SourceTracker(path)
+    tracker.record_many([("https://example.com/a", 10), ("https://example.com/b", 8), ("not a url", 9)])
+    assert tracker.get_boost("https://example.com/") == pytest.approx(0.8)  # served from the snapshot
+    assert SourceTracker(path).get_domain_stats() == {}  # nothing on disk yet
+
+    tracker.flush()
+    assert SourceTracker(path).get_domain_stats()["example.com"]["weight"] == pytest.approx(2)
+
+
+def test_source_tracker_shared_across_section_threads(tmp_path):
+    path = tmp_path / "sq.db"
+    tracker = SourceTracker(path)
+
+    def section(n):
+        tracker.record_many((f"https://site{n}.example.com/{i}", 7) for i in range(25))
+        tracker.flush()
+
+    threads = [threading.Thread(target=section, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = SourceTracker(path).get_domain_stats()
+    assert {d: round(s["weight"]) for d, s in stats.items()} == {f"site{n}.example.com": 25 for n in range(4)}
+
@@ -0,0 +1,45 @@
+from ai_newsletter_automation.analyze import analyze_html
+
+BODY = "<p>" + "Governments are adopting new AI procurement rules this week. " * 10 + "</p>"
+
+
+def test_analyze_collects_text_date_and_verdicts_in_one_pass():
+    html = f"""
+    <html>
+        <head>
+            <meta property="article:published_time" content="2026-02-10T08:00:00Z" />
+            <script>var tracking = "should not appear in text";</script>
+        </head>
+        <body><header>Site nav</header>{BODY}<footer>Footer links</footer></body>
+    </html>
+    """
+    page = analyze_html(html)
+    assert page.published_date == "2026-02-10T08:00:00Z"
+    assert "procurement rules" in page.text
+    assert "tracking" not in page.text
+    assert "Site nav" not in page.text
+    assert page.ok
+    assert page.rejection_reason is None
+
+
+def test_analyze_flags_stub_pages():
+    page = analyze_html("<html><body><p>Too short</p></body></html>")
+    assert page.rejection_reason == "too_short"
+
+
+def test_analyze_flags_soft_404():
+    page = analyze_html(f"<html><body><h1>Page not found</h1>{BODY}</body></html>")
+    assert page.rejection_reason == "soft_404"
+
+
+def test_analyze_flags_jsonld_paywall():
+    html = f"""
+    <html><head><script type="application/ld+json">
+    {{"@type": "NewsArticle", "isAccessibleForFree": false, "datePublished": "2026-01-05"}}
+    </script></head><body>{BODY}</body></html>
+    """
+    page = analyze_html(html)
+    assert page.jsonld_present
+    assert page.jsonld_not_free
+    assert page.published_date == "2026-01-05"
+    assert page.rejection_reason == "jsonld_paywall"
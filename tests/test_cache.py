@@ -0,0 +1,77 @@
+import os
+import time
+
+import httpx
+
+from ai_newsletter_automation import cache, fetch_engine
+from ai_newsletter_automation.cache import DiskCache, normalize_url
+from ai_newsletter_automation.fetch_engine import FetchEngine
+from ai_newsletter_automation.verify import verify_link
+
+ARTICLE_HTML = "<html><body><p>" + "Regulators publish new AI audit rules today. " * 20 + "</p></body></html>"
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.COM:443/a?b=2&a=1#frag") == "https://example.com/a?a=1&b=2"
+    assert normalize_url("http://example.com") == "http://example.com/"
+
+
+def test_disk_cache_ttl(tmp_path):
+    store = DiskCache("t", ttl_seconds=60, max_bytes=1_000_000, directory=tmp_path)
+    store.set("k", {"v": 1})
+    assert store.get("k") == {"v": 1}
+    entry = store.get_entry("k")
+    entry["stored_at"] = time.time() - 120
+    store._path("k").write_text(__import__("json").dumps(entry))
+    assert store.get("k") is None
+    assert store.hits == 1 and store.misses == 1
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    store = DiskCache("t", ttl_seconds=60, max_bytes=3_000, directory=tmp_path)
+    for i in range(3):
+        store.set(f"k{i}", {"blob": "x" * 900})
+        old = time.time() - 100 + i
+        os.utime(store._path(f"k{i}"), (old, old))
+    store.get("k0")  # k0 becomes most recently used
+    store.set("k3", {"blob": "x" * 900})
+    assert store.get_entry("k1") is None
+    assert store.get_entry("k0") is not None
+    assert store.get_entry("k3") is not None
+
+
+def test_verify_link_reads_through_page_cache():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, headers={"Content-Type": "text/html", "ETag": '"v1"'}, text=ARTICLE_HTML)
+
+    fetch_engine.set_engine(FetchEngine(transport=httpx.MockTransport(handler)))
+    try:
+        assert verify_link("https://example.com/story?utm=1") == ARTICLE_HTML
+        assert verify_link("https://EXAMPLE.com/story?utm=1#comments") == ARTICLE_HTML
+    finally:
+        fetch_engine.set_engine(None)
+    assert len(calls) == 1
+
+
+def test_stale_entry_is_revalidated_with_etag():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, headers={"Content-Type": "text/html", "ETag": '"v1"'}, text=ARTICLE_HTML)
+
+    page_cache = cache.get_page_cache()
+    fetch_engine.set_engine(FetchEngine(transport=httpx.MockTransport(handler)))
+    try:
+        assert verify_link("https://example.com/story") == ARTICLE_HTML
+        page_cache.store.ttl_seconds = 0  # everything is now stale
+        assert verify_link("https://example.com/story") == ARTICLE_HTML
+    finally:
+        fetch_engine.set_engine(None)
+    assert len(calls) == 2
+    assert calls[1].headers["If-None-Match"] == '"v1"'
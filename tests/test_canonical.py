@@ -0,0 +1,66 @@
+import random
+import string
+
+from ai_newsletter_automation import canonical
+from ai_newsletter_automation.canonical import canonical_key, canonicalize_hits, clean_url, title_key
+from ai_newsletter_automation.models import ArticleHit
+
+
+def test_clean_url_unwraps_google_redirect_and_drops_tracking():
+    wrapped = ("https://www.google.com/url?rct=j&sa=t&url=https://www.example.com/news/story"
+               "%3Futm_source%3Dalerts%26id%3D7&ct=ga")
+    assert clean_url(wrapped) == "https://www.example.com/news/story?id=7"
+
+
+def test_clean_url_resolves_amp_variants():
+    assert clean_url("https://www.example.com/news/story/amp/") == "https://www.example.com/news/story"
+    assert clean_url("https://www.example.com/news/story.amp.html") == "https://www.example.com/news/story.html"
+    assert (clean_url("https://www-example-com.cdn.ampproject.org/c/s/www.example.com/news/story")
+            == "https://www.example.com/news/story")
+
+
+def test_clean_url_keeps_a_top_level_amp_page():
+    assert clean_url("https://www.example.com/amp") == "https://www.example.com/amp"
+    assert clean_url("https://www.example.com/amp/") == "https://www.example.com/amp/"
+    assert clean_url("https://www.example.com/amp.html") == "https://www.example.com/amp.html"
+    assert clean_url("https://www.example.com/story/amp") == "https://www.example.com/story"
+    assert clean_url("https://www.example.com/story/amp.html") == "https://www.example.com/story"
+
+
+def test_canonical_key_merges_mobile_and_desktop_hosts():
+    assert canonical_key("https://m.example.com/news/story/") == canonical_key("http://www.example.com/news/story#c")
+
+
+def test_title_key_strips_publisher_suffix():
+    assert title_key("OpenAI ships new model - The Verge") == title_key("OpenAI ships new model!")
+
+
+def test_canonicalize_hits_keeps_first_copy_and_fills_gaps():
+    hits = [
+        ArticleHit(title="Lab releases open weights model", url="https://www.example.com/a?utm_medium=rss",
+                   snippet="short", source="RSS"),
+        ArticleHit(title="Lab releases open-weights model | Example", url="https://m.example.com/a",
+                   snippet="a much longer snippet from the second source", published="2026-02-10"),
+        ArticleHit(title="Lab releases open weights models", url="https://other.com/coverage", snippet=""),
+        ArticleHit(title="Unrelated chip export rules", url="https://news.com/chips", snippet=""),
+    ]
+    result = canonicalize_hits(hits)
+    assert [h.url for h in result] == ["https://www.example.com/a", "https://news.com/chips"]
+    assert result[0].source == "RSS"
+    assert result[0].published == "2026-02-10"
+    assert result[0].snippet.startswith("a much longer")
+
+
+def test_canonicalize_hits_compares_only_lsh_candidates(monkeypatch):
+    rng = random.Random(3)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))) for _ in range(2000)]
+    hits = [ArticleHit(title=" ".join(rng.sample(words, 8)), url=f"https://s{i}.com/a", snippet="") for i in range(300)]
+    hits.append(ArticleHit(title=hits[5].title + "s", url="https://other.com/b", snippet=""))  # near-duplicate
+    compared = []
+    real_similar = canonical._similar
+    monkeypatch.setattr(canonical, "_similar", lambda a, b, t: compared.append((a, b)) or real_similar(a, b, t))
+
+    kept = canonicalize_hits(hits)
+
+    assert len(kept) == 300
+    assert len(compared) < 300  # not every pair (~45,000)
@@ -0,0 +1,41 @@
+import time
+
+from ai_newsletter_automation.fanout import fan_out, latency_report, reset_latency_report
+
+
+def test_fan_out_runs_sources_concurrently():
+    start = time.perf_counter()
+    results = fan_out({f"s{i}": (lambda i=i: time.sleep(0.2) or i) for i in range(5)}, timeout=2)
+    assert time.perf_counter() - start < 0.8
+    assert list(results) == ["s0", "s1", "s2", "s3", "s4"]
+
+
+def test_fan_out_drops_late_and_failing_sources():
+    reset_latency_report()
+
+    def boom():
+        raise RuntimeError("upstream down")
+
+    results = fan_out({
+        "fast": lambda: ["a"],
+        "slow": lambda: time.sleep(1) or ["b"],
+        "broken": boom,
+    }, timeout=0.3)
+    assert results == {"fast": ["a"]}
+    statuses = {r.name: r.status for r in latency_report()}
+    assert statuses == {"fast": "ok", "slow": "timeout", "broken": "error"}
+
+
+def test_nested_feed_fan_out_does_not_queue_behind_its_callers(monkeypatch):
+    from ai_newsletter_automation import fanout
+
+    monkeypatch.setattr(fanout, "_POOL_SIZES", {"sources": 2, "feeds": 4})
+    monkeypatch.setattr(fanout, "_EXECUTORS", {})
+
+    def source(n):
+        # Both "sources" workers are busy here while their feeds run
+        feeds = fan_out({f"{n}-f{i}": (lambda i=i: i) for i in range(2)}, timeout=0.5, pool="feeds")
+        return sorted(feeds.values())
+
+    results = fan_out({"a": lambda: source("a"), "b": lambda: source("b")}, timeout=2)
+    assert results == {"a": [0, 1], "b": [0, 1]}
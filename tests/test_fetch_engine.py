@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import httpx
+
+from ai_newsletter_automation import fetch_engine
+from ai_newsletter_automation.fetch_engine import FetchEngine
+from ai_newsletter_automation.models import ArticleHit
+from ai_newsletter_automation.runner import process_hits, reset_verify_report, verify_report
+from ai_newsletter_automation.verify import VERIFY_TIMEOUT, verify_link
+
+ARTICLE_HTML = "<html><body><p>" + "Useful article text about AI policy. " * 20 + "</p></body></html>"
+
+
+def _html_transport(html: str = ARTICLE_HTML, status: int = 200) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, headers={"Content-Type": "text/html"}, text=html)
+    return httpx.MockTransport(handler)
+
+
+def test_verify_link_uses_engine():
+    fetch_engine.set_engine(FetchEngine(transport=_html_transport()))
+    try:
+        assert verify_link("https://example.com/a") == ARTICLE_HTML
+    finally:
+        fetch_engine.set_engine(None)
+
+
+def test_verify_link_rejects_non_200():
+    fetch_engine.set_engine(FetchEngine(transport=_html_transport(status=404)))
+    try:
+        assert verify_link("https://example.com/missing") is None
+    finally:
+        fetch_engine.set_engine(None)
+
+
+def test_engine_respects_per_host_limit():
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, text=ARTICLE_HTML)
+
+    engine = FetchEngine(max_concurrency=50, max_per_host=3, transport=httpx.MockTransport(handler))
+
+    async def fetch_all():
+        return await asyncio.gather(*(engine.fetch(f"https://same-host.com/{i}") for i in range(20)))
+
+    try:
+        responses = engine.run(fetch_all())
+    finally:
+        engine.close()
+    assert all(r.status_code == 200 for r in responses)
+    assert in_flight["peak"] <= 3
+
+
+def test_process_hits_fills_limit(tmp_path):
+    fetch_engine.set_engine(FetchEngine(transport=_html_transport()))
+    hits = [ArticleHit(title=f"Story {i}", url=f"https://news{i}.com/a", snippet="") for i in range(6)]
+    try:
+        verified = process_hits(hits, limit=2, log_file=tmp_path / "run.jsonl")
+    finally:
+        fetch_engine.set_engine(None)
+    assert len(verified) == 2
+    assert all("Useful article text" in v.content for v in verified)
+
+
+def test_process_hits_cancels_pending_once_limit_is_met(tmp_path):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host.startswith("slow"):
+            await asyncio.sleep(3)
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, text=ARTICLE_HTML)
+
+    fetch_engine.set_engine(FetchEngine(transport=httpx.MockTransport(handler)))
+    hits = [ArticleHit(title=f"Fast {i}", url=f"https://fast{i}.com/a", snippet="") for i in range(2)]
+    hits += [ArticleHit(title=f"Slow {i}", url=f"https://slow{i}.com/a", snippet="") for i in range(4)]
+    reset_verify_report()
+    attempted = set()
+    try:
+        start = time.perf_counter()
+        verified = process_hits(hits, limit=2, log_file=tmp_path / "run.jsonl", attempted=attempted, section="s")
+        elapsed = time.perf_counter() - start
+    finally:
+        fetch_engine.set_engine(None)
+    assert sorted(v.title for v in verified) == ["Fast 0", "Fast 1"]  # completion order
+    assert elapsed < 2  # did not wait for the slow hosts
+    assert attempted == {"https://fast0.com/a", "https://fast1.com/a"}
+    report = verify_report()[-1]
+    assert (report.section, report.verified, report.cancelled) == ("s", 2, 4)
+    assert VERIFY_TIMEOUT - elapsed <= report.saved_seconds <= VERIFY_TIMEOUT
+
+
+def test_fetch_stops_at_byte_budget():
+    big = "<html><body>" + "x" * 50_000 + "</body></html>"
+    engine = FetchEngine(max_bytes=1_000, transport=_html_transport(big))
+    try:
+        resp = engine.run(engine.fetch("https://example.com/big"))
+    finally:
+        engine.close()
+    assert resp.truncated
+    assert len(resp.text) == 1_000
+    assert engine.stats()["truncated"] == 1
+
+
+def test_fetch_rejects_wrong_content_type_before_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=b"%PDF" * 1000)
+
+    engine = FetchEngine(transport=httpx.MockTransport(handler))
+    try:
+        resp = engine.run(engine.fetch("https://example.com/report.pdf", content_types=("text/html",)))
+    finally:
+        engine.close()
+    assert resp.text == ""
+    assert engine.stats()["rejected_early"] == 1
+
+
+def test_fetch_rejects_oversized_content_length():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"Content-Type": "text/html", "Content-Length": "9000000"}, content=b"<html></html>"
+        )
+
+    engine = FetchEngine(transport=httpx.MockTransport(handler))
+    try:
+        resp = engine.run(engine.fetch("https://example.com/huge"))
+    finally:
+        engine.close()
+    assert resp.text == ""
+    assert engine.stats()["rejected_early"] == 1
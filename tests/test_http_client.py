@@ -0,0 +1,21 @@
+from ai_newsletter_automation import http_client
+
+
+def test_get_session_is_shared():
+    http_client.reset_session()
+    assert http_client.get_session() is http_client.get_session()
+
+
+def test_session_pool_sizes_and_headers():
+    http_client.reset_session()
+    session = http_client.get_session()
+    adapter = session.get_adapter("https://example.com/")
+    assert adapter._pool_maxsize == http_client.POOL_MAXSIZE
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.headers["User-Agent"] == http_client.DEFAULT_HEADERS["User-Agent"]
+
+
+def test_pool_stats_empty_before_first_request():
+    http_client.reset_session()
+    http_client.get_session()
+    assert http_client.pool_stats() == {"hosts": 0, "connections": 0, "requests": 0}
@@ -0,0 +1,189 @@
+import json
+import re
+import time
+from types import SimpleNamespace
+
+from ai_newsletter_automation import rerank, summarize
+from ai_newsletter_automation.cache import DiskCache
+from ai_newsletter_automation.llm_cache import LLMCache, get_llm_cache, llm_cache_key
+from ai_newsletter_automation.models import SectionConfig, SummaryItem, VerifiedArticle
+
+
+class _FakeGroq:
+    """Stands in for groq.AsyncGroq: counts completions and returns canned content."""
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+        raw = SimpleNamespace(create=self._create_raw)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(with_raw_response=raw))
+
+    def _respond(self, **kwargs):
+        return self.content
+
+    async def _create_raw(self, **kwargs):
+        self.calls += 1
+        content = self._respond(**kwargs)
+        completion = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+        async def parse():
+            return completion
+
+        return SimpleNamespace(headers={}, parse=parse)
+
+
+def _article(i):
+    return VerifiedArticle(title=f"Story {i}", url=f"https://example.com/{i}", snippet="s", content="c" * 50)
+
+
+def test_cache_key_separates_model_prompts_and_temperature():
+    base = llm_cache_key("m", "sys", "user", 0.1)
+    assert base == llm_cache_key("m", "sys", "user", 0.1)
+    assert len({base, llm_cache_key("m2", "sys", "user", 0.1), llm_cache_key("m", "sys2", "user", 0.1),
+                llm_cache_key("m", "sys", "user2", 0.1), llm_cache_key("m", "sys", "user", 0.2),
+                llm_cache_key("m", "sys", "user", None)}) == 6
+    assert "sys" not in base.split("|")  # prompts are hashed
+
+
+def test_summaries_are_replayed_and_bypass_refreshes(monkeypatch):
+    client = _FakeGroq(json.dumps({"items": [{"Headline": "H", "Summary_Text": "S", "Live_Link": "https://example.com/1",
+                                              "Relevance": 8, "Date": "2026-02-18", "Source": "Ex"}]}))
+    monkeypatch.setattr(summarize, "_configure_groq", lambda: client)
+    monkeypatch.setattr(summarize, "get_settings", lambda: SimpleNamespace())
+
+    first = summarize.summarize_section("Trending", [_article(1)], section_key="trending")
+    again = summarize.summarize_section("Trending", [_article(1)], section_key="trending", relevance_threshold=4)
+    assert client.calls == 1
+    assert [i.Headline for i in first] == [i.Headline for i in again] == ["H"]
+
+    summarize.summarize_section("Trending", [_article(1)], section_key="trending", use_cache=False)
+    assert client.calls == 2
+    # One article-level and one prompt-level lookup per LLM call; the second run hit at article level
+    assert get_llm_cache().stats() == {"hits": 1, "misses": 2, "bypassed": 2}
+
+
+def test_invalid_responses_are_not_cached(monkeypatch):
+    client = _FakeGroq("not json at all")
+    monkeypatch.setattr(summarize, "_configure_groq", lambda: client)
+    items = [SummaryItem(Headline="H", Summary_Text="S", Live_Link="https://example.com/1", Relevance=9)]
+
+    assert summarize.generate_tldr(items) == []
+    assert summarize.generate_tldr(items) == []
+    assert client.calls == 2
+
+
+def test_rerank_scores_are_replayed(monkeypatch):
+    client = _FakeGroq(json.dumps({"items": [{"index": 1, "score": 9}, {"index": 2, "score": 2}]}))
+    monkeypatch.setattr(rerank, "get_async_groq_client", lambda api_key=None: client)
+    monkeypatch.setattr(rerank, "get_settings", lambda: SimpleNamespace(groq_api_key="k"))
+    section = SectionConfig(name="Trending", query="q", limit=1)
+
+    for _ in range(2):
+        kept = rerank.rerank_articles([_article(1), _article(2)], section)
+        assert [a.url for a in kept] == ["https://example.com/1"]
+    assert client.calls == 1
+
+
+def test_entries_expire(tmp_path):
+    cache = LLMCache(DiskCache("llm", 1, 1024 * 1024, directory=tmp_path / "llm"))
+    cache.put("m", "sys", "user", 0.1, "[1]")
+    assert cache.get("m", "sys", "user", 0.1) == "[1]"
+    entry_path = next((tmp_path / "llm").glob("*/*.json"))
+    payload = json.loads(entry_path.read_text())
+    payload["stored_at"] = time.time() - 10
+    entry_path.write_text(json.dumps(payload))
+    assert cache.get("m", "sys", "user", 0.1) is None
+
+
+class _EchoGroq(_FakeGroq):
+    """Summarizes every URL in the prompt, skipping those containing "skip"; records the URLs sent."""
+
+    def __init__(self):
+        super().__init__("")
+        self.sent = []
+
+    def _respond(self, **kwargs):
+        urls = re.findall(r"^URL: (\S+)", kwargs["messages"][1]["content"], re.MULTILINE)
+        self.sent.append(urls)
+        self.content = json.dumps({"items": [
+            {"Headline": f"About {u}", "Summary_Text": "S", "Live_Link": u, "Relevance": 8, "Source": "Ex"}
+            for u in urls if "skip" not in u
+        ]})
+        return super()._respond(**kwargs)
+
+
+def test_only_new_articles_are_sent_to_the_llm(monkeypatch):
+    client = _EchoGroq()
+    monkeypatch.setattr(summarize, "_configure_groq", lambda: client)
+    monkeypatch.setattr(summarize, "get_settings", lambda: SimpleNamespace())
+    skipped = VerifiedArticle(title="Skip me", url="https://example.com/skip", snippet="s", content="c")
+
+    summarize.summarize_section("Trending", [_article(1), _article(2), skipped], section_key="trending")
+    items = summarize.summarize_section("Trending", [_article(1), _article(2), skipped, _article(3)],
+                                        section_key="trending")
+
+    assert client.sent == [
+        ["https://example.com/1", "https://example.com/2", "https://example.com/skip"],
+        ["https://example.com/3"],  # the skip verdict is remembered too
+    ]
+    assert [i.Live_Link for i in items] == ["https://example.com/1", "https://example.com/2", "https://example.com/3"]
+
+    # Changed content or another language is a different summary
+    edited = VerifiedArticle(title="Story 1", url="https://example.com/1", snippet="s", content="updated")
+    summarize.summarize_section("Trending", [edited], section_key="trending")
+    summarize.summarize_section("Trending", [_article(2)], section_key="trending", lang="fr")
+    assert client.sent[2:] == [["https://example.com/1"], ["https://example.com/2"]]
+
+
+class _RewritingGroq(_EchoGroq):
+    """Like _EchoGroq, but returns article 2 under a rewritten link (and its original title when asked)."""
+
+    def __init__(self, keep_title):
+        super().__init__()
+        self.keep_title = keep_title
+
+    def _respond(self, **kwargs):
+        data = json.loads(super()._respond(**kwargs))
+        for item in data["items"]:
+            if item["Live_Link"] == "https://example.com/2":
+                item["Live_Link"] = "https://example.com/news/2"
+                if self.keep_title:
+                    item["Headline"] = "Story 2"
+        return json.dumps(data)
+
+
+def test_unmatched_summaries_do_not_cache_skip_verdicts(monkeypatch):
+    client = _RewritingGroq(keep_title=False)
+    monkeypatch.setattr(summarize, "_configure_groq", lambda: client)
+    monkeypatch.setattr(summarize, "get_settings", lambda: SimpleNamespace())
+    skipped = VerifiedArticle(title="Skip me", url="https://example.com/skip", snippet="s", content="c")
+
+    summarize.summarize_section("Trending", [_article(1), _article(2), skipped], section_key="trending")
+    summarize.summarize_section("Trending", [_article(1), _article(2), skipped], section_key="trending")
+
+    # Article 2's summary came back under another link, so neither it nor the skip is trusted
+    assert client.sent[1] == ["https://example.com/2", "https://example.com/skip"]
+
+
+def test_rewritten_link_is_matched_by_title(monkeypatch):
+    client = _RewritingGroq(keep_title=True)
+    monkeypatch.setattr(summarize, "_configure_groq", lambda: client)
+    monkeypatch.setattr(summarize, "get_settings", lambda: SimpleNamespace())
+
+    summarize.summarize_section("Trending", [_article(1), _article(2)], section_key="trending")
+    items = summarize.summarize_section("Trending", [_article(1), _article(2)], section_key="trending")
+
+    assert len(client.sent) == 1
+    assert [i.Headline for i in items] == ["About https://example.com/1", "Story 2"]
+
+
+def test_summaries_carry_the_source_title(monkeypatch):
+    client = _EchoGroq()
+    monkeypatch.setattr(summarize, "_configure_groq", lambda: client)
+    monkeypatch.setattr(summarize, "get_settings", lambda: SimpleNamespace())
+
+    fresh = summarize.summarize_section("Trending", [_article(1)], section_key="trending")
+    cached = summarize.summarize_section("Trending", [_article(1)], section_key="trending")
+
+    assert fresh[0].Headline == "About https://example.com/1"
+    assert fresh[0].Source_Title == cached[0].Source_Title == "Story 1"
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ai_newsletter_automation import llm_client
+
+_COMPLETION = {
+    "id": "x", "object": "chat.completion", "created": 0, "model": "m",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "{\"items\": []}"}}],
+}
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(_COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def chat_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    llm_client.reset_groq_clients()
+    llm_client.reset_connect_stats()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    llm_client.reset_groq_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def _complete(base_url):
+    client = llm_client.get_groq_client("k", base_url=base_url)
+    client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}],
+                                   timeout=llm_client.llm_timeout(5))
+    return client
+
+
+def test_client_is_shared_and_connection_reused(chat_server):
+    clients = {id(_complete(chat_server)) for _ in range(3)}
+    assert len(clients) == 1
+    stats = llm_client.connect_stats()
+    assert stats["requests"] == 3
+    assert stats["connections"] == 1
+    assert stats["connect_seconds"] > 0
+
+
+def test_reuse_disabled_connects_per_call(chat_server, monkeypatch):
+    monkeypatch.setattr(llm_client, "CLIENT_REUSE_ENABLED", False)
+    for _ in range(3):
+        _complete(chat_server)
+    assert llm_client.connect_stats()["connections"] == 3
+
+
+def test_client_is_shared_across_threads(chat_server):
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(id(_complete(chat_server)))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(seen)) == 1
+    assert llm_client.connect_stats()["requests"] == 4
+
+
+def test_async_client_is_shared_per_loop_and_traced(chat_server):
+    async def run():
+        clients = {id(llm_client.get_async_groq_client("k", base_url=chat_server)) for _ in range(3)}
+        client = llm_client.get_async_groq_client("k", base_url=chat_server)
+        await asyncio.gather(*(
+            client.chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+            for _ in range(3)
+        ))
+        return clients
+
+    assert len(asyncio.run(run())) == 1
+    stats = llm_client.connect_stats()
+    assert stats["requests"] == 3
+    assert 1 <= stats["connections"] <= 3
+    assert stats["connect_seconds"] > 0
@@ -0,0 +1,115 @@
+import httpx
+import pytest
+
+from ai_newsletter_automation import fetch_engine
+from ai_newsletter_automation.cache import DiskCache
+from ai_newsletter_automation.fetch_engine import FetchEngine
+from ai_newsletter_automation.negative_cache import BloomFilter, NegativeCache, get_negative_cache
+from ai_newsletter_automation.verify import verify_link
+
+PAYWALL_HTML = "<html><body><p>" + "Subscribe to read the rest of this story. " * 10 + "</p></body></html>"
+
+
+def _counting_transport(status=200, html=PAYWALL_HTML):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(status, headers={"Content-Type": "text/html"}, text=html)
+
+    return httpx.MockTransport(handler), requests
+
+
+def test_bloom_filter_has_no_false_negatives_and_round_trips():
+    bloom = BloomFilter(capacity=1000)
+    keys = [f"https://example.com/{i}" for i in range(500)]
+    for key in keys:
+        bloom.add(key)
+    restored = BloomFilter.from_bytes(bloom.to_bytes(), capacity=1000)
+    assert all(key in restored for key in keys)
+    false_positives = sum(f"https://other.com/{i}" in restored for i in range(2000))
+    assert false_positives < 60  # ~1% target error rate
+    assert BloomFilter.from_bytes(bloom.to_bytes(), capacity=2000) is None
+
+
+def test_rejected_link_is_not_refetched():
+    transport, requests = _counting_transport(status=404)
+    fetch_engine.set_engine(FetchEngine(transport=transport))
+    try:
+        assert verify_link("https://example.com/gone") is None
+        assert verify_link("https://example.com/gone") is None
+    finally:
+        fetch_engine.set_engine(None)
+    assert len(requests) == 1
+    assert get_negative_cache().lookup("https://example.com/gone") == "http_404"
+
+
+def test_transient_failures_are_not_remembered():
+    transport, requests = _counting_transport(status=503)
+    fetch_engine.set_engine(FetchEngine(transport=transport))
+    try:
+        verify_link("https://example.com/flaky")
+        verify_link("https://example.com/flaky")
+    finally:
+        fetch_engine.set_engine(None)
+    assert len(requests) == 2
+
+
+def test_always_paywalled_domain_is_skipped_before_any_request():
+    transport, requests = _counting_transport()
+    fetch_engine.set_engine(FetchEngine(transport=transport))
+    try:
+        for i in range(5):
+            verify_link(f"https://paywalled.example.com/story-{i}")
+        assert verify_link("https://www.paywalled.example.com/new-story") is None
+    finally:
+        fetch_engine.set_engine(None)
+    assert len(requests) == 5
+
+
+def test_negative_cache_persists_across_instances(tmp_path):
+    def open_cache():
+        return NegativeCache(DiskCache("negative", 86400 * 30, 1 << 20, directory=tmp_path / "neg"), capacity=1000)
+
+    first = open_cache()
+    first.record("https://example.com/report.pdf", "not_html")
+    first.flush()
+    assert open_cache().lookup("https://example.com/report.pdf") == "not_html"
+
+
+def test_filter_saved_before_later_rejections_is_rebuilt(tmp_path):
+    def open_cache():
+        return NegativeCache(DiskCache("negative", 86400 * 30, 1 << 20, directory=tmp_path / "neg"), capacity=1000)
+
+    first = open_cache()
+    first.record("https://example.com/old.pdf", "not_html")
+    first.flush()
+    first.record("https://example.com/gone", "http_404")  # the run dies before flushing
+
+    reopened = open_cache()
+    assert reopened.lookup("https://example.com/gone") == "http_404"
+    assert reopened.lookup("https://example.com/old.pdf") == "not_html"
+
+
+def test_flushed_filter_loads_without_scanning_the_store(tmp_path, monkeypatch):
+    store = DiskCache("negative", 86400 * 30, 1 << 20, directory=tmp_path / "neg")
+    first = NegativeCache(store, capacity=1000)
+    first.record("https://example.com/gone", "http_404")
+    first.flush()
+
+    monkeypatch.setattr(store, "_scan", lambda: pytest.fail("store scanned on load"))
+    assert NegativeCache(store, capacity=1000).lookup("https://example.com/gone") == "http_404"
+
+
+def test_saturated_filter_grows_instead_of_rebuilding_every_insert(tmp_path, monkeypatch):
+    cache = NegativeCache(DiskCache("negative", 86400 * 30, 1 << 20, directory=tmp_path / "neg"), capacity=4)
+    rebuilds = []
+    real_rebuild = cache._rebuild_bloom
+    monkeypatch.setattr(cache, "_rebuild_bloom", lambda: rebuilds.append(cache.capacity) or real_rebuild())
+    for i in range(20):
+        cache.record(f"https://example.com/{i}.pdf", "not_html")
+    assert rebuilds == [8, 16, 32]
+    assert all(cache.lookup(f"https://example.com/{i}.pdf") == "not_html" for i in range(20))
+    cache.flush()
+    reopened = NegativeCache(cache.store, capacity=4)  # the grown filter is kept on reload
+    assert reopened.capacity == 32
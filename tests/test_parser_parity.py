@@ -0,0 +1,39 @@
+"""Every installed parser backend must produce the same analysis as html.parser."""
+
+import pytest
+
+from ai_newsletter_automation.analyze import analyze_html, available_parsers
+from tests.test_scrape_metadata import METADATA_FIXTURES
+
+ARTICLE_HTML = """
+<html>
+    <head>
+        <meta name="date" content="2026-02-01" />
+        <script>window.analytics = {};</script>
+        <style>body { color: red; }</style>
+    </head>
+    <body>
+        <header>Menu</header>
+        <article><h1>Agencies publish AI guidance</h1>
+        <p>""" + "The new guidance covers procurement, audits and disclosure. " * 8 + """</p></article>
+        <aside>Related stories</aside>
+        <footer>Copyright</footer>
+    </body>
+</html>
+"""
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+@pytest.mark.parametrize("html,expected", METADATA_FIXTURES)
+def test_backend_date_parity(parser, html, expected):
+    assert analyze_html(html, parser=parser).published_date == expected
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+def test_backend_analysis_parity(parser):
+    reference = analyze_html(ARTICLE_HTML, parser="html.parser")
+    page = analyze_html(ARTICLE_HTML, parser=parser)
+    assert page.published_date == reference.published_date
+    assert page.rejection_reason == reference.rejection_reason
+    assert page.text.split() == reference.text.split()
+    assert page.body_text_length == pytest.approx(reference.body_text_length, rel=0.02)
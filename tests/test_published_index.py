@@ -0,0 +1,58 @@
+import json
+import time
+
+from ai_newsletter_automation.models import ArticleHit, SummaryItem
+from ai_newsletter_automation.published_index import PublishedIndex
+
+
+def _item(url, headline="OpenAI ships a new reasoning model"):
+    return SummaryItem(Headline=headline, Summary_Text="", Live_Link=url)
+
+
+def test_index_matches_url_variants_and_titles_from_earlier_issues(tmp_path):
+    path = tmp_path / "published_index.json"
+    index = PublishedIndex(issue="2026-02-09", path=path)
+    index.record([_item("https://www.example.com/story?utm_source=ai_this_week&utm_medium=email")])
+    index.save()
+
+    later = PublishedIndex.load(issue="2026-02-16", path=path)
+    assert later.contains("https://m.example.com/story/")
+    assert later.contains("https://other.com/copy", "OpenAI ships a new reasoning model - The Verge")
+    assert not later.contains("https://example.com/another-story", "EU publishes AI code")
+
+    hits = [ArticleHit(title="Repeat", url="https://example.com/story", snippet=""),
+            ArticleHit(title="Fresh", url="https://example.com/fresh", snippet="")]
+    assert [h.title for h in later.filter_new(hits)] == ["Fresh"]
+
+
+def test_regenerating_an_issue_does_not_exclude_its_own_stories(tmp_path):
+    path = tmp_path / "published_index.json"
+    index = PublishedIndex(issue="2026-02-16", path=path)
+    index.record([_item("https://example.com/story")])
+    index.save()
+
+    same_issue = PublishedIndex.load(issue="2026-02-16", path=path)
+    assert not same_issue.contains("https://example.com/story")
+    same_issue.record([_item("https://example.com/other", "Other story")])
+    assert [e["url"] for e in same_issue.entries] == ["https://example.com/other"]
+
+
+def test_index_drops_entries_past_retention(tmp_path):
+    path = tmp_path / "published_index.json"
+    old = {"issue": "2025-01-01", "url": "https://example.com/old", "key": "example.com/old",
+           "title_fp": "", "recorded_at": time.time() - 400 * 86400}
+    path.write_text(json.dumps({"entries": [old]}), encoding="utf-8")
+    assert not PublishedIndex.load(issue="2026-02-16", path=path).contains("https://example.com/old")
+
+
+def test_titles_are_fingerprinted_from_the_source_title(tmp_path):
+    path = tmp_path / "published_index.json"
+    index = PublishedIndex(issue="2026-02-09", path=path)
+    item = SummaryItem(Headline="Faster reasoning lands for enterprise buyers", Summary_Text="",
+                       Live_Link="https://example.com/story", Source_Title="OpenAI ships a new reasoning model")
+    index.record([item])
+    index.save()
+
+    later = PublishedIndex.load(issue="2026-02-16", path=path)
+    assert later.contains("https://other.com/copy", "OpenAI ships a new reasoning model - The Verge")
+    assert not later.contains("https://other.com/x", "Faster reasoning lands for enterprise buyers")
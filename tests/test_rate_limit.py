@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ai_newsletter_automation import llm_client, rate_limit
+from ai_newsletter_automation.rate_limit import (
+    RateLimiter, _parse_duration, achat_completion, chat_completion, estimate_tokens,
+)
+
+_COMPLETION = {
+    "id": "x", "object": "chat.completion", "created": 0, "model": "m",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+}
+
+
+class _LimitedHandler(BaseHTTPRequestHandler):
+    """Answers the first request with a 429 + Retry-After, later ones with rate-limit headers."""
+
+    protocol_version = "HTTP/1.1"
+    calls = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        type(self).calls += 1
+        if type(self).calls == 1:
+            status, body = 429, {"error": {"message": "Rate limit reached", "type": "tokens"}}
+            headers = {"retry-after": "0.3"}
+        else:
+            status, body = 200, _COMPLETION
+            headers = {"x-ratelimit-limit-tokens": "6000", "x-ratelimit-remaining-tokens": "5000",
+                       "x-ratelimit-remaining-requests": "999", "x-ratelimit-reset-tokens": "10s"}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def limited_server():
+    _LimitedHandler.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LimitedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    llm_client.reset_groq_clients()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    llm_client.reset_groq_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_duration_formats():
+    assert _parse_duration("7.66s") == pytest.approx(7.66)
+    assert _parse_duration("2m59.5s") == pytest.approx(179.5)
+    assert _parse_duration("1h2m") == pytest.approx(3720)
+    assert _parse_duration("120ms") == pytest.approx(0.12)
+    assert _parse_duration("12") == 12
+    assert _parse_duration("") is None
+    assert _parse_duration("soon") is None
+
+
+def test_estimate_counts_prompt_and_capped_completion():
+    messages = [{"role": "system", "content": "x" * 400}, {"role": "user", "content": "y" * 400}]
+    assert estimate_tokens(messages, max_tokens=100) == 300
+    assert estimate_tokens(messages, max_tokens=4096) == 200 + 1024
+
+
+def test_acquire_waits_for_request_refill():
+    limiter = RateLimiter(rpm=600, tpm=100000)  # one request per 0.1s
+    limiter.requests.level = 0
+    assert limiter.acquire(10) >= 0.08
+    assert limiter.stats()["calls"] == 1
+
+
+def test_settle_returns_overestimated_tokens():
+    limiter = RateLimiter(rpm=600, tpm=1000)
+    limiter.acquire(800)
+    limiter.settle(800, 100)
+    assert limiter.tokens.level == pytest.approx(900, abs=5)
+
+
+def test_headers_shrink_buckets_and_block_on_exhaustion():
+    limiter = RateLimiter(rpm=600, tpm=1000)
+    limiter.observe({"x-ratelimit-limit-tokens": "6000", "x-ratelimit-remaining-tokens": "0",
+                     "x-ratelimit-reset-tokens": "150ms", "x-ratelimit-remaining-requests": "42"})
+    assert limiter.tokens.per_minute == 6000
+    assert limiter.requests.level <= 42
+    start = time.monotonic()
+    limiter.acquire(1)
+    assert time.monotonic() - start >= 0.12
+
+
+def test_429_waits_for_retry_after_then_succeeds(limited_server):
+    client = llm_client.get_groq_client("k", base_url=limited_server)
+    start = time.monotonic()
+    completion = chat_completion(client, "m", [{"role": "user", "content": "hi"}], max_tokens=50)
+
+    assert completion.choices[0].message.content == "ok"
+    assert _LimitedHandler.calls == 2  # the SDK's own retries are off; the limiter retried once
+    assert time.monotonic() - start >= 0.3
+    limiter = rate_limit.get_rate_limiter("m")
+    assert limiter.stats()["rate_limited"] == 1
+    assert limiter.tokens.per_minute == 6000
+    assert limiter.tokens.level <= 5000
+
+
+def test_async_completion_shares_the_limiter(limited_server):
+    async def run():
+        client = llm_client.get_async_groq_client("k", base_url=limited_server)
+        return await achat_completion(client, "m", [{"role": "user", "content": "hi"}], max_tokens=50)
+
+    start = time.monotonic()
+    completion = asyncio.run(run())
+
+    assert completion.choices[0].message.content == "ok"
+    assert _LimitedHandler.calls == 2
+    assert time.monotonic() - start >= 0.3
+    assert rate_limit.rate_limit_stats()["rate_limited"] == 1
+
+
+def test_async_acquire_does_not_block_the_loop():
+    limiter = RateLimiter(rpm=600, tpm=100000)
+    limiter.requests.level = 0
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(limiter.aacquire(10), ticker())
+
+    asyncio.run(run())
+    assert len(ticks) == 5
+    assert limiter.stats()["waited_seconds"] >= 0.08
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from ai_newsletter_automation import runner
+from ai_newsletter_automation.models import ArticleHit, SummaryItem
+
+
+def _hit(i, age_days):
+    published = (datetime.utcnow() - timedelta(days=age_days)).strftime("%Y-%m-%dT%H:%M:%S")
+    return ArticleHit(title=f"Story {i}", url=f"https://news{i}.com/a", snippet="s" * 100, published=published)
+
+
+def _patch_pipeline(monkeypatch, tmp_path, hits, populate_on_attempt):
+    calls = {"collect": [], "verify": [], "rerank": [], "summarize": 0}
+
+    def collect(days):
+        calls["collect"].append(days)
+        return list(hits)
+
+    async def averify_page(url):
+        calls["verify"].append(url)
+        return None  # falls back to the hit's snippet
+
+    async def rerank(articles, cfg, score_cache=None, **kwargs):
+        calls["rerank"].append(score_cache)
+        return articles
+
+    async def summarize(name, articles, **kwargs):
+        calls["summarize"] += 1
+        if calls["summarize"] < populate_on_attempt:
+            return []
+        return [SummaryItem(Headline=a.title, Summary_Text="", Live_Link=a.url, Date=None, Relevance=None)
+                for a in articles]
+
+    monkeypatch.setattr(runner, "get_settings", lambda: SimpleNamespace(project_root=tmp_path))
+    monkeypatch.setattr(runner, "collect_trending", collect)
+    monkeypatch.setattr(runner, "averify_page", averify_page)
+    monkeypatch.setattr(runner, "arerank_articles", rerank)
+    monkeypatch.setattr(runner, "asummarize_section", summarize)
+    return calls
+
+
+def test_incremental_retries_verify_each_url_once(monkeypatch, tmp_path):
+    hits = [_hit(i, age_days=1 + i % 3 * 5) for i in range(12)]  # spread over 1, 6 and 11 days
+    calls = _patch_pipeline(monkeypatch, tmp_path, hits, populate_on_attempt=3)
+
+    items = runner.process_section("trending", days=5, max_per_stream=2)
+
+    assert items
+    assert calls["collect"] == [5, 10, 15]  # each attempt collects its own window
+    assert len(calls["verify"]) == len(set(calls["verify"]))
+    # The same score cache is threaded through every attempt
+    assert len({id(c) for c in calls["rerank"]}) == 1
+
+
+def test_capped_source_gives_first_attempt_the_baseline_candidates(monkeypatch, tmp_path):
+    # A source ranked by popularity, not date, capped at 4 items: a wider window
+    # fills the cap with older stories
+    ranked = [_hit(i, age_days=12 - i) for i in range(12)]
+
+    def verified_on_first_attempt(incremental):
+        monkeypatch.setattr(runner, "INCREMENTAL_RETRIES", incremental)
+        calls = _patch_pipeline(monkeypatch, tmp_path, [], populate_on_attempt=1)
+        cutoff = datetime.utcnow() - timedelta(days=5)
+        monkeypatch.setattr(runner, "collect_trending", lambda days: [
+            h for h in ranked if datetime.fromisoformat(h.published) >= datetime.utcnow() - timedelta(days=days)
+        ][:4])
+        assert runner.process_section("trending", days=5, max_per_stream=2)
+        assert all(datetime.fromisoformat(h.published) >= cutoff for h in ranked if h.url in calls["verify"])
+        return sorted(calls["verify"])
+
+    assert verified_on_first_attempt(True) == verified_on_first_attempt(False)
+
+
+def test_legacy_retries_recollect_per_attempt(monkeypatch, tmp_path):
+    monkeypatch.setattr(runner, "INCREMENTAL_RETRIES", False)
+    calls = _patch_pipeline(monkeypatch, tmp_path, [_hit(i, age_days=1) for i in range(6)], populate_on_attempt=3)
+
+    runner.process_section("trending", days=5, max_per_stream=2)
+
+    assert calls["collect"] == [5, 10, 15]
+
+
+def test_collection_runs_off_the_engine_default_executor(monkeypatch, tmp_path):
+    _patch_pipeline(monkeypatch, tmp_path, [_hit(i, age_days=1) for i in range(4)], populate_on_attempt=1)
+    threads = []
+    monkeypatch.setattr(runner, "collect_trending",
+                        lambda days: threads.append(threading.current_thread().name) or [_hit(1, age_days=1)])
+
+    runner.process_section("trending", days=5, max_per_stream=2)
+
+    assert threads and all(name.startswith("collect") for name in threads)
+
+
+def test_sections_summarize_concurrently(monkeypatch, tmp_path):
+    _patch_pipeline(monkeypatch, tmp_path, [_hit(i, age_days=1) for i in range(4)], populate_on_attempt=1)
+    monkeypatch.setattr(runner, "collect_events", lambda days: [_hit(10 + i, age_days=1) for i in range(4)])
+    in_flight = {"now": 0, "max": 0}
+
+    async def summarize(name, articles, **kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.1)
+        in_flight["now"] -= 1
+        return [SummaryItem(Headline=a.title, Summary_Text="", Live_Link=a.url, Date=None, Relevance=None)
+                for a in articles]
+
+    monkeypatch.setattr(runner, "asummarize_section", summarize)
+    results, seconds = runner.get_engine().run(runner.agenerate_sections(["trending", "events"], days=5, workers=1))
+
+    assert all(results[key] for key in ("trending", "events"))
+    assert in_flight["max"] == 2  # both sections' LLM stage overlapped despite one collection worker
+    assert set(seconds) == {"trending", "events"}
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_newsletter_automation.models import ArticleHit, SectionConfig
+from ai_newsletter_automation.scoring import DEFAULT_WEIGHTS, rank_hits, score_hits
+from ai_newsletter_automation.source_quality import get_source_tracker
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _hit(title, days_old=None, source=None, url=None, snippet=""):
+    published = (NOW - timedelta(days=days_old)).strftime("%Y-%m-%dT%H:%M:%S") if days_old is not None else None
+    return ArticleHit(title=title, url=url or f"https://{title.lower().replace(' ', '')}.com/a",
+                      snippet=snippet, source=source, published=published)
+
+
+def test_features_are_computed_and_exposed():
+    cfg = SectionConfig(name="T", query="q", limit=5, boost_keywords=["Treasury", "federal"])
+    get_source_tracker().record_many([("https://quality.com/x", 10)])
+    scored = score_hits([_hit("Treasury update", 3.5, source="RSS", url="https://quality.com/b")], cfg, days=7, now=NOW)
+
+    features = scored[0].features
+    assert features == pytest.approx({"freshness": 0.5, "priority": 0.8, "quality": 1.0, "keywords": 0.5})
+    assert scored[0].score == pytest.approx(sum(DEFAULT_WEIGHTS[k] * v for k, v in features.items()))
+
+
+def test_reject_keywords_are_dropped_in_the_same_pass():
+    cfg = SectionConfig(name="T", query="q", limit=5, reject_keywords=["crypto"])
+    hits = [_hit("AI policy"), _hit("Crypto and AI"), _hit("Other", snippet="blockchain CRYPTO")]
+    assert [h.title for h in rank_hits(hits, cfg, days=7, now=NOW)] == ["AI policy"]
+
+
+def test_fresher_and_curated_hits_rank_first():
+    hits = [
+        _hit("Old web", 6, source="Tavily"),
+        _hit("Fresh web", 0, source="Tavily"),
+        _hit("Fresh alert", 0, source="Google Alert"),
+        _hit("Undated alert", None, source="Google Alert"),
+    ]
+    ranked = rank_hits(hits, days=7, now=NOW)
+    assert [h.title for h in ranked] == ["Fresh alert", "Undated alert", "Fresh web", "Old web"]
+
+
+def test_section_weights_override_defaults():
+    hits = [_hit("Fresh web", 0, source="Tavily"), _hit("Old alert", 6, source="Google Alert")]
+    priority_heavy = SectionConfig(name="T", query="q", limit=5, score_weights={"priority": 10.0})
+    assert rank_hits(hits, days=7, now=NOW)[0].title == "Fresh web"
+    assert rank_hits(hits, priority_heavy, days=7, now=NOW)[0].title == "Old alert"
+
+    with pytest.raises(ValueError):
+        score_hits(hits, SectionConfig(name="T", query="q", limit=5, score_weights={"recency": 1.0}))
+
+
+def test_equal_scores_keep_collection_order():
+    hits = [_hit(f"Story {i}") for i in range(5)]
+    assert rank_hits(hits) == hits
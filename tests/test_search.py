@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from ai_newsletter_automation.models import ArticleHit
 from ai_newsletter_automation.search import (
     _filter_by_date,
@@ -7,6 +9,7 @@ from ai_newsletter_automation.search import (
     _boost_by_keywords,
     _sort_by_source_priority,
     _filter_blocked,
+    _parse_date_str,
     DEFAULT_STREAMS,
     _TRUSTED_SOURCES,
 )
@@ -166,3 +169,135 @@ def test_section_configs_days_override():
     assert DEFAULT_STREAMS["deep_dive"].days == 14
     assert DEFAULT_STREAMS["ai_progress"].days == 14
     assert DEFAULT_STREAMS["research_plain"].days == 14
+
+
+# ── Feed cache tests ──
+
+RSS_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Lab blog</title>
+<item><title>New model release</title><link>https://lab.example.com/post</link>
+<description>Details</description><pubDate>Tue, 10 Feb 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None, url="https://lab.example.com/feed"):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+def test_parse_feed_conditional_get_reuses_entries(monkeypatch):
+    from ai_newsletter_automation import search
+    from ai_newsletter_automation.cache import get_feed_cache
+
+    session = _FakeSession([
+        _FakeResponse(200, RSS_BODY, {"ETag": '"abc"', "Content-Type": "application/rss+xml"}),
+        _FakeResponse(304, headers={"ETag": '"abc"'}),
+    ])
+    monkeypatch.setattr(search, "get_session", lambda: session)
+    monkeypatch.setattr(search.feedparser, "parse", _counting(search.feedparser.parse))
+
+    first = search._parse_feed("https://lab.example.com/feed")
+    assert first[0]["title"] == "New model release"
+    assert first[0]["published_parsed"][:3] == [2026, 2, 10]
+
+    get_feed_cache().ttl_seconds = 0  # force revalidation
+    second = search._parse_feed("https://lab.example.com/feed")
+    assert second == first
+    assert session.requests[1]["If-None-Match"] == '"abc"'
+    assert search.feedparser.parse.calls == 1
+
+
+def test_parse_feed_fresh_entries_skip_network(monkeypatch):
+    from ai_newsletter_automation import search
+
+    session = _FakeSession([_FakeResponse(200, RSS_BODY, {"Content-Type": "application/rss+xml"})])
+    monkeypatch.setattr(search, "get_session", lambda: session)
+    search._parse_feed("https://lab.example.com/feed")
+    search._parse_feed("https://lab.example.com/feed")
+    assert len(session.requests) == 1
+
+
+def _counting(fn):
+    def wrapper(*args, **kwargs):
+        wrapper.calls += 1
+        return fn(*args, **kwargs)
+    wrapper.calls = 0
+    return wrapper
+
+
+class _FakeHNSession:
+    def __init__(self, n_items, ai_every=1):
+        now = int(datetime.utcnow().timestamp())
+        self.items = {
+            i: {"id": i, "type": "story", "time": now - 2 * 86400, "kids": [1, 2, 3],
+                "title": f"New AI model {i}" if i % ai_every == 0 else f"Gardening tips {i}",
+                "url": f"https://news.example.com/{i}"}
+            for i in range(1, n_items + 1)
+        }
+        self.item_requests = []
+
+    def get(self, url, timeout=None):
+        if url.endswith("/topstories.json") or url.endswith("/beststories.json"):
+            return _JSONResponse(list(self.items))
+        story_id = int(url.rsplit("/", 1)[1].split(".")[0])
+        self.item_requests.append(story_id)
+        return _JSONResponse(self.items[story_id])
+
+
+class _JSONResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def test_hn_trending_stops_at_limit_and_keeps_rank_order(monkeypatch):
+    from ai_newsletter_automation import search
+
+    session = _FakeHNSession(20)
+    monkeypatch.setattr(search, "get_session", lambda: session)
+    monkeypatch.setattr(search, "HN_FETCH_WORKERS", 4)
+
+    hits = search.fetch_hn_trending(limit=5, days=7)
+    assert [h.url for h in hits] == [f"https://news.example.com/{i}" for i in range(1, 6)]
+    # Only the two batches needed to find 5 matches were requested, never ids 9-10.
+    # pool.map submits the whole second batch; returning early closes its result
+    # iterator, which cancels the futures no worker has picked up yet, so 6-8 may
+    # or may not be fetched depending on thread timing
+    assert set(range(1, 6)) <= set(session.item_requests) <= set(range(1, 9))
+
+
+def test_hn_trending_serves_settled_items_from_cache(monkeypatch):
+    from ai_newsletter_automation import search
+
+    session = _FakeHNSession(4)
+    monkeypatch.setattr(search, "get_session", lambda: session)
+    first = search.fetch_hn_trending(limit=5, days=7)
+    assert len(session.item_requests) == 4
+    second = search.fetch_hn_trending(limit=5, days=7)
+    assert second == first
+    assert len(session.item_requests) == 4
+
+
+def test_parse_date_str_iso_and_rfc822():
+    assert _parse_date_str("2026-02-18") == datetime(2026, 2, 18)
+    assert _parse_date_str("2026-02-18T10:00:00Z") == datetime(2026, 2, 18, 10)
+    assert _parse_date_str("2026-02-18T10:00:00+05:00") == datetime(2026, 2, 18, 5)  # normalized to naive UTC
+    assert _parse_date_str("2026-02-18T10:00:00.123456+05:00") == datetime(2026, 2, 18, 5)
+    assert _parse_date_str("2026-02-18T10:00:00.5Z") == datetime(2026, 2, 18, 10)
+    assert _parse_date_str("Mon, 16 Feb 2026 10:00:00 +0000") == datetime(2026, 2, 16, 10)
+    assert _parse_date_str("not a date") is None